@@ -8,15 +8,33 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, CoreState, EVENT_HOMEASSISTANT_STARTED
 from homeassistant.components import websocket_api
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 import voluptuous as vol
 
 from .const import (
     DOMAIN,
+    ARCHIVE_FILENAME,
+    ARCHIVE_MAX_PAGE_SIZE,
+    ARCHIVE_PAGE_SIZE,
+    ARCHIVE_TRACE_SECONDS,
+    CARRYOVER_MAX_SESSIONS,
+    CARRYOVER_STORAGE_KEY,
+    DATA_ARCHIVE,
+    DATA_CARRYOVER,
+    DATA_PRIORS,
     INTEGRATION_VERSION,
-    PLATFORMS,
+    MAX_THICKNESS_CM,
+    PRIOR_MAX_SESSIONS,
+    PRIOR_MIN_SESSIONS,
+    PRIORS_STORAGE_KEY,
 )
+from .archive import SessionArchive
+from .carryover import CarryoverCalibration
 from .coordinator import AssistantCookerCoordinator
 from .frontend import JSModuleRegistration
+from .priors import HeatingPriors
 
 if TYPE_CHECKING:
     from homeassistant.helpers.typing import ConfigType
@@ -69,23 +87,178 @@ async def websocket_get_food_data(
     )
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/estimator_scores",
+    }
+)
+@websocket_api.async_response
+async def websocket_get_estimator_scores(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle estimator shadow-evaluation scores request from frontend."""
+    connection.send_result(
+        msg["id"],
+        {
+            entry_id: coordinator.estimator_scores()
+            for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/sessions",
+        vol.Optional("entry_id"): str,
+        vol.Optional("food_category"): str,
+        vol.Optional("food_type"): str,
+        vol.Optional("since"): cv.datetime,
+        vol.Optional("until"): cv.datetime,
+        vol.Optional("limit", default=ARCHIVE_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=ARCHIVE_MAX_PAGE_SIZE)
+        ),
+        vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+@websocket_api.async_response
+async def websocket_list_sessions(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle archived session list request from frontend (filtered, paged)."""
+    archive: SessionArchive = hass.data[DATA_ARCHIVE]
+    result = await archive.async_query(
+        hass,
+        entry_id=msg.get("entry_id"),
+        food_category=msg.get("food_category"),
+        food_type=msg.get("food_type"),
+        since=dt_util.as_utc(msg["since"]) if "since" in msg else None,
+        until=dt_util.as_utc(msg["until"]) if "until" in msg else None,
+        limit=msg["limit"],
+        offset=msg["offset"],
+    )
+    connection.send_result(msg["id"], result)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/session",
+        vol.Required("session_id"): vol.Coerce(int),
+        vol.Optional("encoding", default="json"): vol.In(["json", "series"]),
+    }
+)
+@websocket_api.async_response
+async def websocket_get_session(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle archived session request from frontend (with traces, JSON or base64 codec series)."""
+    archive: SessionArchive = hass.data[DATA_ARCHIVE]
+    session = await archive.async_get(hass, msg["session_id"], encoded=msg["encoding"] == "series")
+    if session is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Session not found")
+        return
+    connection.send_result(msg["id"], session)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/metrics",
+        vol.Optional("entry_id"): str,
+        vol.Optional("enable"): bool,
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def websocket_get_metrics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle hot-path histogram request from frontend (optionally enabling or resetting them)."""
+    result = {}
+    for entry_id, coordinator in hass.data.get(DOMAIN, {}).items():
+        if "entry_id" in msg and entry_id != msg["entry_id"]:
+            continue
+        if "enable" in msg:
+            coordinator.metrics.enabled = msg["enable"]
+        result[entry_id] = coordinator.metrics.as_dict()
+        if msg["reset"]:
+            coordinator.metrics.reset()
+    connection.send_result(msg["id"], result)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/trace",
+        vol.Optional("entry_id"): str,
+        vol.Optional("enable"): bool,
+        vol.Optional("clear", default=False): bool,
+        vol.Optional("since", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+@websocket_api.async_response
+async def websocket_get_trace(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle decision trace request from frontend (records after `since`, optionally enabling or clearing)."""
+    result = {}
+    for entry_id, coordinator in hass.data.get(DOMAIN, {}).items():
+        if "entry_id" in msg and entry_id != msg["entry_id"]:
+            continue
+        if "enable" in msg:
+            coordinator.trace.enabled = msg["enable"]
+        result[entry_id] = {"enabled": coordinator.trace.enabled, "records": coordinator.trace.records(msg["since"])}
+        if msg["clear"]:
+            coordinator.trace.clear()
+    connection.send_result(msg["id"], result)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Assistant Cooker component."""
     hass.data.setdefault(DOMAIN, {})
+    archive = SessionArchive(hass.config.path(ARCHIVE_FILENAME), ARCHIVE_TRACE_SECONDS)
+    hass.data[DATA_ARCHIVE] = archive
+
+    # Heating priors and carryover coefficients: cached tables now, refit from
+    # the archive once HA has started
+    priors_store = Store(hass, 1, PRIORS_STORAGE_KEY)
+    priors = HeatingPriors(await priors_store.async_load(), priors_store, PRIOR_MIN_SESSIONS, PRIOR_MAX_SESSIONS)
+    hass.data[DATA_PRIORS] = priors
+    carryover_store = Store(hass, 1, CARRYOVER_STORAGE_KEY)
+    calibration = CarryoverCalibration(await carryover_store.async_load(), carryover_store, CARRYOVER_MAX_SESSIONS)
+    hass.data[DATA_CARRYOVER] = calibration
 
     # Register websocket commands
     websocket_api.async_register_command(hass, websocket_get_version)
     websocket_api.async_register_command(hass, websocket_get_food_data)
+    websocket_api.async_register_command(hass, websocket_get_estimator_scores)
+    websocket_api.async_register_command(hass, websocket_list_sessions)
+    websocket_api.async_register_command(hass, websocket_get_session)
+    websocket_api.async_register_command(hass, websocket_get_metrics)
+    websocket_api.async_register_command(hass, websocket_get_trace)
 
     async def _setup_frontend(_event=None) -> None:
         await async_register_frontend(hass)
 
+    async def _refit_learned_tables(_event=None) -> None:
+        await priors.async_refit(hass, archive)
+        await calibration.async_refit(hass, archive)
+
     # If HA is already running, register immediately
     if hass.state == CoreState.running:
         await _setup_frontend()
+        hass.async_create_task(_refit_learned_tables())
     else:
         # Otherwise, wait for STARTED event
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _setup_frontend)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _refit_learned_tables)
 
     return True
 
@@ -102,6 +275,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     await coordinator.async_config_entry_first_refresh()
 
+    # Recover readings the recorder stored while the integration was not running
+    hass.async_create_task(coordinator.async_backfill_history())
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Set up platforms
@@ -141,6 +317,7 @@ async def async_register_services(hass: HomeAssistant) -> None:
         async_set_target_temp,
         async_set_food,
         async_set_carryover,
+        async_set_thickness,
     )
 
     # Only register if not already registered
@@ -195,3 +372,13 @@ async def async_register_services(hass: HomeAssistant) -> None:
             vol.Required("enabled"): bool,
         }),
     )
+
+    hass.services.async_register(
+        DOMAIN,
+        "set_thickness",
+        async_set_thickness,
+        schema=vol.Schema({
+            vol.Required("entity_id"): str,
+            vol.Required("thickness"): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_THICKNESS_CM)),
+        }),
+    )
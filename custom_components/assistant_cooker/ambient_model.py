@@ -0,0 +1,227 @@
+"""Newton's law against the measured ambient trajectory.
+
+The constant-ambient exponential model goes wrong while the oven or smoker is
+preheating or swinging. Here the heating constant k comes from the integral
+form of Newton's law over the measured ambient:
+
+    T(t) − T(t − L) = k · ∫ (Ta(τ) − T(τ)) dτ   over [t − L, t]
+
+The integral is accumulated sample by sample (a discrete convolution over the
+history). Lagged increments are regressed through the origin with exponential
+forgetting, so each new sample costs O(1). Ambient is forecast with a damped
+Holt trend (level + slope that fades out), and the time to target integrates
+Newton's law forward against that forecast. No Home Assistant imports.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+_ONE_MINUTE = timedelta(minutes=1)
+_timestamp = itemgetter(0)
+
+
+class AmbientTrajectoryModel:
+    """
+    Incremental estimator of k against a time-varying ambient.
+
+    lag_minutes is the span of the regressed increments (long enough to rise
+    above probe noise), forget_minutes the memory of the regression and
+    level_minutes / trend_minutes / damping_minutes the time constants of the
+    ambient level, ambient slope and forecast damping.
+    """
+
+    def __init__(
+        self,
+        lag_minutes: float = 2.0,
+        forget_minutes: float = 15.0,
+        level_minutes: float = 1.0,
+        trend_minutes: float = 10.0,
+        damping_minutes: float = 10.0,
+        min_pairs: int = 20,
+        step_minutes: float = 0.5,
+    ) -> None:
+        """Initialize the model."""
+        self._lag = lag_minutes
+        self._forget = forget_minutes
+        self._level_tau = level_minutes
+        self._trend_tau = trend_minutes
+        self._damping = damping_minutes
+        self._min_pairs = min_pairs
+        self._step = step_minutes
+        self._probe_cursor: datetime | None = None
+        self._ambient_cursor: datetime | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the fitted state (cursors are kept, see rewind())."""
+        self._last_time: datetime | None = None
+        self._last_temp: float | None = None
+        self._ambient: float | None = None  # Last raw ambient (zero-order hold)
+        self._integral = 0.0  # ∫ (Ta − T) dt since the first sample, °C·min
+        self._lagged: deque[tuple[datetime, float, float]] = deque()  # (time, integral, temp)
+        self._sxx = 0.0
+        self._sxy = 0.0
+        self._pairs = 0
+        # Holt state of the ambient
+        self._level: float | None = None
+        self._trend = 0.0
+        self._level_time: datetime | None = None
+
+    def rewind(self) -> None:
+        """Reset and re-read the whole history on the next update."""
+        self.reset()
+        self._probe_cursor = None
+        self._ambient_cursor = None
+
+    @property
+    def ready(self) -> bool:
+        """Return True once enough lagged increments support k."""
+        return self._pairs >= self._min_pairs and self._sxx > 0 and self.k is not None
+
+    @property
+    def k(self) -> float | None:
+        """Return the heating constant (1/min) of the regression."""
+        if self._sxx <= 0:
+            return None
+        k = self._sxy / self._sxx
+        return k if k > 0 else None
+
+    @property
+    def ambient_level(self) -> float | None:
+        """Return the smoothed ambient (°C)."""
+        return self._level
+
+    @property
+    def ambient_trend(self) -> float:
+        """Return the smoothed ambient slope (°C/min)."""
+        return self._trend
+
+    @property
+    def ambient_plateau(self) -> float | None:
+        """Return the ambient the forecast levels off at (°C)."""
+        if self._level is None:
+            return None
+        return self._level + self._trend * self._damping
+
+    def forecast_ambient(self, minutes: float) -> float | None:
+        """Return the ambient forecast `minutes` ahead (damped trend)."""
+        if self._level is None:
+            return None
+        return self._level + self._trend * self._damping * (1.0 - math.exp(-minutes / self._damping))
+
+    def update(
+        self,
+        temp_history: list[tuple[datetime, float]],
+        ambient_history: list[tuple[datetime, float]],
+    ) -> None:
+        """Ingest the probe and ambient samples received since the last call."""
+        if not temp_history:
+            return
+        if self._probe_cursor is not None and temp_history[-1][0] < self._probe_cursor:
+            self.rewind()  # History was replaced (new cook)
+
+        probe_start = 0
+        if self._probe_cursor is not None:
+            probe_start = bisect.bisect_right(temp_history, self._probe_cursor, key=_timestamp)
+        ambient_index = 0
+        if self._ambient_cursor is not None:
+            ambient_index = bisect.bisect_right(ambient_history, self._ambient_cursor, key=_timestamp)
+
+        for timestamp, temp in temp_history[probe_start:]:
+            # Ambient samples up to this probe sample (merged by time)
+            while ambient_index < len(ambient_history) and ambient_history[ambient_index][0] <= timestamp:
+                self._add_ambient(*ambient_history[ambient_index])
+                ambient_index += 1
+            self._add_probe(timestamp, temp)
+
+        self._probe_cursor = temp_history[-1][0]
+        if ambient_index:
+            self._ambient_cursor = ambient_history[ambient_index - 1][0]
+
+    def time_to(self, current_temp: float, target_temp: float, max_minutes: float = 1440.0) -> float | None:
+        """
+        Minutes until target_temp, integrating Newton's law over the forecast.
+
+        Ambient is piecewise constant over step_minutes steps until the trend
+        has faded (5 damping constants), then the plateau gives a closed form.
+        None if the target is not reached within max_minutes.
+        """
+        k = self.k
+        if k is None or self._level is None:
+            return None
+        if current_temp >= target_temp:
+            return 0.0
+
+        temp = current_temp
+        elapsed = 0.0
+        decay = math.exp(-k * self._step)
+        # A flat ambient (< 0.5°C still to come) goes straight to the closed form
+        horizon = 5 * self._damping if abs(self._trend) * self._damping >= 0.5 else 0.0
+        while elapsed < horizon:
+            ambient = self.forecast_ambient(elapsed + self._step / 2)
+            following = ambient + (temp - ambient) * decay
+            if following >= target_temp:
+                return elapsed + self._crossing(temp, target_temp, ambient, k)
+            temp = following
+            elapsed += self._step
+
+        plateau = self.ambient_plateau
+        if plateau <= target_temp:
+            return None
+        remaining = elapsed + self._crossing(temp, target_temp, plateau, k)
+        return remaining if remaining <= max_minutes else None
+
+    @staticmethod
+    def _crossing(temp: float, target_temp: float, ambient: float, k: float) -> float:
+        """Minutes from temp to target_temp under a constant ambient."""
+        return -math.log((ambient - target_temp) / (ambient - temp)) / k
+
+    def _add_ambient(self, timestamp: datetime, value: float) -> None:
+        """Update the Holt level/trend with an ambient sample."""
+        self._ambient = value
+        if self._level is None:
+            self._level = value
+            self._level_time = timestamp
+            return
+
+        delta = (timestamp - self._level_time) / _ONE_MINUTE
+        if delta <= 0:
+            return
+        predicted = self._level + self._trend * delta
+        level = predicted + (1.0 - math.exp(-delta / self._level_tau)) * (value - predicted)
+        slope = (level - self._level) / delta
+        self._trend += (1.0 - math.exp(-delta / self._trend_tau)) * (slope - self._trend)
+        self._level = level
+        self._level_time = timestamp
+
+    def _add_probe(self, timestamp: datetime, temp: float) -> None:
+        """Accumulate the ambient integral and regress the lagged increment."""
+        if self._ambient is None:
+            return  # No ambient yet: nothing to integrate against
+
+        if self._last_time is not None:
+            delta = (timestamp - self._last_time) / _ONE_MINUTE
+            if delta <= 0:
+                return
+            self._integral += delta * (self._ambient - (temp + self._last_temp) / 2)
+
+            # Keep the newest sample at least lag_minutes old as the anchor
+            horizon = timestamp - timedelta(minutes=self._lag)
+            while len(self._lagged) > 1 and self._lagged[1][0] <= horizon:
+                self._lagged.popleft()
+            if self._lagged and self._lagged[0][0] <= horizon:
+                _, anchor_integral, anchor_temp = self._lagged[0]
+                x = self._integral - anchor_integral
+                y = temp - anchor_temp
+                forget = math.exp(-delta / self._forget)
+                self._sxx = forget * self._sxx + x * x
+                self._sxy = forget * self._sxy + x * y
+                self._pairs += 1
+
+        self._lagged.append((timestamp, self._integral, temp))
+        self._last_time = timestamp
+        self._last_temp = temp
@@ -0,0 +1,264 @@
+"""Local archive of finished cook sessions (SQLite).
+
+One row per session with its metadata, the estimator scores and the probe and
+ambient traces downsampled to ARCHIVE_TRACE_SECONDS and stored as codec.py
+series (version 1 databases hold JSON traces, which are still read). Queries filter on the
+indexed columns (entry, food, start time) and page with LIMIT/OFFSET; list
+results leave the traces out.
+
+All methods block: the coordinator and the websocket handlers call them
+through the executor (the async_* wrappers). Each call opens its own
+connection, so calls from different executor threads do not share state. No
+Home Assistant imports: maintenance scripts read the archive directly.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from .codec import decode_series, encode_series
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entry_id TEXT NOT NULL,
+    food_category TEXT,
+    food_type TEXT,
+    doneness TEXT,
+    outcome TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    done_time REAL,
+    end_time REAL NOT NULL,
+    desired_temp REAL,
+    withdrawal_temp REAL,
+    start_probe_temp REAL,
+    peak_temp REAL,
+    carryover_peak REAL,
+    thickness_cm REAL,
+    strategy TEXT,
+    estimator_scores TEXT,
+    temp_trace BLOB NOT NULL,
+    ambient_trace BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_food ON sessions (food_category, food_type, start_time);
+CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions (start_time);
+CREATE INDEX IF NOT EXISTS idx_sessions_entry ON sessions (entry_id, start_time);
+"""
+
+# Columns returned by list queries (everything but the traces)
+_SUMMARY_COLUMNS = (
+    "id", "entry_id", "food_category", "food_type", "doneness", "outcome",
+    "start_time", "done_time", "end_time", "desired_temp", "withdrawal_temp",
+    "start_probe_temp", "peak_temp", "carryover_peak", "thickness_cm", "strategy",
+)
+_TIME_COLUMNS = ("start_time", "done_time", "end_time")
+
+
+def downsample(
+    history: list[tuple[datetime, float]],
+    interval_seconds: float,
+) -> list[tuple[datetime, float]]:
+    """Return the first sample of each interval (and the last sample of the trace)."""
+    result = []
+    next_time = None
+    for timestamp, value in history:
+        if next_time is None or timestamp.timestamp() >= next_time:
+            result.append((timestamp, value))
+            next_time = timestamp.timestamp() + interval_seconds
+    if history and result[-1] is not history[-1]:
+        result.append(history[-1])
+    return result
+
+
+def _decode_trace(stored: bytes | str) -> list[tuple[datetime, float]]:
+    """Return a stored trace: codec series, or JSON [[epoch seconds, °C], ...] (version 1)."""
+    if isinstance(stored, str):
+        return [(datetime.fromtimestamp(seconds, timezone.utc), value) for seconds, value in json.loads(stored)]
+    return decode_series(stored)
+
+
+def _epoch(value: datetime | None) -> float | None:
+    """Return a datetime as epoch seconds."""
+    return value.timestamp() if value is not None else None
+
+
+def _iso(value: float | None) -> str | None:
+    """Return epoch seconds as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(value, timezone.utc).isoformat() if value is not None else None
+
+
+class SessionArchive:
+    """SQLite archive of cook sessions."""
+
+    def __init__(self, path: str, trace_seconds: float = 30.0) -> None:
+        """Initialize the archive; the database is created on first use."""
+        self._path = path
+        self._trace_seconds = trace_seconds
+        self._ready = False
+
+    @property
+    def path(self) -> str:
+        """Return the database file path."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema the first time."""
+        conn = sqlite3.connect(self._path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._ready:
+            with conn:
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._ready = True
+        return conn
+
+    def add(self, session: dict[str, Any]) -> int:
+        """
+        Store a session and return its id.
+
+        session holds the column values, with datetimes for the times and
+        [(datetime, °C), ...] lists for temp_trace and ambient_trace (stored
+        downsampled to trace_seconds).
+        """
+        row = dict(session)
+        for column in _TIME_COLUMNS:
+            row[column] = _epoch(row.get(column))
+        row["temp_trace"] = encode_series(downsample(row.get("temp_trace") or [], self._trace_seconds))
+        row["ambient_trace"] = encode_series(downsample(row.get("ambient_trace") or [], self._trace_seconds))
+        scores = row.get("estimator_scores")
+        row["estimator_scores"] = json.dumps(scores) if scores is not None else None
+
+        columns = (*_SUMMARY_COLUMNS[1:], "estimator_scores", "temp_trace", "ambient_trace")  # id is assigned
+        placeholders = ", ".join(f":{column}" for column in columns)
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                f"INSERT INTO sessions ({', '.join(columns)}) VALUES ({placeholders})",
+                {column: row.get(column) for column in columns},
+            )
+            return cursor.lastrowid
+
+    def query(
+        self,
+        entry_id: str | None = None,
+        food_category: str | None = None,
+        food_type: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return {"total", "sessions"}: matching session summaries, newest first."""
+        clauses = []
+        params: list[Any] = []
+        for column, value in (("entry_id", entry_id), ("food_category", food_category), ("food_type", food_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("start_time >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("start_time < ?")
+            params.append(until.timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with closing(self._connect()) as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM sessions {where} "
+                "ORDER BY start_time DESC, id DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+        return {"total": total, "sessions": [self._summary(row) for row in rows]}
+
+    def get(self, session_id: int, encoded: bool = False) -> dict[str, Any] | None:
+        """
+        Return a session with its scores and traces (None if unknown).
+
+        Traces are [[isoformat, °C], ...] lists, or with encoded=True base64
+        strings of codec series (a fraction of the size, for transfers).
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is None:
+            return None
+        session = self._summary(row)
+        session["estimator_scores"] = json.loads(row["estimator_scores"]) if row["estimator_scores"] else None
+        for column in ("temp_trace", "ambient_trace"):
+            stored = row[column]
+            if encoded:
+                series = stored if isinstance(stored, bytes) else encode_series(_decode_trace(stored))
+                session[column] = base64.b64encode(series).decode("ascii")
+            else:
+                session[column] = [[timestamp.isoformat(), value] for timestamp, value in _decode_trace(stored)]
+        return session
+
+    def traces(self, session_id: int) -> tuple[list[tuple[datetime, float]], list[tuple[datetime, float]]] | None:
+        """Return the (probe, ambient) traces of a session as datetime lists."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT temp_trace, ambient_trace FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return _decode_trace(row["temp_trace"]), _decode_trace(row["ambient_trace"])
+
+    def iter_sessions(
+        self,
+        outcome: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield sessions with their traces for batch jobs, newest first.
+
+        Times are datetimes and traces [(datetime, °C), ...] lists (what add()
+        takes). Rows are decoded one at a time.
+        """
+        where = "WHERE outcome = ?" if outcome is not None else ""
+        params: list[Any] = [outcome] if outcome is not None else []
+        columns = ", ".join((*_SUMMARY_COLUMNS, "temp_trace", "ambient_trace"))
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"SELECT {columns} FROM sessions {where} ORDER BY start_time DESC, id DESC LIMIT ?",
+                [*params, limit if limit is not None else -1],
+            )
+            for row in cursor:
+                session = {column: row[column] for column in _SUMMARY_COLUMNS}
+                for column in _TIME_COLUMNS:
+                    if session[column] is not None:
+                        session[column] = datetime.fromtimestamp(session[column], timezone.utc)
+                session["temp_trace"] = _decode_trace(row["temp_trace"])
+                session["ambient_trace"] = _decode_trace(row["ambient_trace"])
+                yield session
+
+    @staticmethod
+    def _summary(row: sqlite3.Row) -> dict[str, Any]:
+        """Return the summary columns of a row, times as ISO strings."""
+        summary = {column: row[column] for column in _SUMMARY_COLUMNS}
+        for column in _TIME_COLUMNS:
+            summary[column] = _iso(summary[column])
+        return summary
+
+    async def async_add(self, hass: HomeAssistant, session: dict[str, Any]) -> int:
+        """Store a session from the event loop (runs in the executor)."""
+        return await hass.async_add_executor_job(self.add, session)
+
+    async def async_query(self, hass: HomeAssistant, **filters: Any) -> dict[str, Any]:
+        """Query sessions from the event loop (runs in the executor)."""
+        return await hass.async_add_executor_job(lambda: self.query(**filters))
+
+    async def async_get(
+        self, hass: HomeAssistant, session_id: int, encoded: bool = False
+    ) -> dict[str, Any] | None:
+        """Return a session from the event loop (runs in the executor)."""
+        return await hass.async_add_executor_job(self.get, session_id, encoded)
@@ -1,31 +1,410 @@
 """Cooking time calculation algorithms for Assistant Cooker."""
 from __future__ import annotations
 
+import bisect
 import math
+from collections import deque
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure-Python backend is used instead
+    np = None
+
+from .ambient_model import AmbientTrajectoryModel
+from .const import DEFAULT_ESTIMATION_STRATEGY, ESTIMATION_STRATEGIES, STRATEGY_KALMAN
+from .estimators import create_estimator
+from .kalman import HeatingKalmanFilter
+from .newton_fit import NewtonCurveFit
+from .streaming import ChangePointDetector, SampleStatistics, SlidingQuantile
+from .tracing import TRACE_KIND_ESTIMATE, DecisionTrace
 
 if TYPE_CHECKING:
     pass
 
+BACKEND_PYTHON = "python"
+BACKEND_NUMPY = "numpy"
+DEFAULT_BACKEND = BACKEND_NUMPY if np is not None else BACKEND_PYTHON
+
+_ONE_MINUTE = timedelta(minutes=1)
+_timestamp = itemgetter(0)
+
+# Fixed thresholds, used until the sample statistics are meaningful (and when
+# adaptation is disabled)
+_RISING_THRESHOLD = 0.1  # °C/min
+_PAIR_MINUTES = 1.5
+_MIN_PAIR_MINUTES = 0.25  # 15 seconds between the samples of a heating constant
+_MIN_ADAPTIVE_SAMPLES = 10
+
+# Parameters that CookingCalculator.tune() accepts (attribute names without the
+# leading underscore); swept offline by scripts/rescore_sessions.py
+TUNABLE_PARAMETERS = (
+    "history_window_minutes",
+    "fit_window_minutes",
+    "change_threshold",
+    "change_slack",
+    "removal_threshold",
+    "min_rising_duration_seconds",
+    "adaptive_windows",
+    "min_window_minutes",
+    "max_window_minutes",
+    "rate_resolution",
+    "smoothing_base_weight",
+    "smoothing_progress_weight",
+    "smoothing_max_weight",
+)
+
+
+def recent_window(
+    temp_history: list[tuple[datetime, float]],
+    minutes: float,
+) -> list[tuple[datetime, float]]:
+    """
+    Return the points of the last `minutes` (relative to the newest point).
+
+    History is time ordered, so the window start is found by bisection
+    instead of scanning the whole cook.
+    """
+    if not temp_history:
+        return []
+    cutoff = temp_history[-1][0] - timedelta(minutes=minutes)
+    return temp_history[bisect.bisect_right(temp_history, cutoff, key=_timestamp):]
+
+
+class _PythonBackend:
+    """Pure-Python estimator kernels (reference implementation)."""
+
+    name = BACKEND_PYTHON
+
+    @staticmethod
+    def slope(x_vals: list[float], y_vals: list[float]) -> float | None:
+        """Least-squares slope of y over x (None if x is constant)."""
+        n = len(x_vals)
+        x_mean = math.fsum(x_vals) / n
+        y_mean = math.fsum(y_vals) / n
+        numerator = math.fsum((x - x_mean) * (y - y_mean) for x, y in zip(x_vals, y_vals))
+        denominator = math.fsum((x - x_mean) * (x - x_mean) for x in x_vals)
+        if denominator == 0:
+            return None
+        return numerator / denominator
+
+    @staticmethod
+    def median_heating_constant(
+        deltas: list[float],
+        temps: list[float],
+        ambient: float,
+        last_temp: float,
+        min_delta: float,
+    ) -> float | None:
+        """
+        Median of k = -ln((Ta - T_last) / (Ta - T_i)) / dt_i over the window.
+
+        deltas are the minutes between each point and the newest one; pairs
+        closer than min_delta minutes or not approaching ambient are skipped.
+        """
+        diff2 = ambient - last_temp
+        if diff2 <= 0:
+            return None
+
+        k_values = []
+        for delta_t, temp in zip(deltas, temps):
+            if delta_t < min_delta:
+                continue
+            diff1 = ambient - temp
+            if diff1 <= 0 or diff2 >= diff1:
+                continue
+            k = -math.log(diff2 / diff1) / delta_t
+            if k > 0:
+                k_values.append(k)
+
+        if not k_values:
+            return None
+
+        # Use median k for robustness against outliers
+        k_values.sort()
+        return k_values[len(k_values) // 2]
+
+
+class _NumpyBackend:
+    """
+    NumPy estimator kernels.
+
+    Outputs are bit-for-bit identical to _PythonBackend: sums go through
+    math.fsum (exactly rounded) in both backends, element-wise operations are
+    IEEE-identical, and the median heating constant is re-evaluated with
+    math.log so libm/SIMD log differences cannot leak into the result.
+    """
+
+    name = BACKEND_NUMPY
+
+    # Relative band around the approximate median re-evaluated exactly.
+    # Far above the few-ulp error of np.log, far below any real k spread.
+    _MEDIAN_BAND = 1e-9
+
+    @staticmethod
+    def slope(x_vals: list[float], y_vals: list[float]) -> float | None:
+        """Least-squares slope of y over x (None if x is constant)."""
+        n = len(x_vals)
+        dx = np.array(x_vals) - math.fsum(x_vals) / n
+        dy = np.array(y_vals) - math.fsum(y_vals) / n
+        numerator = math.fsum((dx * dy).tolist())
+        denominator = math.fsum((dx * dx).tolist())
+        if denominator == 0:
+            return None
+        return numerator / denominator
+
+    @classmethod
+    def median_heating_constant(
+        cls,
+        deltas: list[float],
+        temps: list[float],
+        ambient: float,
+        last_temp: float,
+        min_delta: float,
+    ) -> float | None:
+        """Vectorized equivalent of _PythonBackend.median_heating_constant."""
+        diff2 = ambient - last_temp
+        if diff2 <= 0:
+            return None
+
+        delta = np.array(deltas)
+        diff1 = ambient - np.array(temps)
+        mask = (delta >= min_delta) & (diff1 > 0) & (diff1 > diff2)
+        if not mask.any():
+            return None
+
+        ratio = diff2 / diff1[mask]
+        delta = delta[mask]
+        k = -np.log(ratio) / delta
+
+        positive = k > 0
+        if not positive.all():
+            ratio, delta, k = ratio[positive], delta[positive], k[positive]
+        if k.size == 0:
+            return None
+
+        # Exact order statistic: values clearly below the approximate median are
+        # only counted, values inside the band are recomputed with math.log
+        middle = k.size // 2
+        approx = float(np.partition(k, middle)[middle])
+        band = approx * cls._MEDIAN_BAND
+        below = int(np.count_nonzero(k < approx - band))
+        near = np.flatnonzero(np.abs(k - approx) <= band)
+        exact = sorted(
+            -math.log(r) / d for r, d in zip(ratio[near].tolist(), delta[near].tolist())
+        )
+        return exact[middle - below]
+
+
+_BACKENDS = {
+    BACKEND_PYTHON: _PythonBackend,
+    BACKEND_NUMPY: _NumpyBackend,
+}
+
+
+class HeatingConstantTracker:
+    """
+    Heating constants of the estimation window with streaming quartiles.
+
+    Each new sample contributes one k, computed against a partner sample about
+    pair_minutes older (or the first sample of its window early on). A constant
+    enters when its sample arrives and leaves when the sample exits the window,
+    so the median and IQR update in O(log n) per sample instead of re-sorting
+    the whole window every tick. Constants depend on the ambient they were
+    computed with, so the window is recomputed against the current ambient
+    when it moves away from the one in use by more than ambient_ratio of the
+    ambient-to-probe difference (the relative error it brings to k), and at
+    least ambient_tolerance: thermostat swings of a few degrees around a hot
+    oven no longer rebuild it every cycle.
+    """
+
+    def __init__(
+        self,
+        pair_minutes: float = 1.5,
+        min_pair_minutes: float = 0.25,
+        ambient_tolerance: float = 1.0,
+        ambient_ratio: float = 0.05,
+    ) -> None:
+        """Initialize the tracker."""
+        self._pair_minutes = pair_minutes
+        self._min_pair_minutes = min_pair_minutes
+        self._ambient_tolerance = ambient_tolerance
+        self._ambient_ratio = ambient_ratio
+        self._ambient: float | None = None
+        self._entries: deque[tuple[datetime, float, int]] = deque()  # (sample time, k, seq)
+        self._quartiles = (SlidingQuantile(0.25), SlidingQuantile(0.5), SlidingQuantile(0.75))
+        self._seq = 0
+        self._last_time: datetime | None = None
+
+    def __len__(self) -> int:
+        """Return the number of heating constants in the window."""
+        return len(self._entries)
+
+    @property
+    def median(self) -> float | None:
+        """Return the median heating constant (1/min)."""
+        return self._quartiles[1].value
+
+    @property
+    def quartiles(self) -> tuple[float | None, float | None, float | None]:
+        """Return (Q1, median, Q3) of the heating constants."""
+        return tuple(quantile.value for quantile in self._quartiles)
+
+    @property
+    def iqr(self) -> float | None:
+        """Return the interquartile range of the heating constants."""
+        q1, _, q3 = self.quartiles
+        if q1 is None or q3 is None:
+            return None
+        return q3 - q1
+
+    def set_pairing(self, pair_minutes: float, min_pair_minutes: float) -> None:
+        """Change the partner age and minimum spacing of the samples of a constant."""
+        self._pair_minutes = pair_minutes
+        self._min_pair_minutes = min_pair_minutes
+
+    def reset(self) -> None:
+        """Forget all constants."""
+        self._entries.clear()
+        for quantile in self._quartiles:
+            quantile.clear()
+        self._last_time = None
+        self._ambient = None
+
+    def update(
+        self,
+        temp_history: list[tuple[datetime, float]],
+        ambient: float,
+        window_minutes: float,
+    ) -> None:
+        """Ingest samples newer than the last update and expire old ones."""
+        if not temp_history:
+            return
+
+        newest, newest_temp = temp_history[-1]
+        if self._last_time is not None and newest < self._last_time:
+            self.reset()  # History was replaced (new cook)
+        elif self._ambient is not None:
+            tolerance = max(self._ambient_tolerance, self._ambient_ratio * (self._ambient - newest_temp))
+            if abs(ambient - self._ambient) > tolerance:
+                self.reset()  # The samples still in the window are recomputed below
+        if self._ambient is None:
+            self._ambient = ambient
+
+        window = timedelta(minutes=window_minutes)
+        cutoff = newest - window
+        start = bisect.bisect_right(temp_history, cutoff, key=_timestamp)
+        if self._last_time is not None:
+            start = max(start, bisect.bisect_right(temp_history, self._last_time, key=_timestamp))
+
+        for index in range(start, len(temp_history)):
+            k = self._pair_constant(temp_history, index, ambient, window)
+            if k is not None:
+                entry = (temp_history[index][0], k, self._seq)
+                self._seq += 1
+                self._entries.append(entry)
+                for quantile in self._quartiles:
+                    quantile.add(k, entry[2])
+        self._last_time = newest
+
+        while self._entries and self._entries[0][0] <= cutoff:
+            _, k, seq = self._entries.popleft()
+            for quantile in self._quartiles:
+                quantile.remove(k, seq)
+
+    def _pair_constant(
+        self,
+        temp_history: list[tuple[datetime, float]],
+        index: int,
+        ambient: float,
+        window: timedelta,
+    ) -> float | None:
+        """Return k for the sample at index and its partner (None if not usable)."""
+        t_i, temp_i = temp_history[index]
+        first = bisect.bisect_right(temp_history, t_i - window, key=_timestamp)
+        partner = bisect.bisect_right(
+            temp_history, t_i - timedelta(minutes=self._pair_minutes), key=_timestamp
+        ) - 1
+        partner = max(partner, first)
+        if partner >= index:
+            return None
+
+        t_j, temp_j = temp_history[partner]
+        delta_t = (t_i - t_j) / _ONE_MINUTE
+        if delta_t < self._min_pair_minutes:
+            return None
+
+        diff_j = ambient - temp_j
+        diff_i = ambient - temp_i
+        if diff_i <= 0 or diff_j <= diff_i:
+            return None
+        k = -math.log(diff_i / diff_j) / delta_t
+        return k if k > 0 else None
+
 
 class CookingCalculator:
     """Calculator for cooking time estimations."""
 
-    def __init__(self) -> None:
-        """Initialize the calculator."""
+    def __init__(self, backend: str | None = None, strategy: str | None = None) -> None:
+        """
+        Initialize the calculator.
+
+        backend selects the estimator kernels ("python" or "numpy"); by default
+        NumPy is used when it is importable. strategy selects how the remaining
+        time is estimated (a name registered in estimators.ESTIMATORS).
+        """
+        backend = backend or DEFAULT_BACKEND
+        if backend == BACKEND_NUMPY and np is None:
+            raise ValueError("NumPy backend requested but NumPy is not installed")
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown calculator backend: {backend}")
+        self._backend = _BACKENDS[backend]
+
+        strategy = strategy or DEFAULT_ESTIMATION_STRATEGY
+        if strategy not in ESTIMATION_STRATEGIES:
+            raise ValueError(f"Unknown estimation strategy: {strategy}")
+        self._strategy = strategy
+        self._estimator = create_estimator(strategy, self)
+
         self._smoothing_factor = 0.3  # For exponential smoothing
         self._min_history_points = 2  # Reduced for earlier estimates
         self._history_window_minutes = 3  # Shorter window for faster response
         self._last_estimate: float | None = None
         self._estimate_smoothing = 0.7  # Smoothing for estimate stability
-        
-        # Detection of probe insertion (sudden temp drop)
-        self._temp_drop_threshold = -5.0  # °C drop threshold
-        self._temp_drop_check_seconds = 30  # Time window to check for drop
+        # Weight of a new raw estimate: base + progress × progress weight, capped
+        self._smoothing_base_weight = 0.3
+        self._smoothing_progress_weight = 0.5
+        self._smoothing_max_weight = 0.9
+        
+        # Change points of the probe (insertion, re-insertion, removal from the
+        # heat): the estimators only see the segment since the last one
+        self._change_threshold = 5.0  # °C, CUSUM of level changes
+        self._change_slack = 0.5  # °C of unexplained change tolerated per sample
+        self._removal_threshold = 1.5  # °C fall from the peak beyond the drift
+        self._change_detector = ChangePointDetector()
+        self._configure_change_detector()
+        self._change_cursor: datetime | None = None  # Last sample fed to the detector
+        self._segment_start: datetime | None = None
+        self._change_points: deque[tuple[datetime, str]] = deque(maxlen=32)  # (onset, kind)
         
         # Detection of actual cooking start (temp rising)
         self._min_rising_duration_seconds = 20  # Stable rise before calculations
+
+        # Windows and thresholds adapted to the probe (sample interval,
+        # quantization, noise) within these bounds; the fixed values apply
+        # until enough samples are seen, or always with adaptation off
+        self._adaptive_windows = 1.0  # 0 disables adaptation
+        self._min_window_minutes = 1.5
+        self._max_window_minutes = 10.0
+        self._rate_resolution = 0.05  # °C/min, target standard error of the window rate
+        self._sample_statistics = SampleStatistics()
+        self._adapted = False
+        self._window_minutes: float = self._history_window_minutes
+        self._min_points = self._min_history_points
+        self._rising_threshold = _RISING_THRESHOLD
+        self._min_pair_minutes = _MIN_PAIR_MINUTES
         
         # Stability threshold for display (CONFIGURABLE)
         self._stability_threshold_seconds = 30  # Max acceptable deviation
@@ -35,8 +414,173 @@ class CookingCalculator:
         self._cooking_start_time: datetime | None = None  # When stable rise began
         self._estimate_history: list[tuple[datetime, float]] = []  # [(timestamp, estimate_in_min), ...]
         self._is_stable = False
-        self._last_temp_for_drop_detection: float | None = None
-        self._last_temp_time: datetime | None = None
+
+        # Streaming heating constants (median + IQR) of the exponential model
+        self._heating_constants = HeatingConstantTracker()
+        self._min_streaming_constants = 3  # Below this, use the batch median
+        self._remaining_range: tuple[float, float] | None = None
+
+        # Joint (Ta, T0, k) fit used when no usable ambient sensor is available
+        self._curve_fit = NewtonCurveFit()
+        self._fit_window_minutes = 10  # Longer window: the asymptote needs curvature
+        self._fit_used = False
+
+        # Newton's law against the measured ambient trajectory (O(1) per sample)
+        self._ambient_model = AmbientTrajectoryModel()
+
+        # Kalman strategy: filter fed with every new sample (O(1) each)
+        self._kalman = HeatingKalmanFilter()
+        self._kalman_cursor: datetime | None = None  # Last sample fed
+
+        # Decision trace: a disabled private buffer until a coordinator shares its own
+        self.trace = DecisionTrace(size=1)
+
+    @property
+    def backend(self) -> str:
+        """Return the name of the estimator backend in use."""
+        return self._backend.name
+
+    @property
+    def strategy(self) -> str:
+        """Return the remaining time estimation strategy in use."""
+        return self._strategy
+
+    def set_strategy(self, strategy: str) -> None:
+        """Switch the estimation strategy (the Kalman filter re-reads the whole history)."""
+        if strategy not in ESTIMATION_STRATEGIES:
+            raise ValueError(f"Unknown estimation strategy: {strategy}")
+        if strategy == self._strategy:
+            return
+        self._strategy = strategy
+        self._estimator = create_estimator(strategy, self)
+        self._kalman.reset()
+        self._kalman_cursor = None
+        self._last_estimate = None  # Do not smooth across strategies
+        self._remaining_range = None
+
+    def tune(self, **parameters: float) -> None:
+        """Override tunable parameters (see TUNABLE_PARAMETERS)."""
+        for name, value in parameters.items():
+            if name not in TUNABLE_PARAMETERS:
+                raise ValueError(f"Unknown calculator parameter: {name}")
+            setattr(self, f"_{name}", value)
+        self._configure_change_detector()
+        self._adapt_windows()
+
+    def tuning(self) -> dict[str, float]:
+        """Return the current values of the tunable parameters."""
+        return {name: getattr(self, f"_{name}") for name in TUNABLE_PARAMETERS}
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the internal state (JSON-serializable) for diagnostics and replays."""
+
+        def iso(value: datetime | None) -> str | None:
+            return value.isoformat() if value is not None else None
+
+        q1, median, q3 = self._heating_constants.quartiles
+        return {
+            "strategy": self._strategy,
+            "backend": self._backend.name,
+            "tuning": self.tuning(),
+            "last_estimate": self._last_estimate,
+            "cooking_start_time": iso(self._cooking_start_time),
+            "is_stable": self._is_stable,
+            "estimate_history": [[iso(timestamp), value] for timestamp, value in self._estimate_history],
+            "change_detection": {
+                **self._change_detector.state(),
+                "cursor": iso(self._change_cursor),
+                "segment_start": iso(self._segment_start),
+                "change_points": [[iso(onset), kind] for onset, kind in self._change_points],
+            },
+            "sampling": {**self._sample_statistics.state(), **self.adaptive_parameters()},
+            "heating_constants": {"count": len(self._heating_constants), "q1": q1, "median": median, "q3": q3},
+            "remaining_range": list(self._remaining_range) if self._remaining_range is not None else None,
+            "fit_used": self._fit_used,
+            "fitted_ambient": self._curve_fit.ambient,
+            "fit_rms": self._curve_fit.rms,
+            "kalman_cursor": iso(self._kalman_cursor),
+            "kalman_k": self._kalman.k,
+        }
+
+    def adaptive_parameters(self) -> dict[str, Any]:
+        """Return the windows and thresholds in use (adapted or fixed)."""
+        return {
+            "adapted": self._adapted,
+            "window_minutes": self._window_minutes,
+            "min_points": self._min_points,
+            "rising_threshold": round(self._rising_threshold, 3),
+            "min_pair_seconds": round(self._min_pair_minutes * 60, 1),
+        }
+
+    @property
+    def segment_start(self) -> datetime | None:
+        """Return the onset of the last change point (None: the whole history is one segment)."""
+        return self._segment_start
+
+    @property
+    def heating_constant(self) -> float | None:
+        """Return the heating constant k (1/min): filtered or median of the window."""
+        if self._strategy == STRATEGY_KALMAN:
+            return self._kalman.k
+        return self._heating_constants.median
+
+    @property
+    def heating_constant_iqr(self) -> float | None:
+        """Return the interquartile range of the heating constants (1/min)."""
+        if self._strategy == STRATEGY_KALMAN:
+            return None
+        return self._heating_constants.iqr
+
+    @property
+    def ambient_trend(self) -> float | None:
+        """Return the smoothed ambient slope (°C/min) of the ambient model."""
+        if self._ambient_model.ambient_level is None:
+            return None
+        return self._ambient_model.ambient_trend
+
+    @property
+    def ambient_plateau(self) -> float | None:
+        """Return the ambient the forecast levels off at (°C)."""
+        return self._ambient_model.ambient_plateau
+
+    @property
+    def filtered_temperature(self) -> float | None:
+        """Return the Kalman-filtered probe temperature (None with other strategies)."""
+        if self._strategy != STRATEGY_KALMAN:
+            return None
+        return self._kalman.temperature
+
+    @property
+    def heating_rate_stddev(self) -> float | None:
+        """Return the standard deviation of the Kalman heating rate (°C/min)."""
+        if self._strategy != STRATEGY_KALMAN:
+            return None
+        return self._kalman.rate_stddev
+
+    @property
+    def fitted_ambient(self) -> float | None:
+        """Return the asymptote of the curve fit if the last estimate used it."""
+        return self._curve_fit.ambient if self._fit_used else None
+
+    @property
+    def fit_rms(self) -> float | None:
+        """Return the RMS residual (°C) of the last curve fit."""
+        return self._curve_fit.rms
+
+    @property
+    def remaining_time_spread(self) -> float | None:
+        """
+        Return the half-width (minutes) of the remaining time range.
+
+        The range is the remaining time computed with the first and third
+        quartiles of k, or ± one standard deviation with the Kalman strategy:
+        a measure of estimate confidence. None when the last estimate did not
+        come from the exponential model or the filter.
+        """
+        if self._remaining_range is None:
+            return None
+        low, high = self._remaining_range
+        return round((high - low) / 2, 1)
 
     def calculate_heating_rate(
         self,
@@ -45,39 +589,33 @@ class CookingCalculator:
         """
         Calculate the current heating rate in °C/min.
         
-        Uses linear regression over the last 5 minutes of data.
+        Uses linear regression over the last 5 minutes of data, or the
+        filtered rate with the Kalman strategy, within the current segment.
         """
-        if len(temp_history) < self._min_history_points:
+        temp_history = self._segment(temp_history)
+        if self._strategy == STRATEGY_KALMAN:
+            self._feed_kalman(temp_history)
+            rate = self._kalman.rate
+            return round(rate, 2) if rate is not None else None
+
+        if len(temp_history) < self._min_points:
             return None
 
-        # Get data from last 5 minutes
-        now = temp_history[-1][0] if temp_history else datetime.now()
-        cutoff = now - timedelta(minutes=self._history_window_minutes)
-        recent_data = [(t, v) for t, v in temp_history if t > cutoff]
+        # Get data from the estimation window
+        recent_data = recent_window(temp_history, self._window_minutes)
 
-        if len(recent_data) < self._min_history_points:
+        if len(recent_data) < self._min_points:
             return None
 
-        # Calculate linear regression
-        n = len(recent_data)
-        
         # Convert times to minutes from first point
         t0 = recent_data[0][0]
-        x_vals = [(t - t0).total_seconds() / 60 for t, _ in recent_data]
+        x_vals = [(t - t0) / _ONE_MINUTE for t, _ in recent_data]
         y_vals = [v for _, v in recent_data]
 
-        # Calculate means
-        x_mean = sum(x_vals) / n
-        y_mean = sum(y_vals) / n
-
-        # Calculate slope (rate)
-        numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(x_vals, y_vals))
-        denominator = sum((x - x_mean) ** 2 for x in x_vals)
-
-        if denominator == 0:
+        # Calculate slope (rate) by linear regression
+        rate = self._backend.slope(x_vals, y_vals)
+        if rate is None:
             return None
-
-        rate = numerator / denominator
         
         # Round to 2 decimal places
         return round(rate, 2)
@@ -89,39 +627,54 @@ class CookingCalculator:
         temp_history: list[tuple[datetime, float]],
         ambient_temp: float | None = None,
         ambient_history: list[tuple[datetime, float]] | None = None,
+        now: datetime | None = None,
     ) -> float | None:
         """
         Calculate remaining cooking time in minutes.
         
-        Uses multiple approaches:
-        1. Newton's law when ambient temp available (most accurate for longer cooks)
-        2. Linear extrapolation as fallback
-        3. Early estimation with minimal data
+        The raw estimate comes from the configured strategy (see estimators.py;
+        the default cascade tries the ambient model, the exponential model,
+        linear extrapolation and the early estimate in turn).
         
-        Applies smoothing to prevent jumpy estimates.
-        Includes probe insertion detection and estimate stability checking.
+        Applies smoothing to prevent jumpy estimates (except for strategies
+        that filter themselves).
+        Only the segment since the last change point (probe insertion,
+        re-insertion, removal from the heat) is used; a new change point
+        re-primes the estimators from its onset.
+        now defaults to the wall clock (replays pass the sample time).
         """
-        now = datetime.now()
-        
-        # Step 1: Detect probe insertion (sudden temp drop)
-        if self._detect_temp_drop(current_temp, now):
-            self._reset_for_new_cooking()
-            self._last_temp_for_drop_detection = current_temp
-            self._last_temp_time = now
-            return None  # Don't display anything during reset
-        
-        self._last_temp_for_drop_detection = current_temp
-        self._last_temp_time = now
+        now = now or datetime.now()
+        self._remaining_range = None
+        self._fit_used = False
+        trace = self.trace if self.trace.enabled else None
+        
+        # Step 1: Change points start a new segment
+        change = self._detect_changes(temp_history)
+        temp_history = self._segment(temp_history)
+        if change is not None:
+            kind, onset = change
+            self._prime_segment(temp_history, now)
+            if trace is not None:
+                self._trace_estimate(
+                    trace, current_temp, target_temp, None, "segment",
+                    reason=kind, segment_start=onset.isoformat(), segment_samples=len(temp_history),
+                )
+
+        self._estimator.observe(temp_history, ambient_temp)
         
         if current_temp >= target_temp:
             self._last_estimate = 0.0
             self._is_stable = True
+            if trace is not None:
+                self._trace_estimate(trace, current_temp, target_temp, 0.0, "target_reached")
             return 0.0
 
         # Step 2: Check if temperature is rising
         if not self._is_temperature_rising(temp_history):
             self._cooking_start_time = None
             self._is_stable = False
+            if trace is not None:
+                self._trace_estimate(trace, current_temp, target_temp, None, "waiting", reason="not_rising")
             return None
         
         # Step 3: Check minimum rising duration
@@ -130,38 +683,40 @@ class CookingCalculator:
         
         rising_duration = (now - self._cooking_start_time).total_seconds()
         if rising_duration < self._min_rising_duration_seconds:
+            if trace is not None:
+                self._trace_estimate(
+                    trace, current_temp, target_temp, None, "waiting",
+                    reason="rising_duration", rising_seconds=round(rising_duration, 1),
+                )
             return None  # Wait for stable rise
 
-        remaining_temp = target_temp - current_temp
-        raw_estimate = None
-
-        # Try exponential model first (more accurate for cooking physics)
-        # This estimates the heating constant k from the curve shape
-        raw_estimate = self._calculate_exponential_remaining(
-            current_temp=current_temp,
-            target_temp=target_temp,
-            ambient_temp=ambient_temp,
-            temp_history=temp_history,
+        raw_estimate = self._estimator.estimate(
+            current_temp, target_temp, temp_history, ambient_temp, ambient_history,
         )
+        if not self._estimator.smoothed:
+            if trace is not None:
+                if raw_estimate is not None:
+                    self._trace_estimate(
+                        trace, current_temp, target_temp, raw_estimate, "estimate", ambient_temp=ambient_temp,
+                    )
+                else:
+                    self._trace_estimate(
+                        trace, current_temp, target_temp, None, "no_estimate",
+                        ambient_temp=ambient_temp, reason=self._estimator.reason or "no_estimate",
+                    )
+            return raw_estimate
 
-        # Fall back to linear if exponential didn't work
-        if raw_estimate is None:
-            raw_estimate = self._calculate_linear_remaining(
-                remaining_temp=remaining_temp,
-                temp_history=temp_history,
-                current_temp=current_temp,
-            )
-
-        # Early estimate: if we have at least 1 minute of data
-        if raw_estimate is None and len(temp_history) >= 2:
-            raw_estimate = self._calculate_early_estimate(
-                current_temp=current_temp,
-                target_temp=target_temp,
-                temp_history=temp_history,
-            )
+        remaining_temp = target_temp - current_temp
 
         if raw_estimate is None:
-            return self._last_estimate if self._is_stable else None
+            result = self._last_estimate if self._is_stable else None
+            if trace is not None:
+                self._trace_estimate(
+                    trace, current_temp, target_temp, result,
+                    "kept_last" if result is not None else "no_estimate",
+                    ambient_temp=ambient_temp, reason=self._estimator.reason or "no_estimate",
+                )
+            return result
 
         # Sanity checks
         if raw_estimate < 0:
@@ -170,10 +725,14 @@ class CookingCalculator:
             raw_estimate = 1440.0
 
         # Apply smoothing to prevent jumpy estimates
+        weight = None
         if self._last_estimate is not None and self._last_estimate > 0:
             # Weighted average: more weight on new estimate as we get closer
             progress = 1 - (remaining_temp / max(target_temp - 20, 1))  # Rough progress
-            weight = min(0.9, 0.3 + progress * 0.5)  # More responsive as we progress
+            weight = min(  # More responsive as we progress
+                self._smoothing_max_weight,
+                self._smoothing_base_weight + progress * self._smoothing_progress_weight,
+            )
             smoothed = weight * raw_estimate + (1 - weight) * self._last_estimate
             self._last_estimate = smoothed
             final_estimate = round(smoothed, 1)
@@ -182,38 +741,239 @@ class CookingCalculator:
             final_estimate = round(raw_estimate, 1)
 
         # Step 4: We have a valid estimate - display it
-        # The temp drop detection + 20s rising requirement + smoothing 
+        # The change detection + 20s rising requirement + smoothing 
         # already handle the edge cases. No need for additional delay.
         self._is_stable = True
+        if trace is not None:
+            self._trace_estimate(
+                trace, current_temp, target_temp, final_estimate, "estimate",
+                ambient_temp=ambient_temp, raw=round(raw_estimate, 2),
+                weight=round(weight, 3) if weight is not None else None,
+            )
         return final_estimate
+
+    def _trace_estimate(
+        self,
+        trace: DecisionTrace,
+        current_temp: float,
+        target_temp: float,
+        remaining: float | None,
+        outcome: str,
+        **fields: Any,
+    ) -> None:
+        """Record an estimate decision with the strategy, the answering stage and its fallbacks."""
+        estimated = outcome in ("estimate", "kept_last", "no_estimate")
+        trace.record(
+            TRACE_KIND_ESTIMATE,
+            strategy=self._strategy,
+            outcome=outcome,
+            remaining=remaining,
+            current_temp=current_temp,
+            target_temp=target_temp,
+            source=self._estimator.source if outcome == "estimate" else None,
+            fallbacks=[list(fallback) for fallback in self._estimator.fallbacks] if estimated else [],
+            **fields,
+        )
     
-    def _detect_temp_drop(self, current_temp: float, now: datetime) -> bool:
+    def _calculate_ambient_model_remaining(
+        self,
+        current_temp: float,
+        target_temp: float,
+        temp_history: list[tuple[datetime, float]],
+        ambient_history: list[tuple[datetime, float]],
+    ) -> float | None:
+        """Remaining time from Newton's law integrated over the ambient forecast."""
+        self._ambient_model.update(temp_history, ambient_history)
+        if not self._ambient_model.ready:
+            return None
+
+        plateau = self._ambient_model.ambient_plateau
+        if plateau is None or plateau <= current_temp:
+            return None  # Not heating towards the target
+
+        remaining_minutes = self._ambient_model.time_to(current_temp, target_temp)
+        if remaining_minutes is None or remaining_minutes < 0 or remaining_minutes > 1440:
+            return None
+        return round(remaining_minutes, 1)
+
+    def _feed_kalman(
+        self,
+        temp_history: list[tuple[datetime, float]],
+        ambient_temp: float | None = None,
+    ) -> None:
+        """Feed the samples received since the last call to the Kalman filter."""
+        if not temp_history:
+            return
+        if self._kalman_cursor is not None and temp_history[-1][0] < self._kalman_cursor:
+            # History was replaced (new cook)
+            self._kalman.reset()
+            self._kalman_cursor = None
+
+        start = 0
+        if self._kalman_cursor is not None:
+            start = bisect.bisect_right(temp_history, self._kalman_cursor, key=_timestamp)
+        if start >= len(temp_history):
+            return
+
+        for timestamp, temp in temp_history[start:]:
+            self._kalman.update(timestamp, temp)
+        self._kalman_cursor = temp_history[-1][0]
+
+        if ambient_temp is not None:
+            self._kalman.observe_ambient(ambient_temp)
+
+    def _calculate_kalman_remaining(self, target_temp: float) -> float | None:
+        """Remaining time from the Kalman state, with its standard deviation as range."""
+        result = self._kalman.time_to(target_temp)
+        if result is None:
+            return self._last_estimate if self._is_stable else None
+
+        minutes, stddev = result
+        minutes = min(minutes, 1440.0)  # Max 24 hours
+        self._remaining_range = (minutes - stddev, minutes + stddev)
+
+        # No extra smoothing: the filter already weighs new samples
+        self._last_estimate = minutes
+        self._is_stable = True
+        return round(minutes, 1)
+
+    def _configure_change_detector(self) -> None:
+        """Apply the tunable thresholds to the change-point detector."""
+        self._change_detector.threshold = self._change_threshold
+        self._change_detector.slack = self._change_slack
+        self._change_detector.fall_threshold = self._removal_threshold
+
+    def _detect_changes(self, temp_history: list[tuple[datetime, float]]) -> tuple[str, datetime] | None:
         """
-        Detect if probe was just inserted into cold food.
-        
-        Returns True if temperature dropped significantly.
+        Feed the samples received since the last call to the change-point detector and the sample statistics.
+
+        Returns the last (kind, onset) change point found, after moving the
+        segment start to its onset. The windows are adapted to the updated
+        statistics.
         """
-        if self._last_temp_for_drop_detection is None or self._last_temp_time is None:
-            return False
-        
-        elapsed = (now - self._last_temp_time).total_seconds()
-        if elapsed > self._temp_drop_check_seconds:
-            return False  # Too much time passed, not a probe insertion
-        
-        temp_change = current_temp - self._last_temp_for_drop_detection
-        return temp_change < self._temp_drop_threshold
-    
+        if not temp_history:
+            return None
+        if self._change_cursor is not None and temp_history[-1][0] < self._change_cursor:
+            # History was replaced (new cook)
+            self._change_detector.reset()
+            self._sample_statistics.reset()
+            self._change_cursor = None
+        if self._segment_start is not None and self._segment_start < temp_history[0][0]:
+            self._segment_start = None  # Segment of an earlier cook
+
+        start = 0
+        if self._change_cursor is not None:
+            start = bisect.bisect_right(temp_history, self._change_cursor, key=_timestamp)
+        change = None
+        for timestamp, temp in temp_history[start:]:
+            self._sample_statistics.add(timestamp, temp)
+            found = self._change_detector.add(timestamp, temp)
+            if found is not None:
+                change = found
+                kind, onset = found
+                self._segment_start = onset
+                self._change_points.append((onset, kind))
+        self._change_cursor = temp_history[-1][0]
+        self._adapt_windows()
+        return change
+
+    def _adapt_windows(self) -> None:
+        """
+        Derive the estimation window and thresholds from the sample statistics.
+
+        With σ the noise (at least the quantization noise q/√12) and Δ the
+        spacing of the value changes, a regression over W minutes has a rate
+        standard error of σ·√(12·Δ/W³): W is the shortest window reaching
+        rate_resolution, holding at least 4 value changes, within the
+        bounds. The rising threshold is twice the rate standard error, and
+        the samples of a heating constant are at least 2 changes apart.
+        """
+        statistics = self._sample_statistics
+        noise = statistics.noise
+        self._adapted = bool(self._adaptive_windows) and noise is not None and (
+            statistics.samples >= _MIN_ADAPTIVE_SAMPLES
+        )
+        if not self._adapted:
+            self._window_minutes = self._history_window_minutes
+            self._min_points = self._min_history_points
+            self._rising_threshold = _RISING_THRESHOLD
+            self._min_pair_minutes = _MIN_PAIR_MINUTES
+            self._heating_constants.set_pairing(_PAIR_MINUTES, _MIN_PAIR_MINUTES)
+            return
+
+        spacing = statistics.change_interval / 60
+        sigma = max(noise, statistics.quantization / math.sqrt(12))
+        window = max((12 * sigma * sigma * spacing / self._rate_resolution ** 2) ** (1 / 3), 4 * spacing)
+        window = min(self._max_window_minutes, max(self._min_window_minutes, window))
+        window = math.ceil(window * 4) / 4  # Quarter minutes: no jitter from tick to tick
+        self._window_minutes = window
+        self._min_points = max(self._min_history_points, min(8, int(window / spacing) // 2))
+        self._rising_threshold = min(0.3, max(0.05, 2 * sigma * math.sqrt(12 * spacing / window ** 3)))
+        self._min_pair_minutes = min(window / 2, max(0.1, 2 * spacing))
+        self._heating_constants.set_pairing(window / 2, self._min_pair_minutes)
+
+    def _segment(self, temp_history: list[tuple[datetime, float]]) -> list[tuple[datetime, float]]:
+        """Return the samples of the current segment (the history itself without change point)."""
+        if self._segment_start is None or not temp_history:
+            return temp_history
+        start = bisect.bisect_left(temp_history, self._segment_start, key=_timestamp)
+        return temp_history[start:] if start else temp_history
+
     def _reset_for_new_cooking(self) -> None:
         """Reset all state for a new cooking session."""
         self._last_estimate = None
         self._cooking_start_time = None
         self._estimate_history = []
         self._is_stable = False
+        self._heating_constants.reset()
+        self._remaining_range = None
+        self._curve_fit.reset()
+        self._fit_used = False
+        self._kalman.reset()  # Keeps the cursor: only samples after the reset are fed
+        self._ambient_model.reset()  # Same for the ambient model
     
+    def prime(self, temp_history: list[tuple[datetime, float]], now: datetime | None = None) -> None:
+        """
+        Re-prime the estimator from a backfilled history.
+
+        Called after a gap (probe reconnect, integration reload) once the
+        history has been filled back from the recorder. Change points are
+        detected again over the whole history, then the estimators are primed
+        from the last segment.
+        """
+        self._change_detector.reset()
+        self._sample_statistics.reset()
+        self._change_cursor = None
+        self._segment_start = None
+        self._change_points.clear()
+        self._detect_changes(temp_history)
+        self._prime_segment(self._segment(temp_history), now or datetime.now())
+
+    def _prime_segment(self, segment: list[tuple[datetime, float]], now: datetime) -> None:
+        """
+        Reset the estimators and re-feed them the samples of a segment.
+
+        If the segment already shows a stable rise, the rising-duration wait
+        is skipped so the next call returns an estimate instead of waiting
+        for a new window.
+        """
+        self._reset_for_new_cooking()
+        self._kalman_cursor = None  # Re-feed the whole segment
+        self._ambient_model.rewind()
+        if not segment:
+            return
+
+        if not self._is_temperature_rising(segment):
+            return
+
+        rising_span = (segment[-1][0] - segment[0][0]).total_seconds()
+        if rising_span >= self._min_rising_duration_seconds:
+            self._cooking_start_time = now - timedelta(seconds=self._min_rising_duration_seconds)
+
     def _is_temperature_rising(self, temp_history: list[tuple[datetime, float]]) -> bool:
         """Check if temperature is currently rising."""
         rate = self.calculate_heating_rate(temp_history)
-        return rate is not None and rate > 0.1  # At least 0.1°C/min
+        return rate is not None and rate > self._rising_threshold  # Above the rate noise
     
     def _check_estimate_stability(self) -> bool:
         """
@@ -268,10 +1028,8 @@ class CookingCalculator:
         if len(temp_history) < 3:
             return None
         
-        # Get recent data (last 3 minutes for responsiveness)
-        now = temp_history[-1][0]
-        cutoff = now - timedelta(minutes=self._history_window_minutes)
-        recent_data = [(t, v) for t, v in temp_history if t > cutoff]
+        # Get recent data (the estimation window, short for responsiveness)
+        recent_data = recent_window(temp_history, self._window_minutes)
         
         if len(recent_data) < 3:
             return None
@@ -279,9 +1037,15 @@ class CookingCalculator:
         # Use provided ambient temp or estimate it
         effective_ambient = ambient_temp
         if effective_ambient is None or effective_ambient <= current_temp:
-            # Estimate ambient from heating acceleration
-            # If heating is slowing down, we can infer the asymptote
-            effective_ambient = self._estimate_ambient_from_curve(recent_data, current_temp)
+            # Joint least-squares fit of the asymptote and k (warm-started)
+            self._curve_fit.update(recent_window(temp_history, self._fit_window_minutes))
+            if self._curve_fit.is_reliable(current_temp):
+                effective_ambient = self._curve_fit.ambient
+                self._fit_used = True
+            else:
+                # Curve does not identify the asymptote yet: infer it from
+                # the slowdown of the heating rate
+                effective_ambient = self._estimate_ambient_from_curve(recent_data, current_temp)
         
         if effective_ambient is None or effective_ambient <= current_temp:
             return None  # Can't estimate, fall back to linear
@@ -289,41 +1053,51 @@ class CookingCalculator:
         if effective_ambient <= target_temp:
             return None  # Target is above ambient, will never reach (shouldn't happen for cooking)
         
-        # Calculate k from multiple point pairs for robustness
-        k_values = []
-        for i in range(len(recent_data) - 1):
-            t1, temp1 = recent_data[i]
-            t2, temp2 = recent_data[-1]  # Always compare to most recent
-            
-            delta_t = (t2 - t1).total_seconds() / 60
-            if delta_t < 0.25:  # Need at least 15 seconds between points
-                continue
-            
-            diff1 = effective_ambient - temp1
-            diff2 = effective_ambient - temp2
-            
-            if diff1 <= 0 or diff2 <= 0 or diff2 >= diff1:
-                continue
-            
-            try:
-                ratio = diff2 / diff1
-                if 0 < ratio < 1:
-                    k = -math.log(ratio) / delta_t
-                    if k > 0:
-                        k_values.append(k)
-            except (ValueError, ZeroDivisionError):
-                continue
+        # Quartiles of k over the window, maintained incrementally (O(log n) per sample)
+        self._heating_constants.update(temp_history, effective_ambient, self._window_minutes)
+        if self._fit_used:
+            k = self._curve_fit.k  # Fitted jointly with the asymptote
+        elif len(self._heating_constants) >= self._min_streaming_constants:
+            k = self._heating_constants.median
+        else:
+            # Not enough streaming constants yet: batch median where every
+            # point of the window is compared to the most recent one
+            t_last, temp_last = recent_data[-1]
+            k = self._backend.median_heating_constant(
+                deltas=[(t_last - t) / _ONE_MINUTE for t, _ in recent_data],
+                temps=[v for _, v in recent_data],
+                ambient=effective_ambient,
+                last_temp=temp_last,
+                min_delta=self._min_pair_minutes,  # Spacing above the probe's noise and resolution
+            )
         
-        if not k_values:
+        if k is None:
             return None
         
-        # Use median k for robustness against outliers
-        k_values.sort()
-        k = k_values[len(k_values) // 2]
+        remaining_minutes = self._newton_time_to_target(current_temp, target_temp, effective_ambient, k)
+        if remaining_minutes is None or remaining_minutes < 0 or remaining_minutes > 1440:
+            return None
+        
+        # Confidence range from the quartiles of k (faster k = shorter time)
+        q1, _, q3 = self._heating_constants.quartiles
+        if q1 is not None and q3 is not None and q1 > 0:
+            low = self._newton_time_to_target(current_temp, target_temp, effective_ambient, q3)
+            high = self._newton_time_to_target(current_temp, target_temp, effective_ambient, q1)
+            if low is not None and high is not None:
+                self._remaining_range = (low, high)
         
-        # Calculate remaining time to target
-        diff_current = effective_ambient - current_temp
-        diff_target = effective_ambient - target_temp
+        return round(remaining_minutes, 1)
+
+    @staticmethod
+    def _newton_time_to_target(
+        current_temp: float,
+        target_temp: float,
+        ambient: float,
+        k: float,
+    ) -> float | None:
+        """Minutes for Newton's law with constant k to go from current to target."""
+        diff_current = ambient - current_temp
+        diff_target = ambient - target_temp
         
         if diff_current <= 0 or diff_target <= 0:
             return 0.0
@@ -332,14 +1106,9 @@ class CookingCalculator:
             ratio = diff_target / diff_current
             if ratio <= 0:
                 return None
-            remaining_minutes = -math.log(ratio) / k
+            return -math.log(ratio) / k
         except (ValueError, ZeroDivisionError):
             return None
-        
-        if remaining_minutes < 0 or remaining_minutes > 1440:
-            return None
-        
-        return round(remaining_minutes, 1)
     
     def _estimate_ambient_from_curve(
         self,
@@ -484,14 +1253,12 @@ class CookingCalculator:
         
         Where k is the heating constant calculated from historical data.
         """
-        if len(temp_history) < self._min_history_points:
+        if len(temp_history) < self._min_points:
             return None
 
         # We need at least 2 points to estimate k
         # Get recent points
-        now = temp_history[-1][0]
-        cutoff = now - timedelta(minutes=self._history_window_minutes)
-        recent_data = [(t, v) for t, v in temp_history if t > cutoff]
+        recent_data = recent_window(temp_history, self._window_minutes)
 
         if len(recent_data) < 2:
             return None
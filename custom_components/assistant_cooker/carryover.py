@@ -0,0 +1,220 @@
+"""Carryover calibration from archived cooks.
+
+The withdrawal temperature is the desired temperature minus the expected
+carryover (the rise of the core after removal). The expected carryover is
+
+    coefficient[carryover type] × rate factor × ambient factor
+
+capped to CARRYOVER_MAX_C, where the rate factor is the heating rate at
+withdrawal relative to CARRYOVER_BASE_RATE and the ambient factor grows with
+the cooking temperature. The coefficients start from the hand-picked
+CARRYOVER_TYPE_WEIGHTS and are refitted from the archived done sessions: each
+session gives the observed rise (peak during the rest, which the archive takes
+from the hour of history kept after DONE, minus the probe temperature at
+withdrawal) and the rate and ambient factors at withdrawal. Per type, the
+coefficient is a least-squares fit through the origin, shrunk towards the
+default weight so a few sessions only move it part of the way.
+
+Fitting runs as a background batch in the executor
+(CarryoverCalibration.async_refit) and compiles a {type: coefficient} table
+cached in a Store, so the coordinator's per-tick lookup is one dict access.
+No Home Assistant imports.
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    CARRYOVER_BASE_RATE,
+    CARRYOVER_BASELINE_C,
+    CARRYOVER_MAX_C,
+    CARRYOVER_TYPE_WEIGHTS,
+)
+from .food_data import get_carryover_type
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.storage import Store
+
+    from .archive import SessionArchive
+
+_LOGGER = logging.getLogger(__name__)
+
+_timestamp = itemgetter(0)
+_RATE_WINDOW = timedelta(minutes=3)  # Heating rate at withdrawal
+_MIN_REST = timedelta(minutes=5)  # Rest trace needed to see the peak
+_PROBE_PULLED_DROP = 10.0  # °C below the withdrawal temperature: probe removed from the meat
+
+
+def rate_factor(heating_rate: float) -> float:
+    """Return the heating-rate factor (faster heating stores more energy)."""
+    return min(3.0, max(0.3, heating_rate / CARRYOVER_BASE_RATE))
+
+
+def ambient_factor(ambient_temp: float | None) -> float:
+    """Return the cooking-temperature factor (1 without an oven-range ambient)."""
+    if ambient_temp is None or ambient_temp <= 100:
+        return 1.0
+    # 100°C -> 0.75, 200°C -> 1.0, 300°C -> 1.25
+    return min(1.5, max(0.5, 0.5 + ambient_temp / 400))
+
+
+def observe_session(
+    temp_trace: list[tuple[datetime, float]],
+    ambient_trace: list[tuple[datetime, float]],
+    done_time: datetime,
+) -> tuple[float, float, float | None] | None:
+    """
+    Return (observed rise, heating rate, ambient) at withdrawal (None if unusable).
+
+    Sessions whose rest is too short, or where the probe was pulled out of the
+    meat (sharp drop after DONE), are left out.
+    """
+    split = bisect.bisect_right(temp_trace, done_time, key=_timestamp)
+    cooking, resting = temp_trace[:split], temp_trace[split:]
+    if len(cooking) < 3 or not resting or resting[-1][0] - done_time < _MIN_REST:
+        return None
+    done_temp = cooking[-1][1]
+    if min(temp for _, temp in resting) < done_temp - _PROBE_PULLED_DROP:
+        return None
+
+    # Heating rate: least-squares slope over the last minutes before withdrawal
+    window = [point for point in cooking if done_time - point[0] <= _RATE_WINDOW]
+    if len(window) < 3:
+        return None
+    times = [(timestamp - window[0][0]).total_seconds() / 60 for timestamp, _ in window]
+    mean_t = sum(times) / len(times)
+    mean_v = sum(temp for _, temp in window) / len(window)
+    denominator = sum((t - mean_t) ** 2 for t in times)
+    if denominator <= 0:
+        return None
+    heating_rate = sum((t - mean_t) * (temp - mean_v) for t, (_, temp) in zip(times, window)) / denominator
+    if heating_rate < 0.01:
+        return None
+
+    ambients = [temp for timestamp, temp in ambient_trace if done_time - timestamp <= _RATE_WINDOW and timestamp <= done_time]
+    ambient = sum(ambients) / len(ambients) if ambients else None
+    rise = max(0.0, max(temp for _, temp in resting) - done_temp)
+    return rise, heating_rate, ambient
+
+
+def fit_coefficients(
+    sessions: list[dict[str, Any]],
+    prior_sessions: float = 3.0,
+) -> dict[str, dict[str, float]]:
+    """
+    Return {type: {"coefficient", "sessions"}} fitted from archived done sessions.
+
+    The fit is shrunk towards the default weight as if prior_sessions more
+    sessions had matched it exactly.
+    """
+    samples: dict[str, list[tuple[float, float]]] = defaultdict(list)
+    for session in sessions:
+        if session["done_time"] is None:
+            continue
+        observed = observe_session(session["temp_trace"], session["ambient_trace"], session["done_time"])
+        if observed is None:
+            continue
+        rise, heating_rate, ambient = observed
+        shape = CARRYOVER_BASELINE_C * rate_factor(heating_rate) * ambient_factor(ambient)
+        carryover_type = get_carryover_type(session["food_category"], session["food_type"])
+        samples[carryover_type].append((shape, rise))
+
+    table = {}
+    for carryover_type, points in samples.items():
+        default = CARRYOVER_BASELINE_C * CARRYOVER_TYPE_WEIGHTS.get(carryover_type, 1.0)
+        sxx = sum(shape * shape for shape, _ in points)
+        sxy = sum(shape * rise for shape, rise in points)
+        # Virtual sessions at the default weight (same mean shape as the real ones)
+        prior = prior_sessions * sxx / len(points)
+        weight = (sxy + prior * default / CARRYOVER_BASELINE_C) / (sxx + prior)
+        table[carryover_type] = {
+            "coefficient": CARRYOVER_BASELINE_C * min(4.0, max(0.0, weight)),
+            "sessions": len(points),
+        }
+    return table
+
+
+class CarryoverCalibration:
+    """Compiled carryover coefficients and background refit."""
+
+    def __init__(
+        self,
+        data: dict[str, Any] | None = None,
+        store: Store | None = None,
+        max_sessions: int | None = None,
+    ) -> None:
+        """Initialize from cached data ({"types", "sessions", "fitted_at"}) saved to store."""
+        data = data or {}
+        self._store = store
+        self._max_sessions = max_sessions
+        self._fitted: dict[str, dict[str, float]] = data.get("types", {})
+        self.sessions: int = data.get("sessions", 0)  # Archived sessions read by the last fit
+        self.fitted_at: str | None = data.get("fitted_at")
+        self._coefficients: dict[str, float] = {}
+        self._compile()
+        self._refitting = False
+        self._refit_pending = False
+
+    def _compile(self) -> None:
+        """Build the per-type lookup table: fitted coefficients over the defaults."""
+        self._coefficients = {
+            carryover_type: CARRYOVER_BASELINE_C * weight for carryover_type, weight in CARRYOVER_TYPE_WEIGHTS.items()
+        }
+        for carryover_type, fitted in self._fitted.items():
+            self._coefficients[carryover_type] = fitted["coefficient"]
+        self._default = self._coefficients.get("other", CARRYOVER_BASELINE_C)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cacheable form of the fit."""
+        return {"types": self._fitted, "sessions": self.sessions, "fitted_at": self.fitted_at}
+
+    def coefficient(self, carryover_type: str) -> float:
+        """Return the carryover (°C) of a type at the reference rate and ambient."""
+        return self._coefficients.get(carryover_type, self._default)
+
+    def fitted_sessions(self, carryover_type: str) -> int:
+        """Return the number of sessions behind a type's coefficient (0: default)."""
+        fitted = self._fitted.get(carryover_type)
+        return int(fitted["sessions"]) if fitted else 0
+
+    def carryover(self, carryover_type: str, heating_rate: float, ambient_temp: float | None) -> float:
+        """Return the expected carryover (°C) for the current heating rate and ambient."""
+        carryover = self.coefficient(carryover_type) * rate_factor(heating_rate) * ambient_factor(ambient_temp)
+        return min(CARRYOVER_MAX_C, max(0.0, carryover))
+
+    async def async_refit(self, hass: HomeAssistant, archive: SessionArchive) -> None:
+        """Refit the coefficients from the archive in the executor and cache them (one run at a time)."""
+        if self._refitting:
+            self._refit_pending = True
+            return
+        self._refitting = True
+        try:
+            while True:
+                self._refit_pending = False
+                try:
+                    fitted, sessions = await hass.async_add_executor_job(self._fit_archive, archive)
+                except Exception as e:  # Keep the cached coefficients
+                    _LOGGER.warning("Failed to fit carryover coefficients: %s", e)
+                    return
+                self._fitted = fitted
+                self.sessions = sessions
+                self.fitted_at = datetime.now().astimezone().isoformat()
+                self._compile()
+                if self._store is not None:
+                    await self._store.async_save(self.as_dict())
+                _LOGGER.debug("Fitted carryover coefficients for %s types from %s sessions", len(fitted), sessions)
+                if not self._refit_pending:
+                    return
+        finally:
+            self._refitting = False
+
+    def _fit_archive(self, archive: SessionArchive) -> tuple[dict[str, dict[str, float]], int]:
+        """Read the latest done sessions and fit the coefficients (runs in the executor)."""
+        sessions = list(archive.iter_sessions(outcome="done", limit=self._max_sessions))
+        return fit_coefficients(sessions), len(sessions)
@@ -0,0 +1,317 @@
+"""1-D heat-conduction model of the food core.
+
+The exponential models treat the food as a single lumped mass, which breaks
+down for thick roasts where the core lags the surface. This solves
+
+    ∂T/∂t = α · (∂²T/∂r² + (m/r) · ∂T/∂r)
+
+on the half-thickness of a slab (m=0), cylinder (m=1) or sphere (m=2), with
+symmetry at the core and a convective boundary −∂T/∂r = H · (T_surface − Ta).
+The probe measures the core node.
+
+Backward Euler on a fixed node grid: each step is T' = M·T + c·Ta with
+M = (I − αΔt·L)⁻¹. With NumPy, M and c are precomputed per step size and a
+step is one matrix-vector product; without NumPy, the tridiagonal system is
+solved with the Thomas algorithm (O(nodes) per step).
+
+The effective diffusivity is calibrated online from the probe trace: three
+models with diffusivity multipliers s/ratio, s and s·ratio run side by side,
+and the bank re-centers on a neighbour whose recent core error is clearly
+lower. No Home Assistant imports; updates are meant to run in an executor.
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the Thomas solver is used instead
+    np = None
+
+GEOMETRY_SLAB = "slab"
+GEOMETRY_CYLINDER = "cylinder"
+GEOMETRY_SPHERE = "sphere"
+
+_SHAPE_FACTORS = {GEOMETRY_SLAB: 0, GEOMETRY_CYLINDER: 1, GEOMETRY_SPHERE: 2}
+_ONE_MINUTE = timedelta(minutes=1)
+
+
+class _Stepper:
+    """Backward-Euler step of fixed size for one diffusivity."""
+
+    def __init__(
+        self,
+        shape: int,
+        nodes: int,
+        radius: float,
+        surface_ratio: float,
+        diffusivity: float,
+        step_seconds: float,
+        use_numpy: bool,
+    ) -> None:
+        """Assemble (I − αΔt·L) and, with NumPy, its inverse."""
+        spacing = radius / (nodes - 1)
+        factor = diffusivity * step_seconds / (spacing * spacing)
+        lower = [0.0] * nodes
+        diag = [0.0] * nodes
+        upper = [0.0] * nodes
+
+        # Core: symmetry, Laplacian becomes (1 + m) · 2 (T1 − T0) / h²
+        diag[0] = 1.0 + 2.0 * (1 + shape) * factor
+        upper[0] = -2.0 * (1 + shape) * factor
+        for i in range(1, nodes - 1):
+            curvature = shape / (2.0 * i)
+            lower[i] = -factor * (1.0 - curvature)
+            diag[i] = 1.0 + 2.0 * factor
+            upper[i] = -factor * (1.0 + curvature)
+
+        # Surface: ghost node T_N = T_{N-2} − 2h·H·(T_{N-1} − Ta)
+        last = nodes - 1
+        biot_step = 2.0 * spacing * surface_ratio
+        curvature = shape / (2.0 * last)
+        lower[last] = -2.0 * factor
+        diag[last] = 1.0 + 2.0 * factor + factor * biot_step * (1.0 + curvature)
+        self._ambient_gain = factor * biot_step * (1.0 + curvature)  # Coefficient of Ta
+
+        self._lower, self._diag, self._upper = lower, diag, upper
+        self._nodes = nodes
+        self._matrix = None
+        self._offset = None
+        if use_numpy:
+            a = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+            self._matrix = np.linalg.inv(a)
+            self._offset = self._matrix[:, last] * self._ambient_gain
+
+    def step(self, profile, ambient: float):
+        """Return the profile after one step with the given ambient."""
+        if self._matrix is not None:
+            return self._matrix @ profile + self._offset * ambient
+        return self._thomas(profile, ambient)
+
+    def _thomas(self, profile: list[float], ambient: float) -> list[float]:
+        """Solve the tridiagonal system (pure Python)."""
+        nodes = self._nodes
+        lower, diag, upper = self._lower, self._diag, self._upper
+        rhs = list(profile)
+        rhs[-1] += self._ambient_gain * ambient
+        c_prime = [0.0] * nodes
+        d_prime = [0.0] * nodes
+        c_prime[0] = upper[0] / diag[0]
+        d_prime[0] = rhs[0] / diag[0]
+        for i in range(1, nodes):
+            denominator = diag[i] - lower[i] * c_prime[i - 1]
+            c_prime[i] = upper[i] / denominator if i < nodes - 1 else 0.0
+            d_prime[i] = (rhs[i] - lower[i] * d_prime[i - 1]) / denominator
+        result = [0.0] * nodes
+        result[-1] = d_prime[-1]
+        for i in range(nodes - 2, -1, -1):
+            result[i] = d_prime[i] - c_prime[i] * result[i + 1]
+        return result
+
+
+class ConductionModel:
+    """
+    Core temperature of a slab, cylinder or sphere with online calibration.
+
+    thickness_m is the full thickness (or diameter), diffusivity the nominal
+    thermal diffusivity (m²/s) and surface_ratio H = h/k (1/m) the ratio of
+    the surface heat transfer coefficient to the food conductivity.
+    """
+
+    def __init__(
+        self,
+        geometry: str,
+        thickness_m: float,
+        diffusivity: float,
+        surface_ratio: float,
+        nodes: int = 16,
+        step_seconds: float = 5.0,
+        ratio: float = 1.25,
+        forget_minutes: float = 20.0,
+        recenter_minutes: float = 10.0,
+        min_minutes: float = 10.0,
+        observer_gain: float = 0.1,
+        use_numpy: bool | None = None,
+    ) -> None:
+        """Initialize the model."""
+        if geometry not in _SHAPE_FACTORS:
+            raise ValueError(f"Unknown conduction geometry: {geometry}")
+        if thickness_m <= 0:
+            raise ValueError("Thickness must be positive")
+        self._shape = _SHAPE_FACTORS[geometry]
+        self._radius = thickness_m / 2
+        self._diffusivity = diffusivity
+        self._surface_ratio = surface_ratio
+        self._nodes = nodes
+        self._step_seconds = step_seconds
+        self._ratio = ratio
+        self._forget = forget_minutes
+        self._recenter = recenter_minutes
+        self._min_minutes = min_minutes
+        self._observer_gain = observer_gain
+        self._use_numpy = np is not None if use_numpy is None else use_numpy
+        if self._use_numpy and np is None:
+            raise ValueError("NumPy solver requested but NumPy is not installed")
+
+        # Observer weights: core errors are spread over the inner profile, 1 − (r/R)²
+        weights = [1.0 - (i / (nodes - 1)) ** 2 for i in range(nodes)]
+        self._weights = np.array(weights) if self._use_numpy else weights
+
+        self._scale = 1.0  # Calibrated diffusivity multiplier
+        self._steppers: dict[tuple[float, float], _Stepper] = {}
+        self._profiles: list = []
+        self._errors = [0.0, 0.0, 0.0]
+        self._time: datetime | None = None
+        self._start_time: datetime | None = None
+        self._ambient: float | None = None
+        self._last_recenter: datetime | None = None
+        self.samples = 0
+
+    @property
+    def ready(self) -> bool:
+        """Return True once min_minutes of probe trace have calibrated the bank."""
+        if self._time is None:
+            return False
+        return (self._time - self._start_time) / _ONE_MINUTE >= self._min_minutes
+
+    @property
+    def diffusivity(self) -> float:
+        """Return the calibrated effective diffusivity (m²/s)."""
+        return self._diffusivity * self._scale
+
+    @property
+    def core_temp(self) -> float | None:
+        """Return the modelled core temperature (°C) of the calibrated member."""
+        if not self._profiles:
+            return None
+        return float(self._profiles[1][0])
+
+    @property
+    def surface_temp(self) -> float | None:
+        """Return the modelled surface temperature (°C)."""
+        if not self._profiles:
+            return None
+        return float(self._profiles[1][-1])
+
+    @property
+    def last_time(self) -> datetime | None:
+        """Return the timestamp of the last ingested probe sample."""
+        return self._time
+
+    def ingest(
+        self,
+        temp_samples: list[tuple[datetime, float]],
+        ambient_samples: list[tuple[datetime, float]],
+    ) -> None:
+        """Advance the model bank through new (time-ordered) samples."""
+        ambient_index = 0
+        for timestamp, temp in temp_samples:
+            while ambient_index < len(ambient_samples) and ambient_samples[ambient_index][0] <= timestamp:
+                self._ambient = ambient_samples[ambient_index][1]
+                ambient_index += 1
+            if self._ambient is None:
+                continue
+            if self._time is None:
+                self._start(timestamp, temp)
+                continue
+            steps = round((timestamp - self._time).total_seconds() / self._step_seconds)
+            if steps < 1:
+                continue  # Less than half a step since the last sample
+            forget = math.exp(-((timestamp - self._time) / _ONE_MINUTE) / self._forget)
+            for member in range(3):
+                stepper = self._stepper(self._member_scale(member), self._step_seconds)
+                profile = self._profiles[member]
+                for _ in range(steps):
+                    profile = stepper.step(profile, self._ambient)
+                error = temp - float(profile[0])
+                self._errors[member] = forget * self._errors[member] + error * error
+                self._profiles[member] = self._correct(profile, error)
+            self._time = timestamp
+            self.samples += 1
+            self._maybe_recenter(timestamp)
+        while ambient_index < len(ambient_samples):
+            self._ambient = ambient_samples[ambient_index][1]
+            ambient_index += 1
+
+    def time_to(self, target_temp: float, ambient: float | None = None, max_minutes: float = 1440.0) -> float | None:
+        """
+        Minutes until the modelled core reaches target_temp.
+
+        Ambient is held at the given value (default: last reading). Steps are
+        30 s for the first two hours, then 2 min. None if not reached.
+        """
+        ambient = self._ambient if ambient is None else ambient
+        if not self._profiles or ambient is None or ambient <= target_temp:
+            return None
+        profile = self._profiles[1]
+        core = float(profile[0])
+        if core >= target_temp:
+            return 0.0
+
+        elapsed = 0.0
+        for step_seconds, until in ((30.0, 120.0), (120.0, max_minutes)):
+            stepper = self._stepper(self._scale, step_seconds)
+            step_minutes = step_seconds / 60
+            while elapsed < until:
+                profile = stepper.step(profile, ambient)
+                following = float(profile[0])
+                if following >= target_temp:
+                    fraction = (target_temp - core) / (following - core) if following > core else 1.0
+                    return elapsed + fraction * step_minutes
+                core = following
+                elapsed += step_minutes
+        return None
+
+    def _correct(self, profile, error: float):
+        """Pull the profile towards the measured core (the innovation scores first)."""
+        gain = self._observer_gain * error
+        if self._use_numpy:
+            return profile + gain * self._weights
+        return [value + gain * weight for value, weight in zip(profile, self._weights)]
+
+    def _start(self, timestamp: datetime, temp: float) -> None:
+        """Start from a uniform profile at the first probe reading."""
+        uniform = [temp] * self._nodes
+        if self._use_numpy:
+            self._profiles = [np.array(uniform) for _ in range(3)]
+        else:
+            self._profiles = [list(uniform) for _ in range(3)]
+        self._errors = [0.0, 0.0, 0.0]
+        self._time = timestamp
+        self._start_time = timestamp
+        self._last_recenter = timestamp
+
+    def _member_scale(self, member: int) -> float:
+        """Return the diffusivity multiplier of a bank member (0, 1, 2)."""
+        return self._scale * self._ratio ** (member - 1)
+
+    def _stepper(self, scale: float, step_seconds: float) -> _Stepper:
+        """Return the (cached) stepper for a multiplier and step size."""
+        key = (scale, step_seconds)
+        stepper = self._steppers.get(key)
+        if stepper is None:
+            if len(self._steppers) > 16:
+                self._steppers.clear()
+            stepper = _Stepper(
+                self._shape, self._nodes, self._radius, self._surface_ratio,
+                self._diffusivity * scale, step_seconds, self._use_numpy,
+            )
+            self._steppers[key] = stepper
+        return stepper
+
+    def _maybe_recenter(self, timestamp: datetime) -> None:
+        """Move the bank center to a clearly better neighbour."""
+        if (timestamp - self._last_recenter) / _ONE_MINUTE < self._recenter:
+            return
+        best = min(range(3), key=lambda member: self._errors[member])
+        if best == 1 or self._errors[best] > 0.9 * self._errors[1]:
+            return
+        new_scale = self._member_scale(best)
+        if not 0.25 <= new_scale <= 4.0:
+            return
+        self._scale = new_scale
+        winner = self._profiles[best]
+        self._profiles = [winner.copy() for _ in range(3)]
+        self._errors = [self._errors[best]] * 3
+        self._last_recenter = timestamp
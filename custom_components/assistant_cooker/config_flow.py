@@ -20,6 +20,9 @@ from homeassistant.helpers.selector import (
     SelectSelectorConfig,
     SelectSelectorMode,
     SelectOptionDict,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
 )
 from homeassistant.const import CONF_NAME
 
@@ -34,8 +37,17 @@ from .const import (
     CONF_NOTIFY_VOICE,
     CONF_NOTIFY_5MIN_BEFORE,
     CONF_NOTIFY_DISCONNECT,
+    CONF_ESTIMATION_STRATEGY,
+    CONF_OUTLIER_WINDOW,
+    CONF_RESAMPLE_STEP,
     DEFAULT_NOTIFY_5MIN_BEFORE,
     DEFAULT_NOTIFY_DISCONNECT,
+    DEFAULT_ESTIMATION_STRATEGY,
+    DEFAULT_OUTLIER_WINDOW,
+    DEFAULT_RESAMPLE_STEP,
+    ESTIMATION_STRATEGIES,
+    MAX_OUTLIER_WINDOW,
+    MAX_RESAMPLE_STEP,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,6 +70,34 @@ ANY_SENSOR_SELECTOR = EntitySelector(
 TEXT_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT))
 BOOL_SELECTOR = BooleanSelector()
 
+STRATEGY_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=ESTIMATION_STRATEGIES,
+        mode=SelectSelectorMode.DROPDOWN,
+        translation_key=CONF_ESTIMATION_STRATEGY,
+    )
+)
+
+
+OUTLIER_WINDOW_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=MAX_OUTLIER_WINDOW,
+        step=1,
+        mode=NumberSelectorMode.BOX,
+    )
+)
+
+RESAMPLE_STEP_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=MAX_RESAMPLE_STEP,
+        step=1,
+        mode=NumberSelectorMode.BOX,
+        unit_of_measurement="s",
+    )
+)
+
 
 def get_notify_services(hass, prefix_filter: list[str] | None = None) -> list[SelectOptionDict]:
     """Get available notify services as options for selector."""
@@ -200,6 +240,9 @@ class AssistantCookerOptionsFlow(config_entries.OptionsFlow):
                 ),
                 vol.Optional(CONF_NOTIFY_5MIN_BEFORE, default=data.get(CONF_NOTIFY_5MIN_BEFORE, DEFAULT_NOTIFY_5MIN_BEFORE)): BOOL_SELECTOR,
                 vol.Optional(CONF_NOTIFY_DISCONNECT, default=data.get(CONF_NOTIFY_DISCONNECT, DEFAULT_NOTIFY_DISCONNECT)): BOOL_SELECTOR,
+                vol.Optional(CONF_ESTIMATION_STRATEGY, default=data.get(CONF_ESTIMATION_STRATEGY, DEFAULT_ESTIMATION_STRATEGY)): STRATEGY_SELECTOR,
+                vol.Optional(CONF_OUTLIER_WINDOW, default=data.get(CONF_OUTLIER_WINDOW, DEFAULT_OUTLIER_WINDOW)): OUTLIER_WINDOW_SELECTOR,
+                vol.Optional(CONF_RESAMPLE_STEP, default=data.get(CONF_RESAMPLE_STEP, DEFAULT_RESAMPLE_STEP)): RESAMPLE_STEP_SELECTOR,
             }
         )
 
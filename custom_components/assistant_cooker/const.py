@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from pathlib import Path
 import json
-from typing import Final
+from typing import Any, Final
 
 # Read version from manifest.json
 MANIFEST_PATH = Path(__file__).parent / "manifest.json"
@@ -50,6 +50,76 @@ DEFAULT_NOTIFY_5MIN_BEFORE: Final[bool] = False
 DEFAULT_NOTIFY_DISCONNECT: Final[bool] = False
 DEFAULT_CARRYOVER_COMPENSATION: Final[bool] = True
 
+# Remaining time estimation strategies
+CONF_ESTIMATION_STRATEGY: Final[str] = "estimation_strategy"
+STRATEGY_CASCADE: Final[str] = "cascade"  # Exponential model, linear and early fallbacks
+STRATEGY_KALMAN: Final[str] = "kalman"  # Kalman filter on temperature, rate and k
+STRATEGY_AMBIENT_MODEL: Final[str] = "ambient_model"  # Newton's law on the measured ambient trajectory
+STRATEGY_EXPONENTIAL: Final[str] = "exponential"  # Median heating constant or joint curve fit
+STRATEGY_LINEAR: Final[str] = "linear"  # Heating rate of the last minutes
+STRATEGY_EARLY: Final[str] = "early"  # Average rate since the first sample
+STRATEGY_TWO_POINT: Final[str] = "two_point"  # k from two points and the live ambient
+ESTIMATION_STRATEGIES: Final[list[str]] = [
+    STRATEGY_CASCADE,
+    STRATEGY_KALMAN,
+    STRATEGY_AMBIENT_MODEL,
+    STRATEGY_EXPONENTIAL,
+    STRATEGY_LINEAR,
+    STRATEGY_EARLY,
+    STRATEGY_TWO_POINT,
+]
+DEFAULT_ESTIMATION_STRATEGY: Final[str] = STRATEGY_CASCADE
+
+# Shadow evaluation: the strategies other than the configured one run on the
+# same samples in the executor. One prediction per SHADOW_RECORD_SECONDS is
+# scored against the actual done time when the cook finishes.
+SHADOW_RECORD_SECONDS: Final[int] = 60
+SHADOW_TIME_BUDGET_MS: Final[float] = 200.0
+
+# Estimator dispatch: cheap strategies run inline on the event loop, the others
+# in the executor. A strategy whose jobs overrun the budget ESTIMATOR_MAX_OVERRUNS
+# times in a row is replaced by its fallback for the rest of the session.
+INLINE_STRATEGIES: Final[list[str]] = [STRATEGY_KALMAN, STRATEGY_LINEAR, STRATEGY_EARLY, STRATEGY_TWO_POINT]
+STRATEGY_FALLBACKS: Final[dict[str, str]] = {
+    STRATEGY_CASCADE: STRATEGY_KALMAN,
+    STRATEGY_AMBIENT_MODEL: STRATEGY_KALMAN,
+    STRATEGY_EXPONENTIAL: STRATEGY_KALMAN,
+}
+ESTIMATOR_TIME_BUDGET_MS: Final[float] = 50.0
+ESTIMATOR_MAX_OVERRUNS: Final[int] = 3
+
+# Outlier filter in front of the history and the estimators (streaming.HampelFilter):
+# a probe or ambient reading further than OUTLIER_THRESHOLD scaled MADs from the
+# median of the last CONF_OUTLIER_WINDOW accepted readings (and than the
+# deviation/rate floor) is quarantined; OUTLIER_MAX_QUARANTINE consistent
+# quarantined readings in a row are a level shift and are released
+CONF_OUTLIER_WINDOW: Final[str] = "outlier_window"
+DEFAULT_OUTLIER_WINDOW: Final[int] = 7  # 0 disables the filter
+MAX_OUTLIER_WINDOW: Final[int] = 25
+OUTLIER_THRESHOLD: Final[float] = 3.0
+OUTLIER_MIN_DEVIATION_C: Final[float] = 2.0
+OUTLIER_MAX_RATE: Final[float] = 5.0  # °C/min allowed on top, since the median reading
+OUTLIER_MAX_QUARANTINE: Final[int] = 3
+OUTLIER_MAX_GAP_SECONDS: Final[int] = 120  # Longer silences restart the window
+
+# Uniform grid the estimators and the chart read (streaming.GridResampler): the
+# accepted readings are held until the next one and averaged over fixed
+# CONF_RESAMPLE_STEP buckets; a reading older than RESAMPLE_MAX_GAP_SECONDS is
+# no longer held and the empty buckets become a gap marker
+CONF_RESAMPLE_STEP: Final[str] = "resample_step"
+DEFAULT_RESAMPLE_STEP: Final[int] = 5  # Seconds, 0 passes the readings through
+MAX_RESAMPLE_STEP: Final[int] = 60
+RESAMPLE_MAX_GAP_SECONDS: Final[int] = 120
+
+# Byte budget of the attributes an entity publishes (JSON), the recorder's
+# limit. The state sensor's history attributes get what the other attributes
+# leave (ATTRIBUTES_RESERVE_BYTES), shared by the probe and ambient series: the
+# last HISTORY_MAX_POINTS grid points, thinned to HISTORY_POINT_MAX_BYTES each
+ATTRIBUTES_MAX_BYTES: Final[int] = 16384
+ATTRIBUTES_RESERVE_BYTES: Final[int] = 1024
+HISTORY_MAX_POINTS: Final[int] = 500
+HISTORY_POINT_MAX_BYTES: Final[int] = 48  # ["<isoformat with µs and offset>",-123.4567],
+
 # Update interval in seconds
 UPDATE_INTERVAL: Final[int] = 5
 
@@ -59,6 +129,7 @@ NOTIFICATION_COOLDOWN_DISCONNECT: Final[int] = 300  # 5 minutes
 # Carryover type weights for dynamic calculation (relative factors, not absolute temps)
 # These are used as multipliers in the dynamic carryover calculation
 # Higher values = food retains more heat after removal
+# Defaults: carryover.py refits them from the archived cooks
 CARRYOVER_TYPE_WEIGHTS: Final[dict[str, float]] = {
     "beef_roast": 1.5,      # Large mass, retains a lot of heat
     "beef_steak": 0.8,      # Thin, less heat retention
@@ -72,6 +143,24 @@ CARRYOVER_TYPE_WEIGHTS: Final[dict[str, float]] = {
     "other": 1.0,           # Default baseline
 }
 
+# Conduction model parameters per carryover type (see conduction.py)
+# geometry: shape of the piece, thickness = full thickness or diameter
+# diffusivity: nominal thermal diffusivity of the meat (m²/s), calibrated online
+# surface_ratio: surface heat transfer coefficient / conductivity (1/m)
+CONDUCTION_PARAMETERS: Final[dict[str, dict[str, Any]]] = {
+    "beef_roast": {"geometry": "cylinder", "diffusivity": 1.35e-7, "surface_ratio": 45.0},
+    "beef_steak": {"geometry": "slab", "diffusivity": 1.35e-7, "surface_ratio": 45.0},
+    "pork_roast": {"geometry": "cylinder", "diffusivity": 1.30e-7, "surface_ratio": 45.0},
+    "pork_other": {"geometry": "slab", "diffusivity": 1.30e-7, "surface_ratio": 45.0},
+    "poultry": {"geometry": "sphere", "diffusivity": 1.40e-7, "surface_ratio": 40.0},
+    "fish": {"geometry": "slab", "diffusivity": 1.40e-7, "surface_ratio": 50.0},
+    "lamb_roast": {"geometry": "cylinder", "diffusivity": 1.35e-7, "surface_ratio": 45.0},
+    "lamb_other": {"geometry": "slab", "diffusivity": 1.35e-7, "surface_ratio": 45.0},
+    "veal": {"geometry": "cylinder", "diffusivity": 1.35e-7, "surface_ratio": 45.0},
+    "other": {"geometry": "slab", "diffusivity": 1.35e-7, "surface_ratio": 45.0},
+}
+MAX_THICKNESS_CM: Final[float] = 30.0
+
 # Sensor attributes
 ATTR_RAW_TARGET: Final[str] = "raw_target"
 ATTR_CATEGORY: Final[str] = "category"
@@ -79,6 +168,26 @@ ATTR_TREND: Final[str] = "trend"
 ATTR_TOTAL_ESTIMATED: Final[str] = "total_estimated"
 ATTR_DESIRED_TEMP: Final[str] = "desired_temp"
 ATTR_IS_MANUAL: Final[str] = "is_manual"
+ATTR_SPREAD: Final[str] = "spread"
+ATTR_HEATING_CONSTANT: Final[str] = "heating_constant"
+ATTR_HEATING_CONSTANT_IQR: Final[str] = "heating_constant_iqr"
+ATTR_FITTED_AMBIENT: Final[str] = "fitted_ambient"
+ATTR_FIT_RMS: Final[str] = "fit_rms"
+ATTR_STDDEV: Final[str] = "stddev"
+ATTR_STRATEGY: Final[str] = "strategy"
+ATTR_TREND_RATE: Final[str] = "trend_rate"
+ATTR_FORECAST_PLATEAU: Final[str] = "forecast_plateau"
+ATTR_THICKNESS: Final[str] = "thickness"
+ATTR_CONDUCTION_REMAINING: Final[str] = "conduction_remaining"
+ATTR_CONDUCTION_CORE_TEMP: Final[str] = "conduction_core_temp"
+ATTR_DIFFUSIVITY: Final[str] = "diffusivity"
+ATTR_LOOP_TIME: Final[str] = "loop_time_ms"
+ATTR_ESTIMATOR_TIME: Final[str] = "estimator_time_ms"
+ATTR_ESTIMATOR_OVERRUNS: Final[str] = "estimator_overruns"
+ATTR_SHADOW_TIME: Final[str] = "shadow_time_ms"
+ATTR_PRIOR_REMAINING: Final[str] = "prior_remaining"
+ATTR_METRICS_SINCE: Final[str] = "since"
+ATTR_OUTLIERS: Final[str] = "outliers"
 
 # Trend values
 TREND_INCREASING: Final[str] = "increasing"
@@ -87,6 +196,8 @@ TREND_DECREASING: Final[str] = "decreasing"
 
 # Carryover calculation parameters
 CARRYOVER_BASE_RATE: Final[float] = 1.0  # °C/min reference heating rate
+CARRYOVER_BASELINE_C: Final[float] = 2.0  # °C carryover at the reference rate (weight 1)
+CARRYOVER_MAX_C: Final[float] = 8.0
 AMBIENT_AFTER_REMOVAL: Final[float] = 22.0  # Room temperature °C
 
 # Storage keys for persistent data
@@ -97,3 +208,44 @@ STORAGE_KEY_FOOD_TYPE: Final[str] = "food_type"
 STORAGE_KEY_FOOD_DONENESS: Final[str] = "food_doneness"
 STORAGE_KEY_DESIRED_TEMP: Final[str] = "desired_temp"
 STORAGE_KEY_IS_MANUAL_MODE: Final[str] = "is_manual_mode"
+STORAGE_KEY_ACTIVE_COOK: Final[str] = "active_cook"
+STORAGE_KEY_THICKNESS: Final[str] = "thickness_cm"
+STORAGE_KEY_ESTIMATOR_SCORES: Final[str] = "estimator_scores"
+
+# Active cooks older than this are not restored after a restart
+ACTIVE_COOK_MAX_AGE_HOURS: Final[int] = 24
+
+# Recorder backfill retried after a failed query (recorder still starting)
+BACKFILL_RETRY_SECONDS: Final[int] = 30
+BACKFILL_MAX_RETRIES: Final[int] = 20
+
+# Session archive: SQLite database in the HA config directory, shared by all
+# entries (hass.data[DATA_ARCHIVE]); traces are downsampled before storage
+ARCHIVE_FILENAME: Final[str] = "assistant_cooker.db"
+ARCHIVE_TRACE_SECONDS: Final[int] = 30
+ARCHIVE_PAGE_SIZE: Final[int] = 50
+ARCHIVE_MAX_PAGE_SIZE: Final[int] = 500
+DATA_ARCHIVE: Final[str] = f"{DOMAIN}_archive"
+
+# Heating priors fitted from the archived done sessions (hass.data[DATA_PRIORS],
+# cached in their own Store); the live estimate takes over from the prior
+# linearly over the first PRIOR_BLEND_MINUTES of a cook
+PRIORS_STORAGE_KEY: Final[str] = f"{DOMAIN}.priors"
+PRIOR_MIN_SESSIONS: Final[int] = 2
+PRIOR_MAX_SESSIONS: Final[int] = 500
+PRIOR_BLEND_MINUTES: Final[float] = 10.0
+DATA_PRIORS: Final[str] = f"{DOMAIN}_priors"
+
+# Carryover coefficients fitted from the archived done sessions
+# (hass.data[DATA_CARRYOVER], cached in their own Store)
+CARRYOVER_STORAGE_KEY: Final[str] = f"{DOMAIN}.carryover"
+CARRYOVER_MAX_SESSIONS: Final[int] = 500
+DATA_CARRYOVER: Final[str] = f"{DOMAIN}_carryover"
+
+# Decision trace ring buffer per entry (tracing.py), enabled from the websocket
+TRACE_BUFFER_SIZE: Final[int] = 500
+
+# Replay bundle of the config entry diagnostics: full-resolution traces as
+# lossless codec series (base64), read by scripts/replay_diagnostics.py
+REPLAY_BUNDLE_VERSION: Final[int] = 3
+REPLAY_TIME_RESOLUTION_MS: Final[int] = 1
@@ -1,20 +1,30 @@
 """Data coordinator for Assistant Cooker integration."""
 from __future__ import annotations
 
+import base64
+import bisect
 import logging
+import math
+import time
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any
 
+from homeassistant.components.recorder import get_instance, history
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    ATTRIBUTES_MAX_BYTES,
+    ATTRIBUTES_RESERVE_BYTES,
+    HISTORY_MAX_POINTS,
+    HISTORY_POINT_MAX_BYTES,
     CONF_PROBE_SENSOR,
     CONF_AMBIENT_SENSOR,
     CONF_BATTERY_SENSOR,
@@ -24,18 +34,34 @@ from .const import (
     CONF_NOTIFY_VOICE,
     CONF_NOTIFY_5MIN_BEFORE,
     CONF_NOTIFY_DISCONNECT,
+    CONF_ESTIMATION_STRATEGY,
+    CONF_OUTLIER_WINDOW,
+    CONF_RESAMPLE_STEP,
+    INLINE_STRATEGIES,
+    STRATEGY_FALLBACKS,
+    ESTIMATOR_TIME_BUDGET_MS,
+    ESTIMATOR_MAX_OVERRUNS,
+    ESTIMATION_STRATEGIES,
+    SHADOW_RECORD_SECONDS,
+    SHADOW_TIME_BUDGET_MS,
     STATE_DISCONNECTED,
     STATE_IDLE,
     STATE_COOKING,
     STATE_DONE,
     UPDATE_INTERVAL,
     NOTIFICATION_COOLDOWN_DISCONNECT,
-    CARRYOVER_TYPE_WEIGHTS,
-    CARRYOVER_BASE_RATE,
-    AMBIENT_AFTER_REMOVAL,
+    CONDUCTION_PARAMETERS,
     DEFAULT_NOTIFY_5MIN_BEFORE,
     DEFAULT_NOTIFY_DISCONNECT,
     DEFAULT_CARRYOVER_COMPENSATION,
+    DEFAULT_ESTIMATION_STRATEGY,
+    DEFAULT_OUTLIER_WINDOW,
+    DEFAULT_RESAMPLE_STEP,
+    OUTLIER_THRESHOLD,
+    OUTLIER_MIN_DEVIATION_C,
+    OUTLIER_MAX_RATE,
+    OUTLIER_MAX_QUARANTINE,
+    OUTLIER_MAX_GAP_SECONDS,
     STORAGE_KEY_CARRYOVER_ENABLED,
     STORAGE_KEY_MANUAL_TEMP,
     STORAGE_KEY_FOOD_CATEGORY,
@@ -43,14 +69,56 @@ from .const import (
     STORAGE_KEY_FOOD_DONENESS,
     STORAGE_KEY_DESIRED_TEMP,
     STORAGE_KEY_IS_MANUAL_MODE,
+    STORAGE_KEY_ACTIVE_COOK,
+    STORAGE_KEY_THICKNESS,
+    STORAGE_KEY_ESTIMATOR_SCORES,
+    ACTIVE_COOK_MAX_AGE_HOURS,
+    BACKFILL_MAX_RETRIES,
+    BACKFILL_RETRY_SECONDS,
+    DATA_ARCHIVE,
+    DATA_PRIORS,
+    DATA_CARRYOVER,
+    PRIOR_BLEND_MINUTES,
+    REPLAY_BUNDLE_VERSION,
+    RESAMPLE_MAX_GAP_SECONDS,
+    REPLAY_TIME_RESOLUTION_MS,
+    TRACE_BUFFER_SIZE,
 )
+from .archive import SessionArchive
 from .calculations import CookingCalculator
+from .carryover import CarryoverCalibration
+from .codec import encode_series
+from .conduction import ConductionModel
+from .priors import HeatingPriors
+from .shadow import ShadowEvaluator, merge_scores, summarize
+from .streaming import GridResampler, HampelFilter, HoldCompressor
+from .metrics import (
+    HotPathMetrics,
+    STAGE_CARRYOVER,
+    STAGE_ENTITY_WRITE,
+    STAGE_ESTIMATOR,
+    STAGE_FILTER,
+    STAGE_HISTORY,
+    STAGE_SERIALIZATION,
+    STAGE_STATE_MACHINE,
+)
+from .tracing import (
+    DecisionTrace,
+    TRACE_KIND_CARRYOVER,
+    TRACE_KIND_FALLBACK,
+    TRACE_KIND_OUTLIER,
+    TRACE_KIND_REMAINING,
+    TRACE_KIND_WITHDRAWAL,
+)
 from .food_data import get_temperature, get_carryover_type, is_manual_mode, MANUAL_CATEGORY, MANUAL_FOOD, MANUAL_DONENESS
 
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 1
 
+_timestamp = itemgetter(0)
+_DEFAULT_CARRYOVER = CarryoverCalibration()  # Hand-picked weights, until setup provides the fitted table
+
 
 class AssistantCookerCoordinator(DataUpdateCoordinator):
     """Coordinator for Assistant Cooker data."""
@@ -66,7 +134,9 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
 
         self.entry = entry
         self.config = entry.data
-        self._calculator = CookingCalculator()
+        self._calculator = CookingCalculator(
+            strategy=self.config.get(CONF_ESTIMATION_STRATEGY, DEFAULT_ESTIMATION_STRATEGY),
+        )
         self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
         self._stored_data: dict[str, Any] = {}
 
@@ -98,9 +168,40 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         self._food_type: str = "steak"
         self._food_doneness: str = "medium"
 
-        # Temperature history for calculations (kept even outside cooking for graph)
+        # Optional thickness of the piece (persistent), enables the conduction model
+        self._thickness_cm: float | None = None
+
+        # Accepted readings (kept even outside cooking): archive, replay bundle,
+        # backfill. Repeats of the held value are compressed away on the way in
+        # (lossless for the grid); every reading is kept without a grid
         self._temp_history: list[tuple[datetime, float]] = []
         self._ambient_history: list[tuple[datetime, float]] = []
+        # Same readings on a uniform grid, read by the estimators and the chart;
+        # gap markers (times where the readings stopped) are kept aside
+        resample_step = float(self.config.get(CONF_RESAMPLE_STEP, DEFAULT_RESAMPLE_STEP))
+        self._probe_resampler = self._create_resampler(resample_step)
+        self._ambient_resampler = self._create_resampler(resample_step)
+        self._probe_compressor = HoldCompressor(RESAMPLE_MAX_GAP_SECONDS) if self._probe_resampler else None
+        self._ambient_compressor = HoldCompressor(RESAMPLE_MAX_GAP_SECONDS) if self._ambient_resampler else None
+        self._temp_grid: list[tuple[datetime, float]] = []
+        self._ambient_grid: list[tuple[datetime, float]] = []
+        self._temp_gaps: list[datetime] = []
+        self._ambient_gaps: list[datetime] = []
+        self._grid_points: int = 0  # Probe grid points completed this tick
+        # isoformat() strings of the last serialized points (frontend history)
+        self._temp_iso_cache: dict[datetime, str] = {}
+        self._ambient_iso_cache: dict[datetime, str] = {}
+
+        # Outlier filters in front of the history, the state machine and the
+        # estimators (_filter_readings): readings of this tick that passed, and
+        # the last accepted values (None while the sensor is unavailable)
+        outlier_window = int(self.config.get(CONF_OUTLIER_WINDOW, DEFAULT_OUTLIER_WINDOW))
+        self._probe_filter = self._create_outlier_filter(outlier_window)
+        self._ambient_filter = self._create_outlier_filter(outlier_window)
+        self._probe_samples: list[tuple[datetime, float]] = []
+        self._ambient_samples: list[tuple[datetime, float]] = []
+        self._probe_temp: float | None = None
+        self._ambient_temp: float | None = None
 
         # Notification flags
         self._notified_5min: bool = False
@@ -108,6 +209,49 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         self._last_disconnect_notification: datetime | None = None
         self._disconnect_start: datetime | None = None
 
+        # Recorder backfill: (start, end) of a period the coordinator did not see live
+        self._history_gap: tuple[datetime, datetime] | None = None
+        self._backfill_running: bool = False
+        self._backfill_retries: int = 0
+        self._cancel_backfill_retry = None
+        entry.async_on_unload(self._unschedule_backfill_retry)
+
+        # Estimator dispatch: cheap strategies inline, expensive ones in the executor.
+        # Catch-up work (priming, strategy switch) always goes to the executor.
+        self._estimate: dict[str, Any] | None = None  # Last calculator output
+        self._estimate_running: bool = False
+        self._estimate_generation: int = 0  # Bumped when a running job becomes stale
+        self._prime_pending: bool = False
+        self._pending_strategy: str | None = None
+        self._estimator_overruns: int = 0  # Consecutive jobs over the time budget
+        self._estimator_time_ms: float | None = None
+        self._loop_time_ms: float | None = None
+        # Hot-path stage histograms, recording while the metrics sensor is enabled
+        self.metrics = HotPathMetrics()
+        # Estimator and carryover decisions, shared with the calculator (off until enabled)
+        self.trace = DecisionTrace(TRACE_BUFFER_SIZE)
+        self._calculator.trace = self.trace
+        self._conduction_overruns: int = 0
+        self._conduction_disabled: bool = False  # Until the next cook
+
+        # Conduction model: advanced in the executor, one job at a time
+        self._conduction: ConductionModel | None = None
+        self._conduction_cursor: datetime | None = None
+        self._conduction_ambient_cursor: datetime | None = None
+        self._conduction_running: bool = False
+        self._conduction_result: dict[str, Any] | None = None
+        self._segment_start: datetime | None = None  # Calculator change point the model starts from
+
+        # Shadow evaluation of the other strategies: executor, one job at a time
+        self._shadow: ShadowEvaluator | None = None
+        self._shadow_running: bool = False
+        self._shadow_prime_pending: bool = False
+        self._shadow_overruns: int = 0
+        self._shadow_disabled: bool = False  # Until the next cook
+        self._shadow_time_ms: float | None = None
+        self._estimator_scores: dict[str, dict[str, float]] = {}  # Totals over all cooks (persistent)
+        self._last_cook_scores: dict[str, dict[str, Any]] | None = None
+
         # Set up state listeners
         self._setup_listeners()
 
@@ -123,6 +267,9 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
             self._food_doneness = data.get(STORAGE_KEY_FOOD_DONENESS, "medium")
             self._desired_temp = data.get(STORAGE_KEY_DESIRED_TEMP, 57.0)
             self._is_manual_mode = data.get(STORAGE_KEY_IS_MANUAL_MODE, False)
+            self._thickness_cm = data.get(STORAGE_KEY_THICKNESS)
+            self._estimator_scores = data.get(STORAGE_KEY_ESTIMATOR_SCORES, {})
+            self._restore_active_cook(data.get(STORAGE_KEY_ACTIVE_COOK))
             # Recalculate withdrawal temp based on loaded data
             self._update_withdrawal_temp()
             _LOGGER.debug("Loaded stored data: carryover=%s, manual_temp=%s, category=%s, food=%s, doneness=%s, desired_temp=%s, manual_mode=%s", 
@@ -138,8 +285,49 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         self._stored_data[STORAGE_KEY_FOOD_DONENESS] = self._food_doneness
         self._stored_data[STORAGE_KEY_DESIRED_TEMP] = self._desired_temp
         self._stored_data[STORAGE_KEY_IS_MANUAL_MODE] = self._is_manual_mode
+        self._stored_data[STORAGE_KEY_THICKNESS] = self._thickness_cm
+        self._stored_data[STORAGE_KEY_ESTIMATOR_SCORES] = self._estimator_scores
+        self._stored_data[STORAGE_KEY_ACTIVE_COOK] = self._active_cook_data()
         await self._store.async_save(self._stored_data)
 
+    def _active_cook_data(self) -> dict[str, Any] | None:
+        """Return the running cook as a serializable dict (None when not cooking)."""
+        if self._state not in (STATE_COOKING, STATE_DONE) or self._start_time is None:
+            return None
+        return {
+            "start_time": self._start_time.isoformat(),
+            "start_probe_temp": self._start_probe_temp,
+            "start_ambient_temp": self._start_ambient_temp,
+            "cooking_end_time": self._cooking_end_time.isoformat() if self._cooking_end_time else None,
+            "notified_5min": self._notified_5min,
+            "notified_done": self._notified_done,
+        }
+
+    def _restore_active_cook(self, active_cook: dict[str, Any] | None) -> None:
+        """Resume a cook that was running when the integration was unloaded."""
+        if not active_cook:
+            return
+
+        start_time = dt_util.parse_datetime(active_cook.get("start_time") or "")
+        if start_time is None:
+            return
+        now = dt_util.utcnow()
+        if now - start_time > timedelta(hours=ACTIVE_COOK_MAX_AGE_HOURS):
+            return
+
+        end_time = dt_util.parse_datetime(active_cook.get("cooking_end_time") or "")
+        self._state = STATE_DONE if end_time else STATE_COOKING
+        self._start_time = start_time
+        self._start_probe_temp = active_cook.get("start_probe_temp")
+        self._start_ambient_temp = active_cook.get("start_ambient_temp")
+        self._cooking_end_time = end_time
+        self._notified_5min = active_cook.get("notified_5min", False)
+        self._notified_done = active_cook.get("notified_done", False)
+
+        # Everything since the start of the cook has to come from the recorder
+        self._history_gap = (start_time - timedelta(minutes=1), now)
+        _LOGGER.debug("Restored active cook started at %s (state=%s)", start_time, self._state)
+
     def _setup_listeners(self) -> None:
         """Set up state change listeners for source sensors."""
         entities_to_track = [self.config[CONF_PROBE_SENSOR]]
@@ -152,7 +340,11 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         @callback
         def async_state_changed_listener(event) -> None:
             """Handle state changes."""
-            self.async_set_updated_data(self._build_data())
+            data = self._build_data()
+            mark = self.metrics.clock()
+            self.async_set_updated_data(data)
+            self.metrics.lap(STAGE_ENTITY_WRITE, mark)
+            self.metrics.record_latency(event.time_fired.timestamp())
 
         self.entry.async_on_unload(
             async_track_state_change_event(
@@ -197,6 +389,117 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         """Check if probe is connected based on probe temperature availability."""
         return self._is_sensor_available(self.config[CONF_PROBE_SENSOR])
 
+    @staticmethod
+    def _create_outlier_filter(window: int) -> HampelFilter:
+        """Return an outlier filter for a source sensor (window 0 passes every reading)."""
+        return HampelFilter(
+            window=window,
+            threshold=OUTLIER_THRESHOLD,
+            min_deviation=OUTLIER_MIN_DEVIATION_C,
+            max_rate=OUTLIER_MAX_RATE,
+            max_quarantine=OUTLIER_MAX_QUARANTINE,
+            max_gap_seconds=OUTLIER_MAX_GAP_SECONDS,
+        )
+
+    @staticmethod
+    def _create_resampler(step: float) -> GridResampler | None:
+        """Return the grid resampler of a source sensor (None for a step of 0: readings as they come)."""
+        if step <= 0:
+            return None
+        return GridResampler(step, RESAMPLE_MAX_GAP_SECONDS)
+
+    @staticmethod
+    def _resample(
+        resampler: GridResampler | None,
+        samples: list[tuple[datetime, float]],
+        grid: list[tuple[datetime, float]],
+        gaps: list[datetime],
+    ) -> int:
+        """Append the grid points completed by samples (gap markers to gaps); return how many."""
+        if resampler is None:
+            grid.extend(samples)
+            return len(samples)
+        return resampler.extend(samples, grid, gaps)
+
+    @staticmethod
+    def _compress(
+        compressor: HoldCompressor | None,
+        samples: list[tuple[datetime, float]],
+        history: list[tuple[datetime, float]],
+    ) -> None:
+        """Append readings to a history, compressed when there is a compressor."""
+        if compressor is None:
+            history.extend(samples)
+        else:
+            compressor.extend(history, samples)
+
+    def _rebuild_grids(self) -> None:
+        """Resample the whole probe and ambient histories again (after a backfill merged older readings)."""
+        for resampler, compressor, readings, grid, gaps in (
+            (self._probe_resampler, self._probe_compressor, self._temp_history, self._temp_grid, self._temp_gaps),
+            (
+                self._ambient_resampler, self._ambient_compressor,
+                self._ambient_history, self._ambient_grid, self._ambient_gaps,
+            ),
+        ):
+            if resampler is not None:
+                resampler.reset()
+            if compressor is not None:
+                compressor.reset()  # Its tail may no longer follow its run
+            grid.clear()
+            gaps.clear()
+            self._resample(resampler, readings, grid, gaps)
+
+    def _filter_readings(self) -> None:
+        """Run the probe and ambient readings of this tick through the outlier filters."""
+        now = dt_util.utcnow()
+        self._grid_points = 0
+        self._probe_samples, self._probe_temp = self._filter_reading(
+            "probe", self.config[CONF_PROBE_SENSOR], self._probe_filter, self._probe_temp, now
+        )
+        self._ambient_samples, self._ambient_temp = self._filter_reading(
+            "ambient", self.config.get(CONF_AMBIENT_SENSOR), self._ambient_filter, self._ambient_temp, now
+        )
+
+    def _filter_reading(
+        self,
+        source: str,
+        entity_id: str | None,
+        sample_filter: HampelFilter,
+        accepted: float | None,
+        now: datetime,
+    ) -> tuple[list[tuple[datetime, float]], float | None]:
+        """Return the readings to append to the history and the last accepted value of a sensor."""
+        value = self._get_sensor_value(entity_id)
+        if value is None:
+            return [], None
+        seen = sample_filter.samples
+        # Ticks also run on other sensors and on the update interval: last_updated
+        # tells a new reading from the same one seen again
+        samples = sample_filter.add(now, value, self.hass.states.get(entity_id).last_updated)
+        if self.trace.enabled and sample_filter.samples != seen and len(samples) != 1:
+            self.trace.record(
+                TRACE_KIND_OUTLIER,
+                source=source,
+                action="released" if samples else "quarantined",
+                value=value,
+                reference=sample_filter.reference,
+                limit=round(sample_filter.limit, 3) if sample_filter.limit is not None else None,
+                count=len(samples) or sample_filter.quarantined,
+            )
+        return samples, samples[-1][1] if samples else accepted
+
+    def outlier_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the settings and counters of the outlier filters."""
+        return {"probe": self._probe_filter.stats(), "ambient": self._ambient_filter.stats()}
+
+    def compression_stats(self) -> dict[str, dict[str, Any] | None]:
+        """Return the counters of the history compressors (None without a grid)."""
+        return {
+            "probe": self._probe_compressor.stats() if self._probe_compressor else None,
+            "ambient": self._ambient_compressor.stats() if self._ambient_compressor else None,
+        }
+
     def _update_state(self) -> None:
         """Update the state machine."""
         probe_connected = self._is_probe_connected()
@@ -205,14 +508,15 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
             if probe_connected:
                 self._state = STATE_IDLE
                 self._disconnect_start = None
+                self._schedule_backfill()
                 
         elif self._state == STATE_IDLE:
             if not probe_connected:
                 self._state = STATE_DISCONNECTED
                 
         elif self._state == STATE_COOKING:
-            # Check if withdrawal temp reached
-            probe_temp = self._get_sensor_value(self.config[CONF_PROBE_SENSOR])
+            # Check if withdrawal temp reached (a quarantined spike does not end the cook)
+            probe_temp = self._probe_temp
             if probe_temp is not None and probe_temp >= self._withdrawal_temp:
                 self._state = STATE_DONE
                 self._cooking_end_time = dt_util.utcnow()
@@ -223,8 +527,10 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
                 if self._disconnect_start is None:
                     self._disconnect_start = dt_util.utcnow()
                 self._maybe_notify_disconnect()
-            else:
+            elif self._disconnect_start is not None:
+                # Probe came back during cooking: recover what the recorder saw meanwhile
                 self._disconnect_start = None
+                self._schedule_backfill()
                 
         elif self._state == STATE_DONE:
             if not probe_connected:
@@ -233,9 +539,11 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
 
     def _handle_cooking_done(self) -> None:
         """Handle when cooking is done."""
+        self._score_estimators()
         if not self._notified_done:
             self._notified_done = True
             self.hass.async_create_task(self._send_notification("done"))
+            self.hass.async_create_task(self.async_save_stored_data())
 
     def _maybe_notify_disconnect(self) -> None:
         """Send disconnect notification if enabled and cooldown passed."""
@@ -257,19 +565,19 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         self._last_disconnect_notification = now
         self.hass.async_create_task(self._send_notification("disconnect"))
 
-    def _check_5min_notification(self) -> None:
-        """Check and send 5-minute notification if needed."""
+    def _check_5min_notification(self, remaining: float | None) -> None:
+        """Check and send 5-minute notification if needed (remaining: this tick's remaining time)."""
         if not self.config.get(CONF_NOTIFY_5MIN_BEFORE, DEFAULT_NOTIFY_5MIN_BEFORE):
             return
         if self._notified_5min:
             return
         if self._state != STATE_COOKING:
             return
-            
-        remaining = self._calculate_remaining_time()
+
         if remaining is not None and remaining <= 5:
             self._notified_5min = True
             self.hass.async_create_task(self._send_notification("5min"))
+            self.hass.async_create_task(self.async_save_stored_data())
 
     async def _send_notification(self, notification_type: str) -> None:
         """Send notification to configured services."""
@@ -340,32 +648,536 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         if self._state != STATE_COOKING:
             return None
             
-        probe_temp = self._get_sensor_value(self.config[CONF_PROBE_SENSOR])
+        probe_temp = self._probe_temp
         if probe_temp is None:
             return None
             
-        ambient_temp = None
-        if self.config.get(CONF_AMBIENT_SENSOR):
-            ambient_temp = self._get_sensor_value(self.config[CONF_AMBIENT_SENSOR])
-        
-        return self._calculator.calculate_remaining_time(
+        conduction_remaining = self._conduction_remaining_time()
+        if conduction_remaining is not None:
+            if self.trace.enabled:
+                self.trace.record(TRACE_KIND_REMAINING, source="conduction", remaining=conduction_remaining)
+            return conduction_remaining
+
+        now = dt_util.utcnow()
+        live = None
+        estimate = self._estimate
+        if estimate is not None and estimate["remaining"] is not None:
+            # Jobs finish between ticks: age the result to now
+            elapsed = (now - estimate["time"]).total_seconds() / 60
+            live = max(0.0, estimate["remaining"] - elapsed)
+
+        # The learned prior covers the start of the cook, the live estimate
+        # takes over linearly during the first PRIOR_BLEND_MINUTES
+        prior = self._prior_remaining_time(probe_temp)
+        if prior is None:
+            remaining = round(live, 1) if live is not None else None
+            weight = 1.0
+        elif live is None:
+            remaining = round(prior, 1)
+            weight = 0.0
+        else:
+            weight = 1.0
+            if self._start_time is not None:
+                weight = min(1.0, (now - self._start_time).total_seconds() / 60 / PRIOR_BLEND_MINUTES)
+            remaining = round(weight * live + (1 - weight) * prior, 1)
+        if self.trace.enabled:
+            self.trace.record(
+                TRACE_KIND_REMAINING,
+                source=(
+                    "none" if remaining is None
+                    else "estimate" if weight == 1.0 else "prior" if weight == 0.0 else "blend"
+                ),
+                remaining=remaining,
+                live=round(live, 2) if live is not None else None,
+                prior=round(prior, 2) if prior is not None else None,
+                prior_weight=round(1 - weight, 3),
+                strategy=estimate["strategy"] if estimate else None,
+            )
+        return remaining
+
+    def _prior_remaining_time(self, probe_temp: float) -> float | None:
+        """Return the remaining time from the learned heating priors (None without a prior)."""
+        priors: HeatingPriors | None = self.hass.data.get(DATA_PRIORS)
+        if not priors or self._withdrawal_temp is None:
+            return None
+        return priors.remaining(
+            self._food_category, self._food_type, probe_temp, self._withdrawal_temp, self._ambient_temp
+        )
+
+    def _update_estimate(self) -> None:
+        """Run the calculator for this tick, inline or in the executor."""
+        probe_temp = self._probe_temp
+        if probe_temp is None or not self._grid_points:
+            return  # Unavailable, quarantined or no new grid point: keep the previous estimate
+        ambient_temp = self._ambient_temp
+
+        catch_up = self._prime_pending or self._pending_strategy is not None
+        if self._calculator.strategy in INLINE_STRATEGIES and not catch_up and not self._estimate_running:
+            self._estimate = self._run_estimate(
+                self._calculator, None, None, probe_temp, self._withdrawal_temp,
+                self._temp_grid, ambient_temp, self._ambient_grid,
+            )
+            self._estimator_time_ms = self._estimate["duration_ms"]
+            self._record_primary(self._estimate, catch_up=False)
+            self._follow_segment(self._estimate)
+            return
+
+        if self._estimate_running:
+            return  # Keep the previous result until the running job completes
+        self._estimate_running = True
+        # Snapshots: the loop keeps appending to the live lists
+        temp_history = list(self._temp_grid)
+        self.hass.async_create_task(
+            self._async_run_estimate(
+                self._estimate_generation,
+                temp_history if self._prime_pending else None,
+                self._pending_strategy,
+                probe_temp,
+                self._withdrawal_temp,
+                temp_history,
+                ambient_temp,
+                list(self._ambient_grid),
+            )
+        )
+        self._prime_pending = False
+        self._pending_strategy = None
+
+    async def _async_run_estimate(
+        self,
+        generation: int,
+        prime_history: list[tuple[datetime, float]] | None,
+        strategy: str | None,
+        *args: Any,
+    ) -> None:
+        """Run the calculator in the executor and apply its result on completion."""
+        try:
+            result = await self.hass.async_add_executor_job(
+                self._run_estimate, self._calculator, prime_history, strategy, *args
+            )
+        except Exception as e:  # Keep the previous estimate, retry on the next tick
+            _LOGGER.warning("Estimator job failed: %s", e)
+            return
+        finally:
+            self._estimate_running = False
+
+        if generation != self._estimate_generation:
+            return  # Cook stopped or restarted meanwhile
+        self._estimate = result
+        self._estimator_time_ms = result["duration_ms"]
+
+        catch_up = prime_history is not None or strategy is not None
+        self._record_primary(result, catch_up)
+        self._follow_segment(result)
+        if catch_up or result["duration_ms"] <= ESTIMATOR_TIME_BUDGET_MS:
+            self._estimator_overruns = 0
+        else:
+            self._estimator_overruns += 1
+            fallback = STRATEGY_FALLBACKS.get(self._calculator.strategy)
+            if self._estimator_overruns >= ESTIMATOR_MAX_OVERRUNS and fallback is not None:
+                _LOGGER.warning(
+                    "Estimator strategy %s overran its %.0f ms budget %s times in a row (last %.1f ms), switching to %s",
+                    self._calculator.strategy, ESTIMATOR_TIME_BUDGET_MS, self._estimator_overruns,
+                    result["duration_ms"], fallback,
+                )
+                self._pending_strategy = fallback
+                self._estimator_overruns = 0
+                if self.trace.enabled:
+                    self.trace.record(
+                        TRACE_KIND_FALLBACK, model=self._calculator.strategy, fallback=fallback,
+                        reason="time_budget", duration_ms=round(result["duration_ms"], 1),
+                    )
+
+        # Publish the new estimate without rebuilding (and re-sampling) the rest
+        if self.data is not None and self._state == STATE_COOKING:
+            self.data = {**self.data, **self._estimate_data(self._calculate_remaining_time())}
+            self.async_update_listeners()
+
+    @staticmethod
+    def _run_estimate(
+        calculator: CookingCalculator,
+        prime_history: list[tuple[datetime, float]] | None,
+        strategy: str | None,
+        probe_temp: float,
+        target_temp: float,
+        temp_history: list[tuple[datetime, float]],
+        ambient_temp: float | None,
+        ambient_history: list[tuple[datetime, float]],
+    ) -> dict[str, Any]:
+        """Run the calculator and snapshot its outputs (inline or in the executor)."""
+        start = time.perf_counter()
+        if strategy is not None:
+            calculator.set_strategy(strategy)
+        if prime_history is not None:
+            calculator.prime(prime_history)
+        remaining = calculator.calculate_remaining_time(
             current_temp=probe_temp,
-            target_temp=self._withdrawal_temp,
-            temp_history=self._temp_history,
+            target_temp=target_temp,
+            temp_history=temp_history,
             ambient_temp=ambient_temp,
-            ambient_history=self._ambient_history,
+            ambient_history=ambient_history,
+        )
+        heating_rate = calculator.calculate_heating_rate(temp_history)
+        estimating = remaining is not None
+        return {
+            "time": dt_util.utcnow(),
+            "remaining": remaining,
+            "heating_rate": heating_rate,
+            "heating_rate_stddev": calculator.heating_rate_stddev if heating_rate is not None else None,
+            "filtered_temperature": calculator.filtered_temperature,
+            "strategy": calculator.strategy,
+            "spread": calculator.remaining_time_spread if estimating else None,
+            "heating_constant": calculator.heating_constant if estimating else None,
+            "heating_constant_iqr": calculator.heating_constant_iqr if estimating else None,
+            "fitted_ambient": calculator.fitted_ambient if estimating else None,
+            "fit_rms": calculator.fit_rms if estimating else None,
+            "ambient_trend": calculator.ambient_trend if estimating else None,
+            "ambient_plateau": calculator.ambient_plateau if estimating else None,
+            "segment_start": calculator.segment_start,
+            "duration_ms": (time.perf_counter() - start) * 1000,
+            # Taken here, in the same job: the loop must not read the calculator while one runs
+            "calculator": calculator.diagnostics(),
+        }
+
+    def _follow_segment(self, result: dict[str, Any]) -> None:
+        """Rebuild the conduction model from the segment when the calculator found a change point."""
+        if result["segment_start"] == self._segment_start:
+            return
+        self._segment_start = result["segment_start"]
+        self._reset_conduction()
+
+    def _record_primary(self, result: dict[str, Any], catch_up: bool) -> None:
+        """Record a result of the configured strategy for the shadow scores."""
+        if self._shadow is None or result["strategy"] != self._shadow.primary:
+            return  # Not started yet, or replaced by its fallback (itself in shadow)
+        self._shadow.record(
+            result["strategy"], result["time"], result["remaining"],
+            None if catch_up else result["duration_ms"],  # Priming is not per-update cost
+        )
+
+    def _schedule_shadow_update(self) -> None:
+        """Run the other strategies on this tick's samples in the executor."""
+        if self._shadow_running or self._shadow_disabled or not self._temp_grid:
+            return
+        probe_temp = self._probe_temp
+        if self._state != STATE_COOKING or probe_temp is None or not self._grid_points:
+            return
+
+        if self._shadow is None:
+            primary = self.config.get(CONF_ESTIMATION_STRATEGY, DEFAULT_ESTIMATION_STRATEGY)
+            self._shadow = ShadowEvaluator(
+                [strategy for strategy in ESTIMATION_STRATEGIES if strategy != primary],
+                primary,
+                SHADOW_RECORD_SECONDS,
+            )
+            self._shadow_prime_pending = True  # Fresh calculators skip the rising wait
+
+        self._shadow_running = True
+        temp_history = list(self._temp_grid)
+        self.hass.async_create_task(
+            self._async_update_shadow(
+                self._shadow,
+                temp_history if self._shadow_prime_pending else None,
+                probe_temp,
+                self._withdrawal_temp,
+                temp_history,
+                self._ambient_temp,
+                list(self._ambient_grid),
+            )
         )
+        self._shadow_prime_pending = False
+
+    async def _async_update_shadow(
+        self,
+        evaluator: ShadowEvaluator,
+        prime_history: list[tuple[datetime, float]] | None,
+        *args: Any,
+    ) -> None:
+        """Update the shadow strategies off the event loop."""
+        try:
+            duration_ms = await self.hass.async_add_executor_job(
+                self._run_shadow, evaluator, prime_history, *args
+            )
+        except Exception as e:  # Shadows never affect the displayed estimate
+            _LOGGER.warning("Shadow estimator job failed: %s", e)
+            return
+        finally:
+            self._shadow_running = False
+
+        if evaluator is not self._shadow:
+            return  # Cook stopped, restarted or scored meanwhile
+        self._shadow_time_ms = duration_ms
+
+        if prime_history is not None or duration_ms <= SHADOW_TIME_BUDGET_MS:
+            self._shadow_overruns = 0
+            return
+        self._shadow_overruns += 1
+        if self._shadow_overruns >= ESTIMATOR_MAX_OVERRUNS:
+            _LOGGER.warning(
+                "Shadow estimators overran their %.0f ms budget %s times in a row (last %.1f ms), paused for this cook",
+                SHADOW_TIME_BUDGET_MS, self._shadow_overruns, duration_ms,
+            )
+            self._shadow_disabled = True  # Predictions so far are still scored
+
+    @staticmethod
+    def _run_shadow(
+        evaluator: ShadowEvaluator,
+        prime_history: list[tuple[datetime, float]] | None,
+        probe_temp: float,
+        target_temp: float,
+        temp_history: list[tuple[datetime, float]],
+        ambient_temp: float | None,
+        ambient_history: list[tuple[datetime, float]],
+    ) -> float:
+        """Prime if needed and update the shadow strategies (runs in the executor)."""
+        if prime_history is not None:
+            evaluator.prime(prime_history)
+        return evaluator.update(
+            dt_util.utcnow(), probe_temp, target_temp, temp_history, ambient_temp, ambient_history,
+        )
+
+    def _score_estimators(self) -> None:
+        """Score the predictions of the cook against its done time and persist the totals."""
+        shadow = self._shadow
+        if shadow is None or self._cooking_end_time is None:
+            return
+        self._shadow = None  # Scored once; a late shadow job is discarded
+        scores = shadow.score(self._cooking_end_time)
+        self._last_cook_scores = summarize(scores)
+        self._estimator_scores = merge_scores(self._estimator_scores, scores)
+        _LOGGER.debug("Estimator scores of the cook: %s", self._last_cook_scores)
+        self.hass.async_create_task(self.async_save_stored_data())
+
+    def estimator_scores(self) -> dict[str, Any]:
+        """Return the shadow evaluation scores (last cook and totals)."""
+        return {
+            "primary": self.config.get(CONF_ESTIMATION_STRATEGY, DEFAULT_ESTIMATION_STRATEGY),
+            "last_cook": self._last_cook_scores,
+            "totals": summarize(self._estimator_scores),
+        }
+
+    def replay_bundle(self) -> dict[str, Any]:
+        """
+        Return the running cook as a replayable bundle (config entry diagnostics).
+
+        The probe and ambient histories are the full-resolution accepted
+        readings, as lossless codec series (base64), with the grid step that
+        resamples them into what the calculator sees; the calculator
+        internals and the carryover inputs come with them so an offline replay
+        (scripts/replay_diagnostics.py) can be compared with what ran here.
+        Read-only: the calculator internals are the snapshot the last
+        estimator run took of itself (an executor job may be using the
+        calculator now); before the first estimate only its strategy and
+        tuning are given.
+        """
+
+        def iso(value: datetime | None) -> str | None:
+            return value.isoformat() if value is not None else None
+
+        def trace(history: list[tuple[datetime, float]]) -> str:
+            series = encode_series(list(history), REPLAY_TIME_RESOLUTION_MS, lossless=True)
+            return base64.b64encode(series).decode("ascii")
+
+        estimate = self._estimate
+        conduction = self._conduction_result
+        calibration: CarryoverCalibration = self.hass.data.get(DATA_CARRYOVER, _DEFAULT_CARRYOVER)
+        carryover_type = get_carryover_type(self._food_category, self._food_type)
+        return {
+            "version": REPLAY_BUNDLE_VERSION,
+            "created": iso(dt_util.utcnow()),
+            "state": self._state,
+            "cook": {
+                "start_time": iso(self._start_time),
+                "start_probe_temp": self._start_probe_temp,
+                "start_ambient_temp": self._start_ambient_temp,
+                "cooking_end_time": iso(self._cooking_end_time),
+                "food_category": self._food_category,
+                "food_type": self._food_type,
+                "food_doneness": self._food_doneness,
+                "is_manual_mode": self._is_manual_mode,
+                "desired_temp": self._desired_temp,
+                "withdrawal_temp": self._withdrawal_temp,
+                "thickness_cm": self._thickness_cm,
+            },
+            "carryover": {
+                "enabled": self._carryover_enabled,
+                "type": carryover_type,
+                "coefficient": calibration.coefficient(carryover_type),
+                "fitted_sessions": calibration.fitted_sessions(carryover_type),
+                "heating_rate": estimate["heating_rate"] if estimate else None,
+                "ambient_temp": self._ambient_temp,
+                "carryover": round(self._desired_temp - self._withdrawal_temp, 3),
+            },
+            "calculator": estimate["calculator"] if estimate else {
+                "strategy": self._calculator.strategy, "tuning": self._calculator.tuning(),
+            },
+            "estimate": {
+                **{key: value for key, value in estimate.items() if key != "calculator"},
+                "time": iso(estimate["time"]), "segment_start": iso(estimate["segment_start"]),
+            } if estimate else None,
+            "conduction": {**conduction, "time": iso(conduction["time"])} if conduction else None,
+            "trace_resolution_ms": REPLAY_TIME_RESOLUTION_MS,
+            "resample_step": self._probe_resampler.step if self._probe_resampler is not None else 0,
+            "temp_trace": trace(self._temp_history),
+            "ambient_trace": trace(self._ambient_history),
+        }
+
+    def _conduction_remaining_time(self) -> float | None:
+        """Return the conduction model ETA, aged to now (None until calibrated)."""
+        result = self._conduction_result
+        if result is None or not result["ready"] or result["remaining"] is None:
+            return None
+        elapsed = (dt_util.utcnow() - result["time"]).total_seconds() / 60
+        return max(0.0, result["remaining"] - elapsed)
+
+    def _schedule_conduction_update(self) -> None:
+        """Hand the samples received since the last job to the conduction model."""
+        if self._conduction_running or self._conduction_disabled or not self._temp_grid:
+            return
+        if self._state != STATE_COOKING or not self._thickness_cm or not self.config.get(CONF_AMBIENT_SENSOR):
+            return
+
+        if self._conduction is None:
+            params = CONDUCTION_PARAMETERS.get(
+                get_carryover_type(self._food_category, self._food_type),
+                CONDUCTION_PARAMETERS["other"],
+            )
+            self._conduction = ConductionModel(
+                params["geometry"],
+                self._thickness_cm / 100,
+                params["diffusivity"],
+                params["surface_ratio"],
+            )
+            self._conduction_cursor = None
+            self._conduction_ambient_cursor = None
+
+        # New tails only: the model keeps its own state between jobs
+        temp_start = 0
+        if self._conduction_cursor is not None:
+            temp_start = bisect.bisect_right(self._temp_grid, self._conduction_cursor, key=_timestamp)
+        elif self._segment_start is not None:
+            temp_start = bisect.bisect_left(self._temp_grid, self._segment_start, key=_timestamp)
+        ambient_start = 0
+        if self._conduction_ambient_cursor is not None:
+            ambient_start = bisect.bisect_right(self._ambient_grid, self._conduction_ambient_cursor, key=_timestamp)
+        temp_samples = self._temp_grid[temp_start:]
+        ambient_samples = self._ambient_grid[ambient_start:]
+        if not temp_samples:
+            return
+        catch_up = self._conduction_cursor is None  # First job reads the whole cook (or segment)
+        self._conduction_cursor = temp_samples[-1][0]
+        if ambient_samples:
+            self._conduction_ambient_cursor = ambient_samples[-1][0]
+
+        self._conduction_running = True
+        self.hass.async_create_task(
+            self._async_update_conduction(
+                self._conduction, temp_samples, ambient_samples, self._withdrawal_temp, catch_up,
+            )
+        )
+
+    async def _async_update_conduction(
+        self,
+        model: ConductionModel,
+        temp_samples: list[tuple[datetime, float]],
+        ambient_samples: list[tuple[datetime, float]],
+        target_temp: float,
+        catch_up: bool,
+    ) -> None:
+        """Advance the conduction model off the event loop and keep its prediction."""
+        try:
+            result = await self.hass.async_add_executor_job(
+                self._run_conduction, model, temp_samples, ambient_samples, target_temp
+            )
+        except Exception as e:  # Numerical failure: drop the model, the calculator takes over
+            _LOGGER.warning("Conduction model update failed: %s", e)
+            if model is self._conduction:
+                self._conduction = None
+                self._conduction_result = None
+            return
+        finally:
+            self._conduction_running = False
+
+        if model is not self._conduction:
+            return  # Replaced or reset meanwhile
+        self._conduction_result = result
+
+        if catch_up or result["duration_ms"] <= ESTIMATOR_TIME_BUDGET_MS:
+            self._conduction_overruns = 0
+            return
+        self._conduction_overruns += 1
+        if self._conduction_overruns >= ESTIMATOR_MAX_OVERRUNS:
+            _LOGGER.warning(
+                "Conduction model overran its %.0f ms budget %s times in a row (last %.1f ms), disabled for this cook",
+                ESTIMATOR_TIME_BUDGET_MS, self._conduction_overruns, result["duration_ms"],
+            )
+            self._reset_conduction()
+            self._conduction_disabled = True
+            if self.trace.enabled:
+                self.trace.record(
+                    TRACE_KIND_FALLBACK, model="conduction", fallback=self._calculator.strategy,
+                    reason="time_budget", duration_ms=round(result["duration_ms"], 1),
+                )
+
+    @staticmethod
+    def _run_conduction(
+        model: ConductionModel,
+        temp_samples: list[tuple[datetime, float]],
+        ambient_samples: list[tuple[datetime, float]],
+        target_temp: float,
+    ) -> dict[str, Any]:
+        """Ingest samples and predict the time to target (runs in the executor)."""
+        start = time.perf_counter()
+        model.ingest(temp_samples, ambient_samples)
+        remaining = model.time_to(target_temp)
+        return {
+            "time": model.last_time,
+            "ready": model.ready,
+            "remaining": remaining,
+            "core_temp": model.core_temp,
+            "diffusivity": model.diffusivity,
+            "duration_ms": (time.perf_counter() - start) * 1000,
+        }
+
+    def _reset_estimator(self) -> None:
+        """Forget the estimate of the previous cook and restore the configured strategy."""
+        self._estimate = None
+        self._estimate_generation += 1  # A running job belongs to the previous cook
+        self._estimator_overruns = 0
+        self._estimator_time_ms = None
+        self._conduction_overruns = 0
+        self._conduction_disabled = False
+        self._segment_start = None
+        self._shadow = None  # A running shadow job belongs to the previous cook
+        self._shadow_prime_pending = False
+        self._shadow_overruns = 0
+        self._shadow_disabled = False
+        self._shadow_time_ms = None
+        configured = self.config.get(CONF_ESTIMATION_STRATEGY, DEFAULT_ESTIMATION_STRATEGY)
+        if self._calculator.strategy != configured:
+            self._pending_strategy = configured
+
+    def _reset_conduction(self) -> None:
+        """Drop the conduction model; the next tick rebuilds it from the history (since the segment start)."""
+        self._conduction = None
+        self._conduction_result = None
+        self._conduction_cursor = None
+        self._conduction_ambient_cursor = None
 
     def _calculate_heating_rate(self) -> float | None:
         """Calculate current heating rate in °C/min."""
-        return self._calculator.calculate_heating_rate(self._temp_history)
+        if self._state == STATE_COOKING:
+            # The calculator may be busy in the executor: use the last estimate
+            return self._estimate["heating_rate"] if self._estimate else None
+        if self._estimate_running:
+            return None
+        return self._calculator.calculate_heating_rate(self._temp_grid)
 
     def _calculate_dynamic_carryover(self) -> float:
         """
         Calculate dynamic carryover compensation based on:
         1. Heating rate (faster = more thermal energy stored)
         2. Ambient/cooking temperature (higher = more heat differential)
-        3. Food type weight (larger mass = more heat retention)
+        3. Food type coefficient (fitted from archived cooks, see carryover.py)
         
         Returns the degrees to subtract from desired temp to get withdrawal temp.
         Returns 0 if not enough data or carryover is disabled.
@@ -375,52 +1187,42 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         
         # Get current heating rate
         heating_rate = self._calculate_heating_rate()
-        _LOGGER.debug(f"[CARRYOVER DEBUG] heating_rate={heating_rate}, type={type(heating_rate)}, desired_temp={self._desired_temp}")
-        
         if heating_rate is None or heating_rate < 0.01:
             # No valid heating rate (None, negative, or near-zero = likely measurement issue or cooking finished)
             # Don't apply carryover compensation - withdrawal temp = desired temp
-            _LOGGER.debug(f"[CARRYOVER DEBUG] heating_rate invalid, returning 0.0")
+            if self.trace.enabled:
+                self.trace.record(
+                    TRACE_KIND_CARRYOVER, carryover=0.0, heating_rate=heating_rate, reason="no_heating_rate",
+                )
             return 0.0
         
-        # Get food type weight factor
-        carryover_type = get_carryover_type(self._food_category, self._food_type)
-        type_weight = CARRYOVER_TYPE_WEIGHTS.get(carryover_type, 1.0)
-        
         # Get ambient cooking temperature
-        ambient_temp = None
-        if self.config.get(CONF_AMBIENT_SENSOR):
-            ambient_temp = self._get_sensor_value(self.config[CONF_AMBIENT_SENSOR])
-        
-        # Base carryover calculation from heating rate
-        # At 1°C/min rate, expect ~2°C carryover as baseline
-        # Scale with rate: faster heating = more stored energy
-        rate_factor = min(3.0, max(0.3, heating_rate / CARRYOVER_BASE_RATE))
-        base_carryover = 2.0 * rate_factor
+        ambient_temp = self._ambient_temp
         
-        # Adjust based on ambient temperature if available
-        # Higher ambient = larger temp differential = more carryover
-        ambient_factor = 1.0
-        if ambient_temp is not None and ambient_temp > 100:
-            # Scale: 100°C -> factor 0.7, 200°C -> factor 1.0, 300°C -> factor 1.3
-            ambient_factor = 0.5 + (ambient_temp / 400)
-            ambient_factor = min(1.5, max(0.5, ambient_factor))
-        
-        # Calculate final carryover with all factors
-        dynamic_carryover = base_carryover * type_weight * ambient_factor
-        
-        _LOGGER.debug(f"[CARRYOVER DEBUG] type={carryover_type}, type_weight={type_weight}, ambient_temp={ambient_temp}, ambient_factor={ambient_factor}, rate_factor={rate_factor}, base_carryover={base_carryover}, dynamic_carryover={dynamic_carryover}")
-        
-        # Cap between reasonable bounds (0 to 8°C)
-        result = min(8.0, max(0.0, dynamic_carryover))
-        _LOGGER.debug(f"[CARRYOVER DEBUG] final carryover capped={result}")
+        calibration: CarryoverCalibration = self.hass.data.get(DATA_CARRYOVER, _DEFAULT_CARRYOVER)
+        carryover_type = get_carryover_type(self._food_category, self._food_type)
+        result = calibration.carryover(carryover_type, heating_rate, ambient_temp)
+        if self.trace.enabled:
+            self.trace.record(
+                TRACE_KIND_CARRYOVER,
+                carryover=round(result, 3),
+                type=carryover_type,
+                coefficient=calibration.coefficient(carryover_type),
+                fitted_sessions=calibration.fitted_sessions(carryover_type),
+                heating_rate=heating_rate,
+                ambient_temp=ambient_temp,
+            )
         return result
 
     def _update_withdrawal_temp(self) -> None:
         """Update the withdrawal temperature based on dynamic carryover."""
         if not self._carryover_enabled:
             self._withdrawal_temp = self._desired_temp
-            _LOGGER.debug(f"[WITHDRAWAL DEBUG] carryover disabled, withdrawal={self._withdrawal_temp}")
+            if self.trace.enabled:
+                self.trace.record(
+                    TRACE_KIND_WITHDRAWAL, desired_temp=self._desired_temp, carryover=0.0,
+                    withdrawal_temp=self._withdrawal_temp, reason="carryover_disabled",
+                )
             return
             
         carryover = self._calculate_dynamic_carryover()
@@ -429,7 +1231,11 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         # Ensure withdrawal temp doesn't go below a reasonable minimum
         self._withdrawal_temp = max(30.0, self._withdrawal_temp)
         
-        _LOGGER.debug(f"[WITHDRAWAL DEBUG] desired={self._desired_temp}, carryover={carryover}, final_withdrawal={self._withdrawal_temp}")
+        if self.trace.enabled:
+            self.trace.record(
+                TRACE_KIND_WITHDRAWAL, desired_temp=self._desired_temp, carryover=round(carryover, 3),
+                withdrawal_temp=round(self._withdrawal_temp, 3),
+            )
 
     def _calculate_progress(self) -> float:
         """Calculate cooking progress percentage."""
@@ -439,9 +1245,11 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         if self._start_probe_temp is None:
             return 0.0
             
-        probe_temp = self._get_sensor_value(self.config[CONF_PROBE_SENSOR])
+        probe_temp = self._probe_temp
         if probe_temp is None:
             return 0.0
+        if self._state == STATE_COOKING and self._estimate and self._estimate["filtered_temperature"] is not None:
+            probe_temp = self._estimate["filtered_temperature"]  # Kalman strategy
             
         temp_range = self._withdrawal_temp - self._start_probe_temp
         if temp_range <= 0:
@@ -451,55 +1259,291 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         return min(100.0, max(0.0, progress))
 
     def _update_temp_history(self) -> None:
-        """Update temperature history."""
+        """Append this tick's readings to the histories and their grids."""
+        if self._probe_samples:
+            self._compress(self._probe_compressor, self._probe_samples, self._temp_history)
+            self._grid_points = self._resample(
+                self._probe_resampler, self._probe_samples, self._temp_grid, self._temp_gaps
+            )
+            self._trim_series(self._temp_history, self._temp_grid, self._temp_gaps)
+
+        if self.config.get(CONF_AMBIENT_SENSOR) and self._ambient_samples:
+            self._compress(self._ambient_compressor, self._ambient_samples, self._ambient_history)
+            self._resample(self._ambient_resampler, self._ambient_samples, self._ambient_grid, self._ambient_gaps)
+            self._trim_series(self._ambient_history, self._ambient_grid, self._ambient_gaps)
+
+    def _trim_series(
+        self,
+        history: list[tuple[datetime, float]],
+        grid: list[tuple[datetime, float]],
+        gaps: list[datetime],
+    ) -> None:
+        """Apply the retention of the current state to a history, its grid and gap markers."""
+        if self._state == STATE_COOKING:
+            # During cooking: keep all data since start
+            if not self._start_time:
+                return
+            cutoff = self._start_time - timedelta(minutes=1)
+            max_time = None
+            strict = False
+        elif self._state == STATE_DONE and self._cooking_end_time:
+            # After cooking: keep cooking duration + 1 hour
+            cutoff = self._start_time - timedelta(minutes=1) if self._start_time else dt_util.utcnow() - timedelta(hours=2)
+            max_time = self._cooking_end_time + timedelta(hours=1)
+            strict = False
+        else:
+            # Idle: keep only last 2 minutes for display
+            cutoff = dt_util.utcnow() - timedelta(minutes=2)
+            max_time = None
+            strict = True
+        self._trim_history(history, cutoff, max_time, strict)
+        self._trim_history(grid, cutoff, max_time, strict)
+        if max_time is not None:
+            del gaps[bisect.bisect_right(gaps, max_time):]
+        del gaps[:bisect.bisect_left(gaps, cutoff)]
+
+    @staticmethod
+    def _trim_history(
+        history: list[tuple[datetime, float]],
+        cutoff: datetime,
+        max_time: datetime | None = None,
+        strict: bool = False,
+    ) -> None:
+        """Drop points before cutoff (at or before if strict) and after max_time, in place."""
+        if max_time is not None:
+            del history[bisect.bisect_right(history, max_time, key=_timestamp):]
+        if strict:
+            del history[:bisect.bisect_right(history, cutoff, key=_timestamp)]
+        else:
+            del history[:bisect.bisect_left(history, cutoff, key=_timestamp)]
+
+    @staticmethod
+    def _serialize_history(
+        history: list[tuple[datetime, float]],
+        gaps: list[datetime],
+        cache: dict[datetime, str],
+        max_bytes: int,
+    ) -> list[tuple[str, float | None]]:
+        """
+        Return the last points for the frontend, with None at gaps, reusing the previous tick's strings.
+
+        The last HISTORY_MAX_POINTS points are thinned to every n-th one (and
+        the latest) so the serialized series stays within max_bytes. Kept
+        points are picked by their index in the history, so they stay the
+        same from one tick to the next.
+        """
+        serialized: list[tuple[str, float | None]] = []
+        fresh: dict[datetime, str] = {}
+        first = max(0, len(history) - HISTORY_MAX_POINTS)
+        gap = bisect.bisect_left(gaps, history[first][0]) if history else len(gaps)
+        max_points = max(1, max_bytes // HISTORY_POINT_MAX_BYTES - (len(gaps) - gap))
+        stride = math.ceil((len(history) - first) / max_points) if history else 1
+        if stride > 1:
+            points = history[first + (-first) % stride::stride]
+            if points[-1] is not history[-1]:
+                points.append(history[-1])
+        else:
+            points = history[first:]
+        for t, v in points:
+            while gap < len(gaps) and gaps[gap] < t:
+                serialized.append((gaps[gap].isoformat(), None))  # Breaks the chart line
+                gap += 1
+            iso = cache.get(t) or t.isoformat()
+            fresh[t] = iso
+            serialized.append((iso, v))
+        cache.clear()
+        cache.update(fresh)
+        return serialized
+
+    def _schedule_backfill(self) -> None:
+        """Schedule a recorder backfill for the period the probe was not seen live."""
         now = dt_util.utcnow()
-        
-        probe_temp = self._get_sensor_value(self.config[CONF_PROBE_SENSOR])
-        if probe_temp is not None:
-            self._temp_history.append((now, probe_temp))
-            # Keep history based on state
-            if self._state == STATE_COOKING:
-                # During cooking: keep all data since start
-                if self._start_time:
-                    cutoff = self._start_time - timedelta(minutes=1)
-                    self._temp_history = [(t, v) for t, v in self._temp_history if t >= cutoff]
-            elif self._state == STATE_DONE and self._cooking_end_time:
-                # After cooking: keep cooking duration + 1 hour
-                cutoff = self._start_time - timedelta(minutes=1) if self._start_time else now - timedelta(hours=2)
-                max_time = self._cooking_end_time + timedelta(hours=1)
-                self._temp_history = [(t, v) for t, v in self._temp_history if t >= cutoff and t <= max_time]
-            else:
-                # Idle: keep only last 2 minutes for display
-                cutoff = now - timedelta(minutes=2)
-                self._temp_history = [(t, v) for t, v in self._temp_history if t > cutoff]
-        
-        if self.config.get(CONF_AMBIENT_SENSOR):
-            ambient_temp = self._get_sensor_value(self.config[CONF_AMBIENT_SENSOR])
-            if ambient_temp is not None:
-                self._ambient_history.append((now, ambient_temp))
-                # Same cleanup logic as probe
-                if self._state == STATE_COOKING and self._start_time:
-                    cutoff = self._start_time - timedelta(minutes=1)
-                    self._ambient_history = [(t, v) for t, v in self._ambient_history if t >= cutoff]
-                elif self._state == STATE_DONE and self._cooking_end_time:
-                    cutoff = self._start_time - timedelta(minutes=1) if self._start_time else now - timedelta(hours=2)
-                    max_time = self._cooking_end_time + timedelta(hours=1)
-                    self._ambient_history = [(t, v) for t, v in self._ambient_history if t >= cutoff and t <= max_time]
-                else:
-                    cutoff = now - timedelta(minutes=2)
-                    self._ambient_history = [(t, v) for t, v in self._ambient_history if t > cutoff]
+        # Same retention as _update_temp_history: whole cook, or 2 minutes when idle
+        if self._state in (STATE_COOKING, STATE_DONE) and self._start_time:
+            gap_start = self._start_time - timedelta(minutes=1)
+        else:
+            gap_start = now - timedelta(minutes=2)
+        if self._temp_history:
+            gap_start = max(gap_start, self._temp_history[-1][0])
+
+        if self._history_gap is not None:
+            # Widen a pending gap rather than losing it
+            gap_start = min(gap_start, self._history_gap[0])
+        self._history_gap = (gap_start, now)
+        self.hass.async_create_task(self.async_backfill_history())
+
+    async def async_backfill_history(self) -> None:
+        """
+        Backfill probe and ambient history from the recorder.
+
+        Runs a single bulk query covering the pending gap for the probe and
+        ambient entities (in the recorder executor), merges the readings into
+        the in-memory history and re-primes the estimator so the ETA is
+        available immediately.
+        """
+        if self._history_gap is None or self._backfill_running:
+            return
+        if "recorder" not in self.hass.config.components:
+            self._history_gap = None
+            return
+
+        gap_start, gap_end = self._history_gap
+        self._history_gap = None
+        self._backfill_running = True
+        self._unschedule_backfill_retry()
+
+        probe_entity = self.config[CONF_PROBE_SENSOR]
+        ambient_entity = self.config.get(CONF_AMBIENT_SENSOR)
+        entity_ids = [probe_entity] + ([ambient_entity] if ambient_entity else [])
+
+        try:
+            recorder = get_instance(self.hass)
+            if not await recorder.async_db_ready:
+                raise RuntimeError("recorder database not ready")
+            states = await recorder.async_add_executor_job(
+                self._fetch_recorder_history, gap_start, gap_end, entity_ids
+            )
+        except Exception as e:  # Recorder unavailable or still starting
+            self._restore_history_gap(gap_start, gap_end)
+            self._schedule_backfill_retry(e)
+            return
+        finally:
+            self._backfill_running = False
+        self._backfill_retries = 0
+
+        probe_points = self._probe_filter.filter_series(states.get(probe_entity, []))
+        ambient_points = self._ambient_filter.filter_series(states.get(ambient_entity, [])) if ambient_entity else []
+        if not probe_points and not ambient_points:
+            return
+
+        self._temp_history = self._merge_history(self._temp_history, probe_points, gap_start, gap_end)
+        if ambient_entity:
+            self._ambient_history = self._merge_history(self._ambient_history, ambient_points, gap_start, gap_end)
+        self._rebuild_grids()
+        _LOGGER.debug(
+            "Backfilled %s probe and %s ambient readings between %s and %s",
+            len(probe_points), len(ambient_points), gap_start, gap_end,
+        )
+
+        if self._state == STATE_COOKING:
+            self._prime_pending = True  # Applied by the next estimator job
+            self._shadow_prime_pending = True
+            self._reset_conduction()  # Backfilled samples precede its state
+
+        self.async_set_updated_data(self._build_data())
+
+        # Another gap may have opened while the query was running
+        if self._history_gap is not None:
+            self.hass.async_create_task(self.async_backfill_history())
+
+    def _restore_history_gap(self, gap_start: datetime, gap_end: datetime) -> None:
+        """Put back a gap whose backfill failed, merged with any gap opened meanwhile."""
+        if self._history_gap is not None:
+            gap_start = min(gap_start, self._history_gap[0])
+            gap_end = max(gap_end, self._history_gap[1])
+        self._history_gap = (gap_start, gap_end)
+
+    def _schedule_backfill_retry(self, error: Exception) -> None:
+        """Retry a failed backfill later (the recorder is typically still starting)."""
+        if self._backfill_retries >= BACKFILL_MAX_RETRIES:
+            _LOGGER.warning("History backfill from recorder failed, giving up: %s", error)
+            self._backfill_retries = 0
+            self._history_gap = None
+            return
+        self._backfill_retries += 1
+        _LOGGER.debug(
+            "History backfill from recorder failed (attempt %s, retrying in %s s): %s",
+            self._backfill_retries, BACKFILL_RETRY_SECONDS, error,
+        )
+
+        @callback
+        def _retry(_now: datetime) -> None:
+            self._cancel_backfill_retry = None
+            self.hass.async_create_task(self.async_backfill_history())
+
+        self._cancel_backfill_retry = async_call_later(self.hass, BACKFILL_RETRY_SECONDS, _retry)
+
+    @callback
+    def _unschedule_backfill_retry(self) -> None:
+        """Cancel a pending backfill retry."""
+        if self._cancel_backfill_retry is not None:
+            self._cancel_backfill_retry()
+            self._cancel_backfill_retry = None
+
+    def _fetch_recorder_history(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        entity_ids: list[str],
+    ) -> dict[str, list[tuple[datetime, float]]]:
+        """Query recorder states for the given entities (runs in the recorder executor)."""
+        result = history.get_significant_states(
+            self.hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state=False,
+            significant_changes_only=False,
+            no_attributes=True,
+        )
+
+        points: dict[str, list[tuple[datetime, float]]] = {}
+        for entity_id, entity_states in result.items():
+            values = []
+            for state in entity_states:
+                try:
+                    values.append((state.last_updated, float(state.state)))
+                except (ValueError, TypeError):
+                    continue  # unavailable / unknown
+            points[entity_id] = values
+        return points
+
+    @staticmethod
+    def _merge_history(
+        current: list[tuple[datetime, float]],
+        backfill: list[tuple[datetime, float]],
+        gap_start: datetime,
+        gap_end: datetime,
+    ) -> list[tuple[datetime, float]]:
+        """Insert recorder readings that fall strictly inside the gap, keeping time order."""
+        inserted = [(t, v) for t, v in backfill if gap_start < t < gap_end]
+        if not inserted:
+            return current
+        return sorted(current + inserted, key=lambda point: point[0])
 
     def _build_data(self) -> dict[str, Any]:
-        """Build the data dictionary."""
+        """Build the data dictionary, recording the event-loop time of the tick."""
+        start = time.perf_counter()
+        data = self._build_tick_data()
+        self._loop_time_ms = (time.perf_counter() - start) * 1000
+        data["loop_time_ms"] = round(self._loop_time_ms, 2)
+        return data
+
+    def _build_tick_data(self) -> dict[str, Any]:
+        """Sample the sensors and compute the cheap outputs inline."""
+        metrics = self.metrics
+        mark = metrics.clock()
+        self._filter_readings()
+        mark = metrics.lap(STAGE_FILTER, mark)
         self._update_state()
+        mark = metrics.lap(STAGE_STATE_MACHINE, mark)
         
         # Always update history when connected
         if self._is_probe_connected():
             self._update_temp_history()
+            mark = metrics.lap(STAGE_HISTORY, mark)
         
+        remaining_time = None
         if self._state == STATE_COOKING:
             self._update_withdrawal_temp()
-            self._check_5min_notification()
+            mark = metrics.lap(STAGE_CARRYOVER, mark)
+            self._update_estimate()
+            self._schedule_shadow_update()
+            self._schedule_conduction_update()
+            # Once per tick: it records a decision in the trace
+            remaining_time = self._calculate_remaining_time()
+            self._check_5min_notification(remaining_time)
+            mark = metrics.lap(STAGE_ESTIMATOR, mark)
         
         probe_temp = self._get_sensor_value(self.config[CONF_PROBE_SENSOR])
         ambient_temp = None
@@ -514,29 +1558,28 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         if self.config.get(CONF_RSSI_SENSOR):
             rssi = self._get_sensor_value(self.config[CONF_RSSI_SENSOR])
 
-        remaining_time = self._calculate_remaining_time()
-        heating_rate = self._calculate_heating_rate()
-        progress = self._calculate_progress()
-        
-        estimated_end = None
-        total_estimated = None
-        if remaining_time is not None and self._start_time is not None:
-            estimated_end = dt_util.utcnow() + timedelta(minutes=remaining_time)
-            total_estimated = (estimated_end - self._start_time).total_seconds() / 60
-
         disconnect_duration = None
         if self._disconnect_start is not None:
             disconnect_duration = (dt_util.utcnow() - self._disconnect_start).total_seconds()
 
         # Convert history to serializable format for frontend
-        temp_history_data = [(t.isoformat(), v) for t, v in self._temp_history[-500:]]  # Limit to last 500 points
-        ambient_history_data = [(t.isoformat(), v) for t, v in self._ambient_history[-500:]]
+        history_bytes = ATTRIBUTES_MAX_BYTES - ATTRIBUTES_RESERVE_BYTES
+        if self._ambient_grid:
+            history_bytes //= 2
+        temp_history_data = self._serialize_history(
+            self._temp_grid, self._temp_gaps, self._temp_iso_cache, history_bytes
+        )
+        ambient_history_data = self._serialize_history(
+            self._ambient_grid, self._ambient_gaps, self._ambient_iso_cache, history_bytes
+        )
 
-        return {
+        data = {
             "state": self._state,
             "probe_connected": self._is_probe_connected(),
             "probe_temp": probe_temp,
             "ambient_temp": ambient_temp,
+            "probe_outliers": self._probe_filter.outliers,
+            "ambient_outliers": self._ambient_filter.outliers,
             "battery": battery,
             "rssi": rssi,
             "desired_temp": self._desired_temp,
@@ -551,14 +1594,71 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
             "start_probe_temp": self._start_probe_temp,
             "start_ambient_temp": self._start_ambient_temp,
             "cooking_end_time": self._cooking_end_time,
+            "thickness": self._thickness_cm,
+            "disconnect_duration": disconnect_duration,
+            "temp_history": temp_history_data,
+            "ambient_history": ambient_history_data,
+            **self._estimate_data(remaining_time),
+        }
+        metrics.lap(STAGE_SERIALIZATION, mark)
+        return data
+
+    def _estimate_data(self, remaining_time: float | None) -> dict[str, Any]:
+        """Build the estimator-derived part of the data dictionary (remaining_time already computed)."""
+        heating_rate = self._calculate_heating_rate()
+        progress = self._calculate_progress()
+        estimate = self._estimate if self._state == STATE_COOKING else None
+        
+        # Conduction model, when calibrated it provides the remaining time
+        conduction = self._conduction_result if self._state == STATE_COOKING else None
+        conduction_remaining = self._conduction_remaining_time() if conduction else None
+        conduction_core_temp = conduction["core_temp"] if conduction else None
+        conduction_diffusivity = conduction["diffusivity"] if conduction else None
+
+        prior_remaining = None
+        if self._state == STATE_COOKING and self._probe_temp is not None:
+            prior_remaining = self._prior_remaining_time(self._probe_temp)
+
+        # Estimate confidence (only meaningful while the calculator provides the estimate)
+        def calculator_value(key: str, digits: int) -> float | None:
+            if estimate is None or remaining_time is None or conduction_remaining is not None:
+                return None
+            value = estimate[key]
+            return round(value, digits) if value is not None else None
+
+        heating_rate_stddev = estimate["heating_rate_stddev"] if estimate else self._calculator.heating_rate_stddev
+        if heating_rate is None:
+            heating_rate_stddev = None
+        
+        estimated_end = None
+        total_estimated = None
+        if remaining_time is not None and self._start_time is not None:
+            estimated_end = dt_util.utcnow() + timedelta(minutes=remaining_time)
+            total_estimated = (estimated_end - self._start_time).total_seconds() / 60
+
+        return {
             "estimated_end": estimated_end,
             "remaining_time": remaining_time,
+            "remaining_time_spread": calculator_value("spread", 1),
+            "heating_constant": calculator_value("heating_constant", 5),
+            "heating_constant_iqr": calculator_value("heating_constant_iqr", 5),
+            "fitted_ambient": calculator_value("fitted_ambient", 1),
+            "fit_rms": calculator_value("fit_rms", 3),
+            "ambient_trend": calculator_value("ambient_trend", 2),
+            "ambient_plateau": calculator_value("ambient_plateau", 1),
             "total_estimated": total_estimated,
             "progress": progress,
             "heating_rate": heating_rate,
-            "disconnect_duration": disconnect_duration,
-            "temp_history": temp_history_data,
-            "ambient_history": ambient_history_data,
+            "heating_rate_stddev": round(heating_rate_stddev, 3) if heating_rate_stddev is not None else None,
+            "estimation_strategy": self._calculator.strategy,
+            "conduction_remaining_time": round(conduction_remaining, 1) if conduction_remaining is not None else None,
+            "conduction_core_temp": round(conduction_core_temp, 1) if conduction_core_temp is not None else None,
+            "conduction_diffusivity": conduction_diffusivity,
+            "prior_remaining_time": round(prior_remaining, 1) if prior_remaining is not None else None,
+            "loop_time_ms": round(self._loop_time_ms, 2) if self._loop_time_ms is not None else None,
+            "estimator_time_ms": round(self._estimator_time_ms, 2) if self._estimator_time_ms is not None else None,
+            "estimator_overruns": self._estimator_overruns,
+            "shadow_time_ms": round(self._shadow_time_ms, 2) if self._shadow_time_ms is not None else None,
         }
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -574,11 +1674,11 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
             
         self._state = STATE_COOKING
         self._start_time = dt_util.utcnow()
-        self._start_probe_temp = self._get_sensor_value(self.config[CONF_PROBE_SENSOR])
+        self._start_probe_temp = self._probe_temp
         self._cooking_end_time = None
         
         if self.config.get(CONF_AMBIENT_SENSOR):
-            self._start_ambient_temp = self._get_sensor_value(self.config[CONF_AMBIENT_SENSOR])
+            self._start_ambient_temp = self._ambient_temp
         
         # Reset notification flags
         self._notified_5min = False
@@ -586,8 +1686,13 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         self._disconnect_start = None
         
         # Clear old history, start fresh
-        self._temp_history = []
-        self._ambient_history = []
+        self._clear_histories()
+        self._history_gap = None
+        self._reset_conduction()
+        self._reset_estimator()
+        
+        # Persist the running cook so it survives a restart
+        self.hass.async_create_task(self.async_save_stored_data())
         
         self.async_set_updated_data(self._build_data())
 
@@ -603,15 +1708,100 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
 
     def _reset_cooking_data(self) -> None:
         """Reset cooking data."""
+        self._archive_session()
         self._start_time = None
         self._start_probe_temp = None
         self._start_ambient_temp = None
         self._cooking_end_time = None
         self._notified_5min = False
         self._notified_done = False
+        self._clear_histories()
+        self._disconnect_start = None
+        self._history_gap = None
+        self._reset_conduction()
+        self._reset_estimator()
+        
+        # Forget the persisted cook
+        self.hass.async_create_task(self.async_save_stored_data())
+
+    def _clear_histories(self) -> None:
+        """Forget the probe and ambient histories and their grids (the resamplers keep their open bucket)."""
         self._temp_history = []
         self._ambient_history = []
-        self._disconnect_start = None
+        self._temp_grid = []
+        self._ambient_grid = []
+        self._temp_gaps = []
+        self._ambient_gaps = []
+
+    def _archive_session(self) -> None:
+        """Save the finished or stopped cook to the session archive (off the event loop)."""
+        archive: SessionArchive | None = self.hass.data.get(DATA_ARCHIVE)
+        if archive is None or self._start_time is None or not self._temp_history:
+            return
+        session = {
+            "entry_id": self.entry.entry_id,
+            "food_category": self._food_category,
+            "food_type": self._food_type,
+            "doneness": self._food_doneness,
+            "outcome": "done" if self._cooking_end_time else "stopped",
+            "start_time": self._start_time,
+            "done_time": self._cooking_end_time,
+            "end_time": dt_util.utcnow(),
+            "desired_temp": self._desired_temp,
+            "withdrawal_temp": self._withdrawal_temp,
+            "start_probe_temp": self._start_probe_temp,
+            "thickness_cm": self._thickness_cm,
+            "strategy": self._calculator.strategy,
+            "estimator_scores": self._last_cook_scores if self._cooking_end_time else None,
+        }
+        # The history lists are replaced (not mutated) by the reset: no copy needed
+        self.hass.async_create_task(
+            self._async_archive_session(archive, session, self._temp_history, self._ambient_history)
+        )
+
+    async def _async_archive_session(
+        self,
+        archive: SessionArchive,
+        session: dict[str, Any],
+        temp_history: list[tuple[datetime, float]],
+        ambient_history: list[tuple[datetime, float]],
+    ) -> None:
+        """Write a session in the executor; a failure only loses the archive entry."""
+        try:
+            session_id = await self.hass.async_add_executor_job(
+                self._store_session, archive, session, temp_history, ambient_history
+            )
+        except Exception as e:
+            _LOGGER.warning("Failed to archive cook session: %s", e)
+            return
+        _LOGGER.debug("Archived cook session %s (%s)", session_id, session["outcome"])
+        if session["outcome"] != "done":
+            return
+        # Refit the tables learned from done sessions
+        priors: HeatingPriors | None = self.hass.data.get(DATA_PRIORS)
+        if priors is not None:
+            await priors.async_refit(self.hass, archive)
+        calibration: CarryoverCalibration | None = self.hass.data.get(DATA_CARRYOVER)
+        if calibration is not None:
+            await calibration.async_refit(self.hass, archive)
+
+    @staticmethod
+    def _store_session(
+        archive: SessionArchive,
+        session: dict[str, Any],
+        temp_history: list[tuple[datetime, float]],
+        ambient_history: list[tuple[datetime, float]],
+    ) -> int:
+        """Add the peaks and traces to a session and store it (runs in the executor)."""
+        done_time = session["done_time"]
+        split = bisect.bisect_right(temp_history, done_time, key=_timestamp) if done_time else len(temp_history)
+        cooking, resting = temp_history[:split], temp_history[split:]
+        session["peak_temp"] = max(temp for _, temp in cooking) if cooking else None
+        # Carryover: highest probe reading after the withdrawal (history is kept 1 h past done)
+        session["carryover_peak"] = max(temp for _, temp in resting) if resting else None
+        session["temp_trace"] = temp_history
+        session["ambient_trace"] = ambient_history
+        return archive.add(session)
 
     def set_target_temp(self, temperature: float) -> None:
         """Set target temperature directly - switches to manual mode."""
@@ -652,6 +1842,7 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
             self._food_category = category
             self._food_type = food
             self._food_doneness = doneness
+            self._reset_conduction()  # Geometry and diffusivity depend on the food
             
             temp = get_temperature(category, food, doneness)
             if temp is not None:
@@ -675,3 +1866,13 @@ class AssistantCookerCoordinator(DataUpdateCoordinator):
         self.hass.async_create_task(self.async_save_stored_data())
         
         self.async_set_updated_data(self._build_data())
+
+    def set_thickness(self, thickness_cm: float | None) -> None:
+        """Set the thickness of the piece in cm (0 or None disables the conduction model)."""
+        self._thickness_cm = thickness_cm if thickness_cm else None
+        self._reset_conduction()  # Geometry changed: rebuild from the whole cook
+
+        # Save to storage
+        self.hass.async_create_task(self.async_save_stored_data())
+
+        self.async_set_updated_data(self._build_data())
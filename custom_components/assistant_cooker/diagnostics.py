@@ -0,0 +1,31 @@
+"""Diagnostics support for Assistant Cooker."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_NOTIFY_MOBILE, DOMAIN
+from .coordinator import AssistantCookerCoordinator
+
+TO_REDACT = {CONF_NOTIFY_MOBILE}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry: the replay bundle of the cook, hot-path histograms, outlier filters, history compression and decision trace."""
+    coordinator: AssistantCookerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "bundle": coordinator.replay_bundle(),
+        "metrics": coordinator.metrics.as_dict(),
+        "outlier_filters": coordinator.outlier_stats(),
+        "history_compression": coordinator.compression_stats(),
+        "trace": {"enabled": coordinator.trace.enabled, "records": coordinator.trace.records()},
+        "estimator_scores": coordinator.estimator_scores(),
+    }
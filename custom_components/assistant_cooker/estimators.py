@@ -0,0 +1,227 @@
+"""Remaining-time estimation strategies.
+
+Every strategy implements the Estimator interface and is registered under its
+name in ESTIMATORS; CookingCalculator instantiates the one it is configured
+with. The calculator keeps what all strategies share: change-point
+segmentation, the rising check and minimum rising duration, and (for smoothed
+strategies) clamping and smoothing of the raw estimate.
+
+Strategies reuse the models owned by their calculator (heating-constant
+tracker, curve fit, ambient trajectory model, Kalman filter), so the default
+cascade is the ordered composition of the single-model strategies.
+
+For the decision trace (tracing.py), a strategy reports in `reason` why its
+last estimate was None when a precondition failed, and the cascade reports
+which stage answered (`source`) and why the earlier ones fell back.
+No Home Assistant imports.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .const import (
+    STRATEGY_AMBIENT_MODEL,
+    STRATEGY_CASCADE,
+    STRATEGY_EARLY,
+    STRATEGY_EXPONENTIAL,
+    STRATEGY_KALMAN,
+    STRATEGY_LINEAR,
+    STRATEGY_TWO_POINT,
+)
+
+if TYPE_CHECKING:
+    from .calculations import CookingCalculator
+
+
+class Estimator:
+    """Interface of a remaining-time estimation strategy."""
+
+    name = ""
+    smoothed = True  # Raw estimates are clamped and smoothed by the calculator
+    reason: str | None = None  # Why the last estimate was None (None: no precondition failed)
+
+    def __init__(self, calculator: CookingCalculator) -> None:
+        """Initialize the strategy on the models of its calculator."""
+        self._calculator = calculator
+
+    @property
+    def source(self) -> str | None:
+        """Return the name of the strategy that produced the last estimate."""
+        return self.name
+
+    @property
+    def fallbacks(self) -> list[tuple[str, str]]:
+        """Return the (stage, reason) pairs that fell back during the last estimate."""
+        return []
+
+    def observe(
+        self,
+        temp_history: list[tuple[datetime, float]],
+        ambient_temp: float | None,
+    ) -> None:
+        """Ingest new samples; called on every update, before the gating checks."""
+
+    def estimate(
+        self,
+        current_temp: float,
+        target_temp: float,
+        temp_history: list[tuple[datetime, float]],
+        ambient_temp: float | None,
+        ambient_history: list[tuple[datetime, float]] | None,
+    ) -> float | None:
+        """Return the raw remaining time in minutes (None if not available)."""
+        raise NotImplementedError
+
+
+ESTIMATORS: dict[str, type[Estimator]] = {}
+
+
+def register_estimator(cls: type[Estimator]) -> type[Estimator]:
+    """Register a strategy class under its name."""
+    ESTIMATORS[cls.name] = cls
+    return cls
+
+
+def create_estimator(name: str, calculator: CookingCalculator) -> Estimator:
+    """Return the registered strategy `name` bound to calculator."""
+    if name not in ESTIMATORS:
+        raise ValueError(f"Unknown estimation strategy: {name}")
+    return ESTIMATORS[name](calculator)
+
+
+@register_estimator
+class AmbientModelEstimator(Estimator):
+    """Newton's law integrated over the measured and forecast ambient."""
+
+    name = STRATEGY_AMBIENT_MODEL
+
+    def estimate(self, current_temp, target_temp, temp_history, ambient_temp, ambient_history):
+        """Return the remaining time (needs an ambient history)."""
+        if not ambient_history:
+            self.reason = "no_ambient_history"
+            return None
+        self.reason = None
+        return self._calculator._calculate_ambient_model_remaining(
+            current_temp=current_temp,
+            target_temp=target_temp,
+            temp_history=temp_history,
+            ambient_history=ambient_history,
+        )
+
+
+@register_estimator
+class ExponentialEstimator(Estimator):
+    """Exponential model with the streaming median of k (or the joint curve fit)."""
+
+    name = STRATEGY_EXPONENTIAL
+
+    def estimate(self, current_temp, target_temp, temp_history, ambient_temp, ambient_history):
+        """Return the remaining time."""
+        return self._calculator._calculate_exponential_remaining(
+            current_temp=current_temp,
+            target_temp=target_temp,
+            ambient_temp=ambient_temp,
+            temp_history=temp_history,
+        )
+
+
+@register_estimator
+class LinearEstimator(Estimator):
+    """Linear extrapolation of the heating rate of the last minutes."""
+
+    name = STRATEGY_LINEAR
+
+    def estimate(self, current_temp, target_temp, temp_history, ambient_temp, ambient_history):
+        """Return the remaining time."""
+        return self._calculator._calculate_linear_remaining(
+            remaining_temp=target_temp - current_temp,
+            temp_history=temp_history,
+            current_temp=current_temp,
+        )
+
+
+@register_estimator
+class EarlyEstimator(Estimator):
+    """Average rate since the first sample (works with very little data)."""
+
+    name = STRATEGY_EARLY
+
+    def estimate(self, current_temp, target_temp, temp_history, ambient_temp, ambient_history):
+        """Return the remaining time."""
+        return self._calculator._calculate_early_estimate(
+            current_temp=current_temp,
+            target_temp=target_temp,
+            temp_history=temp_history,
+        )
+
+
+@register_estimator
+class TwoPointEstimator(Estimator):
+    """Newton's law with k from the two ends of the window and the live ambient."""
+
+    name = STRATEGY_TWO_POINT
+
+    def estimate(self, current_temp, target_temp, temp_history, ambient_temp, ambient_history):
+        """Return the remaining time (needs an ambient reading)."""
+        if ambient_temp is None:
+            self.reason = "no_ambient"
+            return None
+        self.reason = None
+        return self._calculator._calculate_newton_remaining(
+            current_temp=current_temp,
+            target_temp=target_temp,
+            ambient_temp=ambient_temp,
+            temp_history=temp_history,
+        )
+
+
+@register_estimator
+class CascadeEstimator(Estimator):
+    """First available of: ambient model, exponential, linear, early estimate."""
+
+    name = STRATEGY_CASCADE
+    stages = (AmbientModelEstimator, ExponentialEstimator, LinearEstimator, EarlyEstimator)
+
+    def __init__(self, calculator: CookingCalculator) -> None:
+        """Initialize the stages on the same calculator."""
+        super().__init__(calculator)
+        self._stages = [stage(calculator) for stage in self.stages]
+        self._answered: int | None = None  # Index of the stage of the last estimate
+
+    @property
+    def source(self) -> str | None:
+        """Return the name of the stage that produced the last estimate."""
+        return self._stages[self._answered].name if self._answered is not None else None
+
+    @property
+    def fallbacks(self) -> list[tuple[str, str]]:
+        """Return the stages tried before the answering one (all of them if none answered)."""
+        tried = self._stages if self._answered is None else self._stages[:self._answered]
+        return [(stage.name, stage.reason or "no_estimate") for stage in tried]
+
+    def estimate(self, current_temp, target_temp, temp_history, ambient_temp, ambient_history):
+        """Return the estimate of the first stage that has one."""
+        for index, stage in enumerate(self._stages):
+            remaining = stage.estimate(current_temp, target_temp, temp_history, ambient_temp, ambient_history)
+            if remaining is not None:
+                self._answered = index
+                return remaining
+        self._answered = None
+        return None
+
+
+@register_estimator
+class KalmanEstimator(Estimator):
+    """Extended Kalman filter on temperature, heating rate and k."""
+
+    name = STRATEGY_KALMAN
+    smoothed = False  # The filter already weighs new samples
+
+    def observe(self, temp_history, ambient_temp):
+        """Feed the new samples to the filter, even while not heating."""
+        self._calculator._feed_kalman(temp_history, ambient_temp)
+
+    def estimate(self, current_temp, target_temp, temp_history, ambient_temp, ambient_history):
+        """Return the remaining time from the filter state."""
+        return self._calculator._calculate_kalman_remaining(target_temp)
@@ -508,6 +508,7 @@ class AssistantCookerCard extends HTMLElement {
     // Update times
     const timeElapsed = this.shadowRoot.querySelector(".time-elapsed");
     const timeRemaining = this.shadowRoot.querySelector(".time-remaining");
+    const timeRemainingSpread = this.shadowRoot.querySelector(".time-remaining-spread");
     const timeStart = this.shadowRoot.querySelector(".time-start");
     const timeEnd = this.shadowRoot.querySelector(".time-end");
     
@@ -543,6 +544,13 @@ class AssistantCookerCard extends HTMLElement {
       
       if (timeElapsed) timeElapsed.textContent = this._formatDuration(elapsed);
       if (timeRemaining) timeRemaining.textContent = (heatingRateValid && remainingTime !== null) ? this._formatDuration(remainingTime * 60) : "--";
+      if (timeRemainingSpread) {
+        // Estimate confidence: half-width of the range given by the IQR of the heating constant
+        const spread = this._stateManager.getEntityAttribute(this._entities.remaining_time, "spread");
+        timeRemainingSpread.textContent = (heatingRateValid && remainingTime !== null && spread !== null && spread !== undefined && spread >= 1)
+          ? `± ${Math.round(spread)} min`
+          : "";
+      }
       if (timeStart) timeStart.textContent = this._formatTime(startTime);
       if (timeEnd) timeEnd.textContent = heatingRateValid ? this._formatTime(estimatedEnd) : "--";
       
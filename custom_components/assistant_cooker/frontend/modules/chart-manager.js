@@ -113,15 +113,13 @@ export class ChartManager {
 
       // Convert history arrays to chart data format
       // History format: [["2026-01-20T16:39:29.532037+00:00", 18.875], ...]
-      const probeData = tempHistory.map(([timestamp, value]) => ({
+      // A null value marks a gap (no reading): kept so the line breaks there
+      const toPoints = (history) => history.map(([timestamp, value]) => ({
         x: new Date(timestamp).getTime(),
         y: value
-      })).filter(d => !isNaN(d.x) && !isNaN(d.y));
-
-      const ambientData = ambientHistory.map(([timestamp, value]) => ({
-        x: new Date(timestamp).getTime(),
-        y: value
-      })).filter(d => !isNaN(d.x) && !isNaN(d.y));
+      })).filter(d => !isNaN(d.x) && (d.y === null || !isNaN(d.y)));
+      const probeData = toPoints(tempHistory);
+      const ambientData = toPoints(ambientHistory);
 
       // Calculate time range
       const graphSpan = this._graphSpan || "auto";
@@ -157,15 +155,17 @@ export class ChartManager {
       // Filter data to visible range
       const visibleProbeData = probeData.filter(d => d.x >= xMin && d.x <= now);
       const visibleAmbientData = ambientData.filter(d => d.x >= xMin && d.x <= now);
+      const probeValues = visibleProbeData.filter(d => d.y !== null);
+      const ambientValues = visibleAmbientData.filter(d => d.y !== null);
 
       // Target and projection lines
       let targetData = [], projectionData = [];
       const isCooking = state === "cooking" || state === "done";
       
-      if (isCooking && withdrawalTemp && visibleProbeData.length > 0) {
+      if (isCooking && withdrawalTemp && probeValues.length > 0) {
         targetData = [{ x: xMin, y: withdrawalTemp }, { x: xMax, y: withdrawalTemp }];
         if (state === "cooking" && remainingTime && remainingTime > 0) {
-          const lastPoint = visibleProbeData[visibleProbeData.length - 1];
+          const lastPoint = probeValues[probeValues.length - 1];
           if (lastPoint) {
             projectionData = [{ x: lastPoint.x, y: lastPoint.y }, { x: now + remainingTime * 60000, y: withdrawalTemp }];
           }
@@ -173,15 +173,15 @@ export class ChartManager {
       }
 
       // Calculate Y axis range
-      let allTemps = visibleProbeData.map(d => d.y);
+      let allTemps = probeValues.map(d => d.y);
       if (withdrawalTemp && isCooking) allTemps.push(withdrawalTemp);
       let minY = allTemps.length ? Math.min(...allTemps) - 2 : 0;
       let maxY = allTemps.length ? Math.max(...allTemps) + 2 : 100;
       if (maxY - minY < 5) { const mid = (maxY + minY) / 2; minY = mid - 2.5; maxY = mid + 2.5; }
 
       let ambientMin = 0, ambientMax = 100;
-      if (visibleAmbientData.length > 0) {
-        const ambientTemps = visibleAmbientData.map(d => d.y);
+      if (ambientValues.length > 0) {
+        const ambientTemps = ambientValues.map(d => d.y);
         ambientMin = Math.min(...ambientTemps) - 10;
         ambientMax = Math.max(...ambientTemps) + 10;
       }
@@ -79,6 +79,7 @@ export class Renderer {
                 <div class="info-block clickable" data-entity="remaining_time">
                   <span class="info-label">${t("remaining")}</span>
                   <span class="info-value time-remaining">--</span>
+                  <span class="info-spread time-remaining-spread"></span>
                 </div>
                 <div class="info-block clickable" data-entity="estimated_end">
                   <span class="info-label">${t("ends_at")}</span>
@@ -233,6 +234,9 @@ export class Renderer {
       .info-block:hover { background: rgba(255,255,255,0.05); }
       .info-label { font-size: 10px; color: var(--text-secondary); text-transform: uppercase; }
       .info-value { font-size: 14px; color: var(--text-primary); font-weight: 500; }
+      .info-spread { font-size: 10px; color: var(--text-secondary); }
+      .info-spread:empty { display: none; }
+      .info-right .info-spread { text-align: right; }
       
       /* Progress ring */
       .progress-container { flex: 0 0 auto; width: 160px; height: 160px; position: relative; cursor: pointer; align-self: center; }
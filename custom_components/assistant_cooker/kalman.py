@@ -0,0 +1,212 @@
+"""Kalman-filter state estimator for the probe temperature.
+
+Extended Kalman filter on the state x = [T, r, k]:
+- T: probe core temperature (°C)
+- r: heating rate dT/dt (°C/min)
+- k: heating constant of Newton's law (1/min)
+
+Under Newton's law with a constant asymptote Ta, r = k·(Ta − T) so
+dr/dt = −k·r, which gives an exact discrete prediction over Δ minutes:
+
+    T' = T + r·(1 − e^(−kΔ))/k
+    r' = r·e^(−kΔ)
+    k' = k (random walk)
+
+Probe samples measure T. An ambient reading, when available, is used as a
+pseudo-measurement of the asymptote Ta = T + r/k. Each sample costs O(1) and
+the covariance gives the uncertainty of the rate and of the remaining time.
+No Home Assistant imports.
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+
+_ONE_MINUTE = timedelta(minutes=1)
+
+
+def _mat_mult(a: list[list[float]], b: list[list[float]]) -> list[list[float]]:
+    """Return a·b for 3x3 matrices."""
+    return [[sum(a[i][m] * b[m][j] for m in range(3)) for j in range(3)] for i in range(3)]
+
+
+def _transpose(a: list[list[float]]) -> list[list[float]]:
+    """Return aᵀ for a 3x3 matrix."""
+    return [[a[j][i] for j in range(3)] for i in range(3)]
+
+
+class HeatingKalmanFilter:
+    """
+    EKF tracking probe temperature, heating rate and heating constant.
+
+    Noise parameters are variances: measurement_variance for probe samples
+    (°C²), ambient_variance for the ambient pseudo-measurement (°C²) and the
+    process noise densities per minute for T, r and k.
+    """
+
+    def __init__(
+        self,
+        measurement_variance: float = 0.1,
+        ambient_variance: float = 25.0,
+        temp_process_noise: float = 0.01,
+        rate_process_noise: float = 0.02,
+        k_process_noise: float = 1e-6,
+        initial_k: float = 0.01,
+        min_k: float = 1e-4,
+        max_k: float = 1.0,
+    ) -> None:
+        """Initialize the filter."""
+        self._measurement_variance = measurement_variance
+        self._ambient_variance = ambient_variance
+        self._process_noise = (temp_process_noise, rate_process_noise, k_process_noise)
+        self._initial_k = initial_k
+        self._min_k = min_k
+        self._max_k = max_k
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the state; the next sample re-initializes the filter."""
+        self._x: list[float] | None = None
+        self._p: list[list[float]] = []
+        self._time: datetime | None = None
+
+    @property
+    def initialized(self) -> bool:
+        """Return True once a sample has been ingested."""
+        return self._x is not None
+
+    @property
+    def last_time(self) -> datetime | None:
+        """Return the timestamp of the last ingested sample."""
+        return self._time
+
+    @property
+    def temperature(self) -> float | None:
+        """Return the filtered probe temperature (°C)."""
+        return self._x[0] if self._x is not None else None
+
+    @property
+    def rate(self) -> float | None:
+        """Return the filtered heating rate (°C/min)."""
+        return self._x[1] if self._x is not None else None
+
+    @property
+    def k(self) -> float | None:
+        """Return the filtered heating constant (1/min)."""
+        return self._x[2] if self._x is not None else None
+
+    @property
+    def rate_stddev(self) -> float | None:
+        """Return the standard deviation of the heating rate (°C/min)."""
+        return math.sqrt(max(self._p[1][1], 0.0)) if self._x is not None else None
+
+    @property
+    def ambient(self) -> float | None:
+        """Return the asymptote implied by the state (T + r/k)."""
+        if self._x is None:
+            return None
+        temp, rate, k = self._x
+        return temp + rate / k
+
+    def update(self, timestamp: datetime, temp: float) -> None:
+        """Predict to timestamp and correct with a probe sample."""
+        if self._x is None:
+            self._x = [temp, 0.0, self._initial_k]
+            self._p = [
+                [self._measurement_variance, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, self._initial_k ** 2],
+            ]
+            self._time = timestamp
+            return
+
+        delta = (timestamp - self._time) / _ONE_MINUTE
+        if delta < 0:
+            return  # Out-of-order sample
+        if delta > 0:
+            self._predict(delta)
+            self._time = timestamp
+
+        self._correct(temp - self._x[0], [1.0, 0.0, 0.0], self._measurement_variance)
+
+    def observe_ambient(self, ambient: float) -> None:
+        """Correct with an ambient reading as a pseudo-measurement of T + r/k."""
+        if self._x is None:
+            return
+        temp, rate, k = self._x
+        if ambient <= temp:
+            return
+        self._correct(
+            ambient - (temp + rate / k),
+            [1.0, 1.0 / k, -rate / (k * k)],
+            self._ambient_variance,
+        )
+
+    def time_to(self, target_temp: float) -> tuple[float, float] | None:
+        """
+        Return (minutes, stddev) until the filtered curve reaches target_temp.
+
+        None if the probe is not heating or the target is beyond the asymptote.
+        """
+        if self._x is None:
+            return None
+        temp, rate, k = self._x
+        remaining = target_temp - temp
+        if remaining <= 0:
+            return 0.0, 0.0
+        if rate <= 0:
+            return None
+
+        # Ta = T + r/k  =>  t = -ln(1 - k·ΔT/r) / k
+        u = 1.0 - k * remaining / rate
+        if u <= 0:
+            return None
+        minutes = -math.log(u) / k
+
+        gradient = [
+            -1.0 / (u * rate),
+            -remaining / (u * rate * rate),
+            math.log(u) / (k * k) + remaining / (k * u * rate),
+        ]
+        variance = sum(
+            gradient[i] * self._p[i][j] * gradient[j] for i in range(3) for j in range(3)
+        )
+        return minutes, math.sqrt(max(variance, 0.0))
+
+    def _predict(self, delta: float) -> None:
+        """Propagate state and covariance over delta minutes."""
+        temp, rate, k = self._x
+        decay = math.exp(-k * delta)
+        if k * delta > 1e-6:
+            gain = (1.0 - decay) / k
+            d_gain = (delta * decay - gain) / k
+        else:
+            gain = delta * (1.0 - k * delta / 2)
+            d_gain = -delta * delta / 2
+
+        self._x = [temp + rate * gain, rate * decay, k]
+
+        jacobian = [
+            [1.0, gain, rate * d_gain],
+            [0.0, decay, -rate * delta * decay],
+            [0.0, 0.0, 1.0],
+        ]
+        p = _mat_mult(_mat_mult(jacobian, self._p), _transpose(jacobian))
+        for i, noise in enumerate(self._process_noise):
+            p[i][i] += noise * delta
+        self._p = p
+
+    def _correct(self, innovation: float, h: list[float], variance: float) -> None:
+        """Apply a scalar measurement with observation row h."""
+        ph = [sum(self._p[i][j] * h[j] for j in range(3)) for i in range(3)]
+        s = sum(h[i] * ph[i] for i in range(3)) + variance
+        if s <= 0:
+            return
+        gain = [value / s for value in ph]
+
+        self._x = [self._x[i] + gain[i] * innovation for i in range(3)]
+        self._x[2] = min(self._max_k, max(self._min_k, self._x[2]))
+
+        # Standard covariance update, symmetrized to limit round-off drift
+        p = [[self._p[i][j] - gain[i] * ph[j] for j in range(3)] for i in range(3)]
+        self._p = [[(p[i][j] + p[j][i]) / 2 for j in range(3)] for i in range(3)]
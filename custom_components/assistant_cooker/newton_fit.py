@@ -0,0 +1,239 @@
+"""Joint least-squares fit of Newton's heating curve.
+
+Fits T(τ) = Ta − (Ta − T0)·e^(−k·τ) over a sliding window, solving for the
+asymptote Ta, the anchor temperature T0 and the heating constant k together.
+τ is in minutes relative to the newest sample of the window (τ <= 0), so T0 is
+the fitted temperature "now" and the curve extrapolates forward from it.
+
+Each update takes a bounded number of Levenberg–Marquardt steps warm-started
+from the previous solution (shifted to the new anchor) on at most max_points
+samples of the window, so the per-tick cost is constant whatever the probe
+update rate. No Home Assistant imports.
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+
+_ONE_MINUTE = timedelta(minutes=1)
+
+
+def _solve3(a: list[list[float]], b: list[float]) -> list[float] | None:
+    """Solve a 3x3 linear system with partial pivoting (None if singular)."""
+    m = [row[:] + [rhs] for row, rhs in zip(a, b)]
+    for col in range(3):
+        pivot = max(range(col, 3), key=lambda r: abs(m[r][col]))
+        if abs(m[pivot][col]) < 1e-12:
+            return None
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(col + 1, 3):
+            factor = m[r][col] / m[col][col]
+            for c in range(col, 4):
+                m[r][c] -= factor * m[col][c]
+    x = [0.0, 0.0, 0.0]
+    for r in (2, 1, 0):
+        x[r] = (m[r][3] - sum(m[r][c] * x[c] for c in range(r + 1, 3))) / m[r][r]
+    return x
+
+
+class NewtonCurveFit:
+    """
+    Warm-started Levenberg–Marquardt fit of (Ta, T0, k).
+
+    After each update, rms is the root mean square residual (°C) over the
+    window and ambient_stderr the standard error of Ta derived from the
+    normal matrix. is_reliable() combines both with basic sanity checks so the
+    caller can fall back to its heuristics when the curve does not identify
+    the asymptote (early, almost linear heating).
+    """
+
+    def __init__(
+        self,
+        iterations: int = 2,
+        initial_iterations: int = 12,
+        max_points: int = 120,
+        min_k: float = 1e-4,
+        max_k: float = 5.0,
+    ) -> None:
+        """Initialize the fit."""
+        self._iterations = iterations
+        self._initial_iterations = initial_iterations
+        self._max_points = max_points
+        self._min_k = min_k
+        self._max_k = max_k
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current solution."""
+        self.ambient: float | None = None
+        self.anchor_temp: float | None = None
+        self.k: float | None = None
+        self.rms: float | None = None
+        self.ambient_stderr: float | None = None
+        self.samples = 0
+        self._anchor_time: datetime | None = None
+        self._damping = 1e-3
+
+    def is_reliable(
+        self,
+        current_temp: float,
+        max_rms: float = 0.5,
+        max_ambient_stderr: float = 20.0,
+        max_ambient: float = 350.0,
+        min_headroom: float = 5.0,
+        max_k: float = 0.5,
+    ) -> bool:
+        """Return True if the last fit can be trusted for extrapolation."""
+        if self.ambient is None or self.rms is None or self.ambient_stderr is None:
+            return False
+        return (
+            self.rms <= max_rms
+            and self.ambient_stderr <= max_ambient_stderr
+            and current_temp + min_headroom <= self.ambient <= max_ambient
+            and self.k <= max_k
+        )
+
+    def update(self, window: list[tuple[datetime, float]]) -> bool:
+        """
+        Refine the fit on a window of (timestamp, temp) samples.
+
+        Returns True if a solution is available afterwards.
+        """
+        if len(window) < 6:
+            return False
+
+        newest = window[-1][0]
+        if self._anchor_time is not None and newest < self._anchor_time:
+            self.reset()  # History was replaced (new cook)
+
+        if len(window) > self._max_points:
+            # Keep the newest sample, thin the rest evenly
+            stride = math.ceil(len(window) / self._max_points)
+            window = window[::-1][::stride][::-1]
+
+        taus = [(t - newest) / _ONE_MINUTE for t, _ in window]
+        temps = [v for _, v in window]
+        if taus[0] > -1.0:
+            return self.ambient is not None  # Less than a minute of data
+
+        if self.ambient is None:
+            params = self._initial_guess(taus, temps)
+            if params is None:
+                return False
+            iterations = self._initial_iterations
+        else:
+            # Shift the previous solution to the new anchor
+            elapsed = (newest - self._anchor_time) / _ONE_MINUTE
+            anchor = self.ambient - (self.ambient - self.anchor_temp) * math.exp(-self.k * elapsed)
+            params = [self.ambient, anchor, self.k]
+            iterations = self._iterations
+
+        cost = self._cost(params, taus, temps)
+        jtj = None
+        for _ in range(iterations):
+            params, cost, jtj = self._step(params, cost, taus, temps)
+
+        self.ambient, self.anchor_temp, self.k = params
+        self._anchor_time = newest
+        self.samples = len(window)
+        self.rms = math.sqrt(cost / len(window))
+        self.ambient_stderr = self._ambient_stderr(jtj, cost, len(window))
+        return True
+
+    def time_to(self, target_temp: float) -> float | None:
+        """Minutes from the anchor until the fitted curve reaches target_temp."""
+        if self.ambient is None or target_temp >= self.ambient:
+            return None
+        if target_temp <= self.anchor_temp:
+            return 0.0
+        ratio = (self.ambient - target_temp) / (self.ambient - self.anchor_temp)
+        return -math.log(ratio) / self.k
+
+    def _initial_guess(self, taus: list[float], temps: list[float]) -> list[float] | None:
+        """Return a starting point from the end slope and a generic asymptote."""
+        split = len(taus) * 3 // 4
+        span = taus[-1] - taus[split]
+        if span <= 0:
+            return None
+        slope = (temps[-1] - temps[split]) / span
+        if slope <= 0:
+            return None
+        ambient = temps[-1] + 100.0
+        return [ambient, temps[-1], max(self._min_k, slope / (ambient - temps[-1]))]
+
+    @staticmethod
+    def _cost(params: list[float], taus: list[float], temps: list[float]) -> float:
+        """Return the sum of squared residuals (inf if the curve overflows)."""
+        ambient, anchor, k = params
+        gap = ambient - anchor
+        try:
+            return math.fsum(
+                (temp - (ambient - gap * math.exp(-k * tau))) ** 2
+                for tau, temp in zip(taus, temps)
+            )
+        except OverflowError:
+            return math.inf
+
+    @staticmethod
+    def _normal_matrix(
+        params: list[float],
+        taus: list[float],
+        temps: list[float],
+    ) -> tuple[list[list[float]], list[float]]:
+        """Return JᵀJ and Jᵀr at params."""
+        ambient, anchor, k = params
+        gap = ambient - anchor
+        s00 = s01 = s02 = s11 = s12 = s22 = 0.0
+        r0 = r1 = r2 = 0.0
+        for tau, temp in zip(taus, temps):
+            decay = math.exp(-k * tau)
+            j0 = 1.0 - decay
+            j2 = gap * tau * decay
+            residual = temp - (ambient - gap * decay)
+            s00 += j0 * j0
+            s01 += j0 * decay
+            s02 += j0 * j2
+            s11 += decay * decay
+            s12 += decay * j2
+            s22 += j2 * j2
+            r0 += j0 * residual
+            r1 += decay * residual
+            r2 += j2 * residual
+        return [[s00, s01, s02], [s01, s11, s12], [s02, s12, s22]], [r0, r1, r2]
+
+    def _step(
+        self,
+        params: list[float],
+        cost: float,
+        taus: list[float],
+        temps: list[float],
+    ) -> tuple[list[float], float, list[list[float]]]:
+        """Take one damped step, retrying with more damping if it does not improve."""
+        jtj, jtr = self._normal_matrix(params, taus, temps)
+        for _ in range(4):
+            damped = [row[:] for row in jtj]
+            for i in range(3):
+                damped[i][i] += self._damping * max(jtj[i][i], 1e-9)
+            delta = _solve3(damped, jtr)
+            if delta is None:
+                self._damping *= 10
+                continue
+            candidate = [p + d for p, d in zip(params, delta)]
+            candidate[2] = min(self._max_k, max(self._min_k, candidate[2]))
+            candidate_cost = self._cost(candidate, taus, temps)
+            if candidate_cost < cost:
+                self._damping = max(1e-7, self._damping / 3)
+                return candidate, candidate_cost, jtj
+            self._damping = min(1e6, self._damping * 4)
+        return params, cost, jtj
+
+    @staticmethod
+    def _ambient_stderr(jtj: list[list[float]] | None, cost: float, samples: int) -> float | None:
+        """Return the standard error of Ta from the inverse normal matrix."""
+        dof = samples - 3
+        if jtj is None or dof <= 0:
+            return None
+        column = _solve3(jtj, [1.0, 0.0, 0.0])
+        if column is None or column[0] < 0:
+            return None
+        return math.sqrt(column[0] * cost / dof)
@@ -0,0 +1,229 @@
+"""Per-food heating priors learned from archived cooks.
+
+Each finished ("done") session of the archive is reduced to Newton's law
+parameters: the heating constant k (1/min) and the effective asymptote Ta
+(°C), from the ambient trace when there is one (median ambient, then k by
+least squares on ln((Ta − T0)/(Ta − T)) = k·t), otherwise from a joint curve
+fit of the probe trace. The medians per key
+
+    (category, food, carryover type, ambient band)
+
+and per coarser key (any band; carryover type only) form the prior table.
+A prior gives a remaining time from the first probe reading of a cook; the
+coordinator blends it into the live estimate over the first minutes.
+
+Fitting reads the whole archive and runs as a background batch in the
+executor (HeatingPriors.async_refit); the table is cached in a Store passed in
+by the integration setup. No Home Assistant imports.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import statistics
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from .food_data import get_carryover_type
+from .newton_fit import NewtonCurveFit
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.storage import Store
+
+    from .archive import SessionArchive
+
+_LOGGER = logging.getLogger(__name__)
+
+_ONE_MINUTE = timedelta(minutes=1)
+_ANY = "*"
+
+# Upper bounds (°C) of the ambient bands; above the last one: "very_high"
+AMBIENT_BANDS = ((100.0, "low"), (150.0, "medium"), (200.0, "high"))
+AMBIENT_BAND_NONE = "none"  # No ambient sensor
+
+
+def ambient_band(ambient: float | None) -> str:
+    """Return the band name of an ambient temperature."""
+    if ambient is None:
+        return AMBIENT_BAND_NONE
+    for upper, name in AMBIENT_BANDS:
+        if ambient < upper:
+            return name
+    return "very_high"
+
+
+def prior_keys(category: str, food: str, carryover_type: str, band: str) -> list[str]:
+    """Return the table keys of a cook, most specific first."""
+    return [
+        "|".join((category, food, carryover_type, band)),
+        "|".join((category, food, carryover_type, _ANY)),
+        "|".join((_ANY, _ANY, carryover_type, band)),
+        "|".join((_ANY, _ANY, carryover_type, _ANY)),
+    ]
+
+
+def fit_session(
+    temp_trace: list[tuple[datetime, float]],
+    ambient_trace: list[tuple[datetime, float]],
+    done_time: datetime | None = None,
+    min_minutes: float = 5.0,
+) -> tuple[float, float] | None:
+    """Return (k, Ta) of a cook up to its done time (None if not identifiable)."""
+    if done_time is not None:
+        temp_trace = [point for point in temp_trace if point[0] <= done_time]
+    if len(temp_trace) < 6:
+        return None
+    start_time, start_temp = temp_trace[0]
+    if (temp_trace[-1][0] - start_time) / _ONE_MINUTE < min_minutes:
+        return None
+    peak = max(temp for _, temp in temp_trace)
+
+    ambients = [temp for timestamp, temp in ambient_trace if start_time <= timestamp <= temp_trace[-1][0]]
+    if ambients:
+        ambient = statistics.median(ambients)
+    else:
+        fit = NewtonCurveFit(initial_iterations=30)
+        if not fit.update(temp_trace) or not fit.is_reliable(peak, max_rms=1.0, max_k=1.0):
+            return None
+        ambient = fit.ambient
+    if ambient < peak + 5.0:
+        return None
+
+    # k through the origin: ln((Ta − T0)/(Ta − T)) = k·t
+    numerator = denominator = 0.0
+    for timestamp, temp in temp_trace[1:]:
+        if ambient - temp < 1.0:
+            continue
+        t = (timestamp - start_time) / _ONE_MINUTE
+        y = math.log((ambient - start_temp) / (ambient - temp))
+        numerator += t * y
+        denominator += t * t
+    if denominator <= 0 or numerator <= 0:
+        return None
+    return numerator / denominator, ambient
+
+
+def fit_priors(sessions: list[dict[str, Any]], min_sessions: int = 2) -> dict[str, dict[str, float]]:
+    """
+    Return the prior table of archived sessions.
+
+    Each session needs food_category, food_type, done_time, temp_trace and
+    ambient_trace (as returned by SessionArchive.iter_sessions). Keys with
+    fewer than min_sessions fitted sessions are left out.
+    """
+    samples: dict[str, list[tuple[float, float]]] = defaultdict(list)
+    for session in sessions:
+        fitted = fit_session(session["temp_trace"], session["ambient_trace"], session["done_time"])
+        if fitted is None:
+            continue
+        category, food = session["food_category"], session["food_type"]
+        band = ambient_band(fitted[1] if session["ambient_trace"] else None)
+        for key in prior_keys(category, food, get_carryover_type(category, food), band):
+            samples[key].append(fitted)
+
+    return {
+        key: {
+            "k": statistics.median(k for k, _ in fitted),
+            "ambient": statistics.median(ambient for _, ambient in fitted),
+            "sessions": len(fitted),
+        }
+        for key, fitted in samples.items()
+        if len(fitted) >= min_sessions
+    }
+
+
+class HeatingPriors:
+    """Prior table lookup and background refit."""
+
+    def __init__(
+        self,
+        data: dict[str, Any] | None = None,
+        store: Store | None = None,
+        min_sessions: int = 2,
+        max_sessions: int | None = None,
+    ) -> None:
+        """Initialize from cached data ({"priors", "sessions", "fitted_at"}) saved to store."""
+        data = data or {}
+        self._store = store
+        self._min_sessions = min_sessions
+        self._max_sessions = max_sessions
+        self._table: dict[str, dict[str, float]] = data.get("priors", {})
+        self.sessions: int = data.get("sessions", 0)  # Archived sessions read by the last fit
+        self.fitted_at: str | None = data.get("fitted_at")
+        self._refitting = False
+        self._refit_pending = False
+
+    def __len__(self) -> int:
+        """Return the number of keys in the table."""
+        return len(self._table)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cacheable form of the table."""
+        return {"priors": self._table, "sessions": self.sessions, "fitted_at": self.fitted_at}
+
+    def lookup(self, category: str, food: str, ambient: float | None) -> dict[str, float] | None:
+        """Return the most specific prior for a cook (None if nothing was learned)."""
+        band = ambient_band(ambient)
+        for key in prior_keys(category, food, get_carryover_type(category, food), band):
+            prior = self._table.get(key)
+            if prior is not None:
+                return prior
+        return None
+
+    def remaining(
+        self,
+        category: str,
+        food: str,
+        current_temp: float,
+        target_temp: float,
+        ambient: float | None,
+    ) -> float | None:
+        """
+        Return the prior remaining time (minutes) from the current probe temperature.
+
+        The live ambient replaces the learned asymptote when it is usable.
+        """
+        prior = self.lookup(category, food, ambient)
+        if prior is None:
+            return None
+        if current_temp >= target_temp:
+            return 0.0
+        asymptote = ambient if ambient is not None and ambient > target_temp + 5.0 else prior["ambient"]
+        if asymptote <= target_temp:
+            return None
+        ratio = (asymptote - target_temp) / (asymptote - current_temp)
+        if not 0 < ratio < 1:
+            return None
+        return min(-math.log(ratio) / prior["k"], 1440.0)
+
+    async def async_refit(self, hass: HomeAssistant, archive: SessionArchive) -> None:
+        """Refit the table from the archive in the executor and cache it (one run at a time)."""
+        if self._refitting:
+            self._refit_pending = True
+            return
+        self._refitting = True
+        try:
+            while True:
+                self._refit_pending = False
+                try:
+                    table, sessions = await hass.async_add_executor_job(self._fit_archive, archive)
+                except Exception as e:  # Keep the cached table
+                    _LOGGER.warning("Failed to fit heating priors: %s", e)
+                    return
+                self._table = table
+                self.sessions = sessions
+                self.fitted_at = datetime.now().astimezone().isoformat()
+                if self._store is not None:
+                    await self._store.async_save(self.as_dict())
+                _LOGGER.debug("Fitted %s heating priors from %s sessions", len(table), sessions)
+                if not self._refit_pending:
+                    return
+        finally:
+            self._refitting = False
+
+    def _fit_archive(self, archive: SessionArchive) -> tuple[dict[str, dict[str, float]], int]:
+        """Read the latest done sessions and fit the table (runs in the executor)."""
+        sessions = list(archive.iter_sessions(outcome="done", limit=self._max_sessions))
+        return fit_priors(sessions, self._min_sessions), len(sessions)
@@ -12,6 +12,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfTemperature,
     UnitOfTime,
 )
@@ -22,12 +23,32 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    ATTR_RAW_TARGET,
     ATTR_CATEGORY,
     ATTR_TREND,
     ATTR_TOTAL_ESTIMATED,
+    ATTR_SPREAD,
+    ATTR_HEATING_CONSTANT,
+    ATTR_HEATING_CONSTANT_IQR,
+    ATTR_FITTED_AMBIENT,
+    ATTR_FIT_RMS,
+    ATTR_STDDEV,
+    ATTR_STRATEGY,
+    ATTR_TREND_RATE,
+    ATTR_FORECAST_PLATEAU,
+    ATTR_THICKNESS,
+    ATTR_CONDUCTION_REMAINING,
+    ATTR_CONDUCTION_CORE_TEMP,
+    ATTR_DIFFUSIVITY,
+    ATTR_LOOP_TIME,
+    ATTR_ESTIMATOR_TIME,
+    ATTR_ESTIMATOR_OVERRUNS,
+    ATTR_SHADOW_TIME,
+    ATTR_PRIOR_REMAINING,
+    ATTR_METRICS_SINCE,
+    ATTR_OUTLIERS,
 )
 from .coordinator import AssistantCookerCoordinator
+from .metrics import STAGE_LATENCY, STAGES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +74,7 @@ async def async_setup_entry(
         AssistantCookerFoodTypeSensor(coordinator),
         AssistantCookerDonenessSensor(coordinator),
         AssistantCookerDisconnectDurationSensor(coordinator),
+        AssistantCookerMetricsSensor(coordinator),
     ]
 
     # Add ambient temperature sensors if configured
@@ -108,6 +130,16 @@ class AssistantCookerBaseSensor(CoordinatorEntity, SensorEntity):
 class AssistantCookerStateSensor(AssistantCookerBaseSensor):
     """Sensor for cooking state."""
 
+    # Rewritten every tick: published for the card, kept out of the recorder
+    _unrecorded_attributes = frozenset({
+        "temp_history",
+        "ambient_history",
+        ATTR_LOOP_TIME,
+        ATTR_ESTIMATOR_TIME,
+        ATTR_ESTIMATOR_OVERRUNS,
+        ATTR_SHADOW_TIME,
+    })
+
     def __init__(self, coordinator: AssistantCookerCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, "state", "State")
@@ -136,6 +168,10 @@ class AssistantCookerStateSensor(AssistantCookerBaseSensor):
             "food_doneness": data.get("food_doneness"),
             "temp_history": data.get("temp_history"),
             "ambient_history": data.get("ambient_history"),
+            ATTR_LOOP_TIME: data.get("loop_time_ms"),
+            ATTR_ESTIMATOR_TIME: data.get("estimator_time_ms"),
+            ATTR_ESTIMATOR_OVERRUNS: data.get("estimator_overruns"),
+            ATTR_SHADOW_TIME: data.get("shadow_time_ms"),
         }
 
 
@@ -154,10 +190,17 @@ class AssistantCookerProbeTempSensor(AssistantCookerBaseSensor):
         """Return the temperature."""
         return self.coordinator.data.get("probe_temp")
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return {ATTR_OUTLIERS: self.coordinator.data.get("probe_outliers")}
+
 
 class AssistantCookerAmbientTempSensor(AssistantCookerBaseSensor):
     """Sensor for ambient temperature."""
 
+    _unrecorded_attributes = frozenset({ATTR_TREND_RATE, ATTR_FORECAST_PLATEAU})
+
     def __init__(self, coordinator: AssistantCookerCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, "ambient_temp", "Ambient Temperature")
@@ -170,6 +213,15 @@ class AssistantCookerAmbientTempSensor(AssistantCookerBaseSensor):
         """Return the temperature."""
         return self.coordinator.data.get("ambient_temp")
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return {
+            ATTR_TREND_RATE: self.coordinator.data.get("ambient_trend"),
+            ATTR_FORECAST_PLATEAU: self.coordinator.data.get("ambient_plateau"),
+            ATTR_OUTLIERS: self.coordinator.data.get("ambient_outliers"),
+        }
+
 
 class AssistantCookerTargetTempSensor(AssistantCookerBaseSensor):
     """Sensor for target/withdrawal temperature."""
@@ -259,14 +311,27 @@ class AssistantCookerEstimatedEndSensor(AssistantCookerBaseSensor):
 
 
 class AssistantCookerRemainingTimeSensor(AssistantCookerBaseSensor):
-    """Sensor for remaining cooking time."""
+    """Sensor for remaining cooking time (no state class: a countdown has no useful long-term statistics)."""
+
+    # Estimator internals, updated every tick
+    _unrecorded_attributes = frozenset({
+        ATTR_TOTAL_ESTIMATED,
+        ATTR_SPREAD,
+        ATTR_HEATING_CONSTANT,
+        ATTR_HEATING_CONSTANT_IQR,
+        ATTR_FITTED_AMBIENT,
+        ATTR_FIT_RMS,
+        ATTR_CONDUCTION_REMAINING,
+        ATTR_CONDUCTION_CORE_TEMP,
+        ATTR_DIFFUSIVITY,
+        ATTR_PRIOR_REMAINING,
+    })
 
     def __init__(self, coordinator: AssistantCookerCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, "remaining_time", "Remaining Time")
         self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
         self._attr_icon = "mdi:timer-sand"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def native_value(self) -> float | None:
@@ -278,18 +343,28 @@ class AssistantCookerRemainingTimeSensor(AssistantCookerBaseSensor):
         """Return extra attributes."""
         return {
             ATTR_TOTAL_ESTIMATED: self.coordinator.data.get("total_estimated"),
+            ATTR_SPREAD: self.coordinator.data.get("remaining_time_spread"),
+            ATTR_HEATING_CONSTANT: self.coordinator.data.get("heating_constant"),
+            ATTR_HEATING_CONSTANT_IQR: self.coordinator.data.get("heating_constant_iqr"),
+            ATTR_FITTED_AMBIENT: self.coordinator.data.get("fitted_ambient"),
+            ATTR_FIT_RMS: self.coordinator.data.get("fit_rms"),
+            ATTR_STRATEGY: self.coordinator.data.get("estimation_strategy"),
+            ATTR_THICKNESS: self.coordinator.data.get("thickness"),
+            ATTR_CONDUCTION_REMAINING: self.coordinator.data.get("conduction_remaining_time"),
+            ATTR_CONDUCTION_CORE_TEMP: self.coordinator.data.get("conduction_core_temp"),
+            ATTR_DIFFUSIVITY: self.coordinator.data.get("conduction_diffusivity"),
+            ATTR_PRIOR_REMAINING: self.coordinator.data.get("prior_remaining_time"),
         }
 
 
 class AssistantCookerProgressSensor(AssistantCookerBaseSensor):
-    """Sensor for cooking progress."""
+    """Sensor for cooking progress (no state class: per-cook, no useful long-term statistics)."""
 
     def __init__(self, coordinator: AssistantCookerCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, "progress", "Progress")
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_icon = "mdi:percent"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def native_value(self) -> float | None:
@@ -301,14 +376,15 @@ class AssistantCookerProgressSensor(AssistantCookerBaseSensor):
 
 
 class AssistantCookerHeatingRateSensor(AssistantCookerBaseSensor):
-    """Sensor for heating rate."""
+    """Sensor for heating rate (no state class: per-cook, no useful long-term statistics)."""
+
+    _unrecorded_attributes = frozenset({ATTR_STDDEV})
 
     def __init__(self, coordinator: AssistantCookerCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, "heating_rate", "Heating Rate")
         self._attr_native_unit_of_measurement = "°C/min"
         self._attr_icon = "mdi:trending-up"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def native_value(self) -> float | None:
@@ -327,7 +403,10 @@ class AssistantCookerHeatingRateSensor(AssistantCookerBaseSensor):
             trend = "decreasing"
         else:
             trend = "stable"
-        return {ATTR_TREND: trend}
+        return {
+            ATTR_TREND: trend,
+            ATTR_STDDEV: self.coordinator.data.get("heating_rate_stddev"),
+        }
 
 
 class AssistantCookerFoodTypeSensor(AssistantCookerBaseSensor):
@@ -414,3 +493,37 @@ class AssistantCookerDisconnectDurationSensor(AssistantCookerBaseSensor):
     def native_value(self) -> float | None:
         """Return disconnect duration in seconds."""
         return self.coordinator.data.get("disconnect_duration")
+
+
+class AssistantCookerMetricsSensor(AssistantCookerBaseSensor):
+    """Diagnostic sensor for the hot-path timing histograms (records only while enabled)."""
+
+    _unrecorded_attributes = frozenset({ATTR_METRICS_SINCE, *STAGES})
+
+    def __init__(self, coordinator: AssistantCookerCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "hot_path_latency", "Hot Path Latency")
+        self._attr_native_unit_of_measurement = UnitOfTime.MICROSECONDS
+        self._attr_icon = "mdi:timer-cog-outline"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+
+    async def async_added_to_hass(self) -> None:
+        """Start recording when the entity is enabled."""
+        await super().async_added_to_hass()
+        self.coordinator.metrics.enabled = True
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop recording when the entity is disabled or removed."""
+        self.coordinator.metrics.enabled = False
+        await super().async_will_remove_from_hass()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the 95th percentile of the event-to-state latency in µs."""
+        return self.coordinator.metrics.summary()[STAGE_LATENCY]["p95_us"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the per-stage summaries."""
+        return {ATTR_METRICS_SINCE: self.coordinator.metrics.since, **self.coordinator.metrics.summary()}
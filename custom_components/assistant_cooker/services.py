@@ -118,3 +118,17 @@ async def async_set_carryover(call: ServiceCall) -> None:
     
     coordinator.set_carryover_enabled(enabled)
     _LOGGER.info("Set carryover compensation to %s for %s", enabled, entity_id)
+
+
+async def async_set_thickness(call: ServiceCall) -> None:
+    """Handle set_thickness service call."""
+    hass = call.hass
+    entity_id = call.data["entity_id"]
+    thickness = call.data["thickness"]
+    
+    coordinator = _get_coordinator_for_entity(hass, entity_id)
+    if coordinator is None:
+        return
+    
+    coordinator.set_thickness(thickness)
+    _LOGGER.info("Set thickness to %s cm for %s", thickness, entity_id)
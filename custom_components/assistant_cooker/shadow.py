@@ -0,0 +1,168 @@
+"""Shadow evaluation of the estimation strategies.
+
+While a cook runs, every strategy other than the configured one runs in
+shadow on the same samples (each with its own CookingCalculator). At most one
+prediction per minute and per strategy is kept, as a predicted done time. When
+the cook finishes, the predictions are scored against the actual done time:
+count, mean absolute error, bias and mean absolute error over the last 30
+minutes, plus the CPU time per update. The primary strategy's own results are
+recorded the same way so all strategies are comparable.
+
+Scores are sums, so cooks can be merged into running totals (persisted by the
+coordinator) and averaged by summarize(). No Home Assistant imports; updates
+are meant to run in an executor.
+"""
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from .calculations import CookingCalculator
+
+_LATE_WINDOW = timedelta(minutes=30)
+_SCORE_KEYS = ("cooks", "predictions", "abs_error", "error", "late_predictions", "late_abs_error", "cpu_ms", "updates")
+
+
+class _Track:
+    """Predictions and CPU time of one strategy during a cook."""
+
+    def __init__(self) -> None:
+        """Initialize an empty track."""
+        self.predictions: list[tuple[datetime, datetime]] = []  # (made at, predicted done)
+        self.last_record: datetime | None = None
+        self.cpu_ms = 0.0
+        self.updates = 0
+
+
+class ShadowEvaluator:
+    """Run strategies in shadow and score their predictions."""
+
+    def __init__(
+        self,
+        strategies: list[str],
+        primary: str,
+        record_seconds: float = 60.0,
+        backend: str | None = None,
+    ) -> None:
+        """Initialize one calculator per shadow strategy and a track for each strategy."""
+        self._calculators = {
+            name: CookingCalculator(backend=backend, strategy=name) for name in strategies
+        }
+        self._primary = primary
+        self._record_interval = timedelta(seconds=record_seconds)
+        # Created up front: the primary is recorded from the event loop while a
+        # shadow update may be running in the executor
+        self._tracks = {name: _Track() for name in [primary, *strategies]}
+
+    @property
+    def primary(self) -> str:
+        """Return the name of the primary strategy."""
+        return self._primary
+
+    @property
+    def strategies(self) -> list[str]:
+        """Return the names of the shadow strategies."""
+        return list(self._calculators)
+
+    def prime(self, temp_history: list[tuple[datetime, float]]) -> None:
+        """Re-prime the shadow calculators from a backfilled history."""
+        for calculator in self._calculators.values():
+            calculator.prime(temp_history)
+
+    def update(
+        self,
+        now: datetime,
+        current_temp: float,
+        target_temp: float,
+        temp_history: list[tuple[datetime, float]],
+        ambient_temp: float | None,
+        ambient_history: list[tuple[datetime, float]] | None,
+    ) -> float:
+        """Run every shadow strategy once; return the total CPU time (ms)."""
+        total_ms = 0.0
+        for name, calculator in self._calculators.items():
+            start = time.perf_counter()
+            remaining = calculator.calculate_remaining_time(
+                current_temp=current_temp,
+                target_temp=target_temp,
+                temp_history=temp_history,
+                ambient_temp=ambient_temp,
+                ambient_history=ambient_history,
+            )
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.record(name, now, remaining, duration_ms)
+            total_ms += duration_ms
+        return total_ms
+
+    def record(self, name: str, now: datetime, remaining: float | None, duration_ms: float | None) -> None:
+        """
+        Account one update of a strategy and keep its prediction (one per interval).
+
+        duration_ms None leaves the CPU time alone (catch-up work of the primary).
+        """
+        track = self._tracks.get(name)
+        if track is None:
+            return
+        if duration_ms is not None:
+            track.cpu_ms += duration_ms
+            track.updates += 1
+        if remaining is None:
+            return
+        if track.last_record is not None and now - track.last_record < self._record_interval:
+            return
+        track.last_record = now
+        track.predictions.append((now, now + timedelta(minutes=remaining)))
+
+    def score(self, done_time: datetime) -> dict[str, dict[str, float]]:
+        """Return the per-strategy error sums against the actual done time."""
+        scores = {}
+        for name, track in self._tracks.items():
+            score = dict.fromkeys(_SCORE_KEYS, 0.0)
+            score["cooks"] = 1
+            score["cpu_ms"] = track.cpu_ms
+            score["updates"] = track.updates
+            for made, predicted in list(track.predictions):
+                if made > done_time:
+                    continue  # Update that finished after the cook
+                error = (predicted - done_time).total_seconds() / 60
+                score["predictions"] += 1
+                score["abs_error"] += abs(error)
+                score["error"] += error
+                if done_time - made <= _LATE_WINDOW:
+                    score["late_predictions"] += 1
+                    score["late_abs_error"] += abs(error)
+            scores[name] = score
+        return scores
+
+
+def merge_scores(
+    totals: dict[str, dict[str, float]],
+    scores: dict[str, dict[str, float]],
+) -> dict[str, dict[str, float]]:
+    """Return totals with the sums of a cook added."""
+    merged = {name: dict(score) for name, score in totals.items()}
+    for name, score in scores.items():
+        total = merged.setdefault(name, dict.fromkeys(_SCORE_KEYS, 0.0))
+        for key in _SCORE_KEYS:
+            total[key] = total.get(key, 0.0) + score.get(key, 0.0)
+    return merged
+
+
+def summarize(scores: dict[str, dict[str, float]]) -> dict[str, dict[str, Any]]:
+    """Return per-strategy averages (minutes, ms) of score sums."""
+
+    def mean(total: float, count: float, digits: int) -> float | None:
+        return round(total / count, digits) if count else None
+
+    return {
+        name: {
+            "cooks": int(score["cooks"]),
+            "predictions": int(score["predictions"]),
+            "mae": mean(score["abs_error"], score["predictions"], 2),
+            "bias": mean(score["error"], score["predictions"], 2),
+            "late_mae": mean(score["late_abs_error"], score["late_predictions"], 2),
+            "cpu_ms": mean(score["cpu_ms"], score["updates"], 3),
+        }
+        for name, score in scores.items()
+    }
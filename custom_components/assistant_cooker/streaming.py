@@ -0,0 +1,697 @@
+"""Streaming building blocks for the Assistant Cooker estimators and their inputs.
+
+Everything here updates incrementally as samples arrive, so per-tick cost does
+not grow with the length of the cook. No Home Assistant imports: these classes
+are also used by the maintenance scripts.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any
+
+
+class SlidingQuantile:
+    """
+    Quantile of a sliding window with O(log n) insertions and removals.
+
+    Two heaps split the window around the quantile: a max-heap with the lowest
+    values (its top is the quantile) and a min-heap with the rest. Removals are
+    lazy: the entry is only discarded once it reaches the top of its heap.
+    Entries are identified by a caller-provided sequence number so duplicated
+    values are handled correctly.
+
+    The quantile is the element at index int(q * n) of the sorted window, which
+    for q=0.5 matches the values[len(values) // 2] convention of the calculator.
+    """
+
+    def __init__(self, q: float) -> None:
+        """Initialize for quantile q (0 <= q < 1)."""
+        self._q = q
+        self._low: list[tuple[float, int]] = []  # max-heap of (-value, -seq)
+        self._high: list[tuple[float, int]] = []  # min-heap of (value, seq)
+        self._low_size = 0
+        self._high_size = 0
+        self._removed: set[int] = set()
+
+    def __len__(self) -> int:
+        """Return the number of values in the window."""
+        return self._low_size + self._high_size
+
+    @property
+    def value(self) -> float | None:
+        """Return the current quantile (None if the window is empty)."""
+        if not self._low_size:
+            return None
+        self._prune_low()
+        return -self._low[0][0]
+
+    def add(self, value: float, seq: int) -> None:
+        """Add a value to the window."""
+        if self._in_low(value, seq):
+            heapq.heappush(self._low, (-value, -seq))
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, (value, seq))
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, value: float, seq: int) -> None:
+        """Remove a value previously added with the same sequence number."""
+        if self._in_low(value, seq):
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+        self._removed.add(seq)
+        self._prune_low()
+        self._prune_high()
+        self._rebalance()
+
+    def clear(self) -> None:
+        """Empty the window."""
+        self._low.clear()
+        self._high.clear()
+        self._low_size = 0
+        self._high_size = 0
+        self._removed.clear()
+
+    def _in_low(self, value: float, seq: int) -> bool:
+        """Return True if (value, seq) belongs to the low heap."""
+        if not self._low_size:
+            return False
+        self._prune_low()
+        top_value, top_seq = self._low[0]
+        return (value, seq) <= (-top_value, -top_seq)
+
+    def _rebalance(self) -> None:
+        """Move values between heaps so the low heap holds int(q * n) + 1 values."""
+        total = self._low_size + self._high_size
+        target = min(total, int(self._q * total) + 1) if total else 0
+
+        while self._low_size > target:
+            self._prune_low()
+            value, seq = heapq.heappop(self._low)
+            heapq.heappush(self._high, (-value, -seq))
+            self._low_size -= 1
+            self._high_size += 1
+
+        while self._low_size < target:
+            self._prune_high()
+            value, seq = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, -seq))
+            self._high_size -= 1
+            self._low_size += 1
+
+    def _prune_low(self) -> None:
+        """Drop removed entries from the top of the low heap."""
+        while self._low and -self._low[0][1] in self._removed:
+            self._removed.discard(-heapq.heappop(self._low)[1])
+
+    def _prune_high(self) -> None:
+        """Drop removed entries from the top of the high heap."""
+        while self._high and self._high[0][1] in self._removed:
+            self._removed.discard(heapq.heappop(self._high)[1])
+
+
+class HampelFilter:
+    """
+    Causal Hampel filter for a stream of sensor readings.
+
+    A reading is an outlier when it is further from the median of the last
+    accepted readings than threshold scaled MADs (median absolute deviation
+    times 1.4826, the standard deviation for Gaussian noise). The limit never
+    goes below min_deviation plus max_rate times the minutes since the median
+    reading, so a flat window (MAD 0) or a steep but genuine rise is not
+    rejected.
+
+    Outliers are quarantined rather than dropped: max_quarantine mutually
+    consistent outliers in a row are a level shift (probe moved, lid opened)
+    and are released with their original timestamps, the window restarting
+    from them. An accepted reading discards the quarantine. The window also
+    restarts after max_gap_seconds without a reading.
+
+    Readings can carry a key (the source state's last_updated): a reading with
+    the key of the previous one is the same sensor update seen by another tick
+    and gets the same verdict without entering the window, so a glitch held by
+    a slow sensor is not promoted to a level shift by repeated polling.
+
+    Per reading cost is a sort of the window (window 0 passes everything
+    through). No Home Assistant imports.
+    """
+
+    def __init__(
+        self,
+        window: int = 7,
+        threshold: float = 3.0,
+        min_deviation: float = 2.0,
+        max_rate: float = 5.0,
+        max_quarantine: int = 3,
+        max_gap_seconds: float = 120.0,
+    ) -> None:
+        """Initialize with a window of accepted readings (0 disables filtering)."""
+        self.window = window
+        self.threshold = threshold
+        self.min_deviation = min_deviation
+        self.max_rate = max_rate
+        self.max_quarantine = max_quarantine
+        self.max_gap_seconds = max_gap_seconds
+        self._accepted: deque[tuple[datetime, float]] = deque(maxlen=max(window, 1))
+        self._quarantine: list[tuple[datetime, float]] = []
+        self._last_time: datetime | None = None
+        self._last_key: Any = None
+        self._last_value: float | None = None
+        # Counters since creation
+        self.samples = 0  # Distinct readings filtered
+        self.rejected = 0  # Readings quarantined
+        self.released = 0  # Quarantined readings later accepted as a level shift
+        # Last decision, for tracing
+        self.reference: float | None = None
+        self.limit: float | None = None
+
+    @property
+    def quarantined(self) -> int:
+        """Return the number of readings currently in quarantine."""
+        return len(self._quarantine)
+
+    @property
+    def outliers(self) -> int:
+        """Return the number of readings rejected for good or still in quarantine."""
+        return self.rejected - self.released
+
+    def add(self, timestamp: datetime, value: float, key: Any = None) -> list[tuple[datetime, float]]:
+        """Return the readings to append to the history: none, this one, or a released level shift."""
+        if key is not None and key == self._last_key:
+            if self._last_time is not None and timestamp > self._last_time:
+                self._last_time = timestamp
+            return [] if self._quarantine else [(timestamp, self._last_value)]
+        self._last_key = key
+        self.samples += 1
+
+        if (
+            self._last_time is not None
+            and (timestamp - self._last_time).total_seconds() > self.max_gap_seconds
+        ):
+            self._accepted.clear()
+            self._quarantine.clear()
+        self._last_time = timestamp
+
+        if not self._is_outlier(timestamp, value):
+            self._quarantine.clear()
+            return self._accept(timestamp, value)
+
+        self.rejected += 1
+        self._quarantine.append((timestamp, value))
+        if len(self._quarantine) < self.max_quarantine:
+            return []
+        values = [reading[1] for reading in self._quarantine]
+        if max(values) - min(values) > self.limit:
+            del self._quarantine[0]  # Not a level: keep the latest readings on probation
+            return []
+        released = self._quarantine
+        self._quarantine = []
+        self.released += len(released)
+        self._accepted.clear()
+        self._accepted.extend(released)
+        self._last_value = value
+        return released
+
+    def filter_series(self, points: list[tuple[datetime, float]]) -> list[tuple[datetime, float]]:
+        """Return the readings of a series that a fresh filter with the same settings keeps (counted here)."""
+        screen = HampelFilter(
+            self.window, self.threshold, self.min_deviation, self.max_rate,
+            self.max_quarantine, self.max_gap_seconds,
+        )
+        kept = [reading for timestamp, value in points for reading in screen.add(timestamp, value)]
+        self.rejected += screen.outliers
+        return kept
+
+    def stats(self) -> dict[str, Any]:
+        """Return the settings and counters."""
+        return {
+            "window": self.window,
+            "samples": self.samples,
+            "rejected": self.rejected,
+            "released": self.released,
+            "quarantined": self.quarantined,
+        }
+
+    def _accept(self, timestamp: datetime, value: float) -> list[tuple[datetime, float]]:
+        """Add a reading to the window and return it."""
+        self._accepted.append((timestamp, value))
+        self._last_value = value
+        return [(timestamp, value)]
+
+    def _is_outlier(self, timestamp: datetime, value: float) -> bool:
+        """Return True if a reading is too far from the window median (updates reference and limit)."""
+        size = len(self._accepted)
+        if self.window <= 0 or size < 3:
+            self.reference = self.limit = None
+            return False
+        ordered = sorted(self._accepted, key=_reading_value)
+        median_time, median = ordered[size // 2]
+        deviations = sorted(abs(reading[1] - median) for reading in ordered)
+        elapsed_minutes = max(0.0, (timestamp - median_time).total_seconds() / 60)
+        self.reference = median
+        self.limit = max(
+            self.threshold * 1.4826 * deviations[size // 2],
+            self.min_deviation + self.max_rate * elapsed_minutes,
+        )
+        return abs(value - median) > self.limit
+
+
+def _reading_value(reading: tuple[datetime, float]) -> float:
+    """Return the value of a (timestamp, value) reading."""
+    return reading[1]
+
+
+CHANGE_INSERTION = "insertion"  # Probe placed in the food (level change before any heating)
+CHANGE_REINSERTION = "reinsertion"  # Probe moved to another spot (level change afterwards)
+CHANGE_REMOVAL = "removal"  # Food taken off the heat (sustained fall after heating)
+CHANGE_RESUME = "resume"  # Back on the heat (sustained rise after a removal)
+
+
+class ChangePointDetector:
+    """
+    Streaming change-point detector for the probe temperature (CUSUM).
+
+    Level changes: two-sided CUSUM of the innovations e = ΔT − r·Δt, where r
+    is an exponentially weighted heating rate (per-sample slopes clipped to
+    ±max_rate), g⁺ = max(0, g⁺ + e − s) and g⁻ = max(0, g⁻ − e − s) with the
+    slack s = slack + slack_rate·Δt. A statistic above threshold is an
+    insertion (nothing placed or heated yet) or a re-insertion. A sudden drop
+    is caught within a sample or two; a slower one accumulates until it
+    crosses, whatever the spacing of the samples.
+
+    Heat: once the probe has risen heating_rise above the lowest point of
+    its segment, the fall from the running peak beyond fall_slack per minute
+    (max(0, g − ΔT − fall_slack·Δt)) above fall_threshold is a removal;
+    after a removal, the symmetric rise from the running trough is a resume.
+
+    Each change is reported with its onset, the sample where the statistic
+    last left zero (start of the jump, peak or trough), where the new segment
+    starts. A gap longer than max_gap_minutes restarts the detector without a
+    change. O(1) per sample; no Home Assistant imports.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 5.0,
+        slack: float = 0.5,
+        slack_rate: float = 0.5,
+        rate_minutes: float = 1.0,
+        max_rate: float = 10.0,
+        heating_rise: float = 3.0,
+        fall_threshold: float = 1.0,
+        fall_slack: float = 0.2,
+        max_gap_minutes: float = 10.0,
+    ) -> None:
+        """Initialize the detector (temperatures in °C, rates in °C/min)."""
+        self.threshold = threshold
+        self.slack = slack
+        self.slack_rate = slack_rate
+        self.rate_minutes = rate_minutes
+        self.max_rate = max_rate
+        self.heating_rise = heating_rise
+        self.fall_threshold = fall_threshold
+        self.fall_slack = fall_slack
+        self.max_gap_minutes = max_gap_minutes
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything: the next sample starts a fresh segment."""
+        self._time: datetime | None = None
+        self._temp: float | None = None
+        self._placed = False  # A level change or a heating phase was seen
+        self._start_segment(None)
+
+    def state(self) -> dict[str, Any]:
+        """Return the statistics (JSON-serializable) for diagnostics."""
+        return {
+            "rate": self._rate,
+            "level_up": self._up,
+            "level_down": self._down,
+            "fall": self._fall,
+            "rise": self._rise,
+            "heating": self._heating,
+            "off_heat": self._off_heat,
+        }
+
+    def add(self, timestamp: datetime, temp: float) -> tuple[str, datetime] | None:
+        """Ingest a sample; return (change kind, onset) when it completes a change point."""
+        if self._time is None:
+            self._time, self._temp = timestamp, temp
+            self._low = temp
+            return None
+        delta = (timestamp - self._time).total_seconds() / 60
+        if delta <= 0:
+            return None  # Same or older timestamp
+        step = temp - self._temp
+        self._time, self._temp = timestamp, temp
+        if delta > self.max_gap_minutes:
+            self._placed = False
+            self._start_segment(temp)
+            return None
+
+        # Level change: innovations against the rate of the previous samples
+        innovation = step - (self._rate or 0.0) * delta
+        slack = self.slack + self.slack_rate * delta
+        self._up, self._up_onset = _accumulate(self._up, self._up_onset, innovation - slack, timestamp)
+        self._down, self._down_onset = _accumulate(self._down, self._down_onset, -innovation - slack, timestamp)
+        slope = max(-self.max_rate, min(self.max_rate, step / delta))
+        if self._rate is None:
+            self._rate = slope
+        else:
+            self._rate += (1.0 - math.exp(-delta / self.rate_minutes)) * (slope - self._rate)
+        if self._up > self.threshold or self._down > self.threshold:
+            onset = self._up_onset if self._up > self.threshold else self._down_onset
+            kind = CHANGE_REINSERTION if self._placed else CHANGE_INSERTION
+            self._placed = True
+            self._start_segment(temp)
+            return kind, onset
+
+        self._low = min(self._low, temp)
+        if not self._heating and temp - self._low >= self.heating_rise:
+            self._heating = self._placed = True
+
+        if self._off_heat:
+            self._rise, self._rise_onset = _accumulate(
+                self._rise, self._rise_onset, step - self.fall_slack * delta, timestamp
+            )
+            if self._rise > self.fall_threshold:
+                onset = self._rise_onset
+                self._off_heat = False
+                self._rise = self._fall = 0.0
+                return CHANGE_RESUME, onset
+        elif self._heating:
+            self._fall, self._fall_onset = _accumulate(
+                self._fall, self._fall_onset, -step - self.fall_slack * delta, timestamp
+            )
+            if self._fall > self.fall_threshold:
+                onset = self._fall_onset
+                self._off_heat = True
+                self._rise = self._fall = 0.0
+                return CHANGE_REMOVAL, onset
+        return None
+
+    def _start_segment(self, temp: float | None) -> None:
+        """Clear the statistics for a new segment starting at temp."""
+        self._rate: float | None = None
+        self._up = self._down = self._fall = self._rise = 0.0
+        self._up_onset = self._down_onset = self._fall_onset = self._rise_onset = None
+        self._low = temp
+        self._heating = False
+        self._off_heat = False
+
+
+def _accumulate(
+    statistic: float,
+    onset: datetime | None,
+    increment: float,
+    timestamp: datetime,
+) -> tuple[float, datetime | None]:
+    """Return a one-sided CUSUM statistic and its onset after an increment."""
+    if statistic <= 0:
+        onset = timestamp
+    statistic = max(0.0, statistic + increment)
+    return statistic, onset
+
+
+class SampleStatistics:
+    """
+    Online sample interval, quantization step and noise floor of a series.
+
+    - interval: exponentially weighted mean spacing of the samples
+    - change_interval: same for the spacing of value changes; with a
+      quantized or slowly reporting probe, only a change brings information
+    - quantization: smallest non-zero step seen (0.0 until one is seen)
+    - noise: standard deviation from the second differences of the distinct
+      readings, d = (T₂ − T₁) − (T₁ − T₀)·Δ₂/Δ₁, whose variance is
+      σ²·(1 + (1 + r)² + r²) for white noise with r = Δ₂/Δ₁; a linear trend
+      cancels out
+
+    Spacings above max_gap_seconds (probe disconnected) are not averaged.
+    O(1) per sample; no Home Assistant imports.
+    """
+
+    def __init__(self, smoothing_samples: int = 20, max_gap_seconds: float = 120.0) -> None:
+        """Initialize empty statistics (weights of about 1/smoothing_samples)."""
+        self._alpha = 1.0 / smoothing_samples
+        self.max_gap_seconds = max_gap_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.samples = 0
+        self.interval: float | None = None  # Seconds
+        self.change_interval: float | None = None  # Seconds
+        self.quantization = 0.0
+        self._variance: float | None = None
+        self._last_time: datetime | None = None
+        self._last_value: float | None = None
+        # Last two distinct readings (time, value), for the second differences
+        self._changes: deque[tuple[datetime, float]] = deque(maxlen=2)
+
+    @property
+    def noise(self) -> float | None:
+        """Return the noise standard deviation (None until three distinct readings)."""
+        return math.sqrt(self._variance) if self._variance is not None else None
+
+    def state(self) -> dict[str, Any]:
+        """Return the statistics (JSON-serializable) for diagnostics."""
+        noise = self.noise
+        return {
+            "samples": self.samples,
+            "interval_seconds": round(self.interval, 2) if self.interval is not None else None,
+            "change_interval_seconds": round(self.change_interval, 2) if self.change_interval is not None else None,
+            "quantization": round(self.quantization, 4),
+            "noise": round(noise, 4) if noise is not None else None,
+        }
+
+    def add(self, timestamp: datetime, value: float) -> None:
+        """Ingest a sample (time ordered)."""
+        self.samples += 1
+        last_time, last_value = self._last_time, self._last_value
+        self._last_time, self._last_value = timestamp, value
+        if last_time is None:
+            self._changes.append((timestamp, value))
+            return
+        spacing = (timestamp - last_time).total_seconds()
+        if spacing <= 0:
+            return
+        if spacing > self.max_gap_seconds:
+            self._changes.clear()  # Do not difference across the gap
+            self._changes.append((timestamp, value))
+            return
+        self.interval = self._smooth(self.interval, spacing)
+
+        step = abs(value - last_value)
+        if step < 1e-6:
+            return
+        if self.quantization == 0.0 or step < self.quantization:
+            self.quantization = step
+
+        if self._changes:
+            change_time, change_value = self._changes[-1]
+            self.change_interval = self._smooth(self.change_interval, (timestamp - change_time).total_seconds())
+            if len(self._changes) == 2:
+                first_time, first_value = self._changes[0]
+                previous = (change_time - first_time).total_seconds()
+                current = (timestamp - change_time).total_seconds()
+                ratio = current / previous if previous > 0 else 0.0
+                if 0.2 <= ratio <= 5.0:  # Very uneven spacings amplify the trend curvature
+                    d = (value - change_value) - (change_value - first_value) * ratio
+                    self._variance = self._smooth(self._variance, d * d / (1 + (1 + ratio) ** 2 + ratio * ratio))
+        self._changes.append((timestamp, value))
+
+    def _smooth(self, average: float | None, value: float) -> float:
+        """Return an exponentially weighted average updated with value."""
+        return value if average is None else average + self._alpha * (value - average)
+
+
+class GridResampler:
+    """
+    Incremental resampler of an irregular series onto a fixed time grid.
+
+    Bucket i covers [i·step, (i + 1)·step) seconds since the Unix epoch, so
+    the grid does not depend on when the resampler started. Each reading is
+    held until the next one (zero-order hold), for at most max_gap_seconds;
+    a bucket's value is the time-weighted average of the held values over
+    the part of it they cover, stamped at the middle of the bucket. Readings
+    repeated at the same value or clustered in a bucket therefore weigh by
+    the time they held, not by their count.
+
+    A bucket is complete once a reading at or after its end arrives.
+    Buckets no reading covered (the hold expired) produce a single gap
+    marker, (time, None), per run. Constant memory: the open bucket's sums
+    and the last reading; emitted points are never revisited.
+    """
+
+    def __init__(self, step_seconds: float = 5.0, max_gap_seconds: float = 120.0) -> None:
+        """Initialize an empty resampler."""
+        self.step = step_seconds
+        self.max_gap_seconds = max_gap_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the open bucket and the held reading."""
+        self._epoch: datetime | None = None
+        self._bucket: int | None = None  # Index of the open bucket
+        self._sum = 0.0  # ∫ value dt over the covered part of the open bucket
+        self._covered = 0.0  # Seconds
+        self._time: float | None = None  # Integrated up to (seconds since the epoch)
+        self._hold_end = 0.0  # The held reading expires at
+        self._value: float | None = None
+        self._in_gap = False  # A gap marker was emitted since the last point
+
+    def add(self, timestamp: datetime, value: float) -> list[tuple[datetime, float | None]]:
+        """Ingest a reading; return the grid points (and gap markers) it completes."""
+        if self._epoch is None:
+            self._epoch = datetime(1970, 1, 1, tzinfo=timestamp.tzinfo)
+        seconds = (timestamp - self._epoch).total_seconds()
+        points: list[tuple[datetime, float | None]] = []
+        if self._time is None:
+            self._bucket = math.floor(seconds / self.step)
+        elif seconds < self._time:
+            return points  # Older than what was integrated
+        else:
+            self._integrate(seconds, points)
+        self._time = seconds
+        self._value = value
+        self._hold_end = seconds + self.max_gap_seconds
+        return points
+
+    def extend(
+        self,
+        samples: list[tuple[datetime, float]],
+        grid: list[tuple[datetime, float]],
+        gaps: list[datetime] | None = None,
+    ) -> int:
+        """Ingest readings, append the completed points to grid (gap marker times to gaps); return the point count."""
+        count = 0
+        for timestamp, value in samples:
+            for point in self.add(timestamp, value):
+                if point[1] is not None:
+                    grid.append(point)
+                    count += 1
+                elif gaps is not None:
+                    gaps.append(point[0])
+        return count
+
+    def _integrate(self, until: float, points: list[tuple[datetime, float | None]]) -> None:
+        """Integrate the held reading up to until, emitting the buckets that end on the way."""
+        start = self._time
+        while True:
+            bucket_end = (self._bucket + 1) * self.step
+            end = min(until, bucket_end)
+            covered_end = min(end, self._hold_end)
+            if covered_end > start:
+                self._sum += self._value * (covered_end - start)
+                self._covered += covered_end - start
+            if until < bucket_end:
+                return
+            self._close(points)
+            start = bucket_end
+            if start >= self._hold_end and until >= start + self.step:
+                # Hold expired: one marker for the whole run of empty buckets
+                self._mark_gap(self._bucket, points)
+                self._bucket = math.floor(until / self.step)
+
+    def _close(self, points: list[tuple[datetime, float | None]]) -> None:
+        """Emit the open bucket (a point, or a gap marker if nothing covered it) and open the next."""
+        if self._covered > 0:
+            points.append((self._midpoint(self._bucket), round(self._sum / self._covered, 4)))
+            self._in_gap = False
+        else:
+            self._mark_gap(self._bucket, points)
+        self._bucket += 1
+        self._sum = self._covered = 0.0
+
+    def _mark_gap(self, bucket: int, points: list[tuple[datetime, float | None]]) -> None:
+        """Emit a gap marker at a bucket unless the current gap already has one."""
+        if not self._in_gap:
+            points.append((self._midpoint(bucket), None))
+            self._in_gap = True
+
+    def _midpoint(self, bucket: int) -> datetime:
+        """Return the time stamping a bucket (its middle)."""
+        return self._epoch + timedelta(seconds=(bucket + 0.5) * self.step)
+
+
+class HoldCompressor:
+    """
+    Lossless ingest compression of a series read with a zero-order hold.
+
+    A reading holds its value until the next one, so a reading repeating the
+    held value only extends the hold: a deadband of width zero around the
+    last stored value. The series keeps the first reading of each run of
+    equal values and the latest reading, overwritten in place while the run
+    goes on. Two more points keep the hold from expiring where it did not
+    expire live (GridResampler then rebuilds the same grid from the
+    compressed series as from every reading):
+    - once a run outlasts max_gap_seconds, its latest reading is kept and
+      starts the next run (a heartbeat every max_gap_seconds at most);
+    - the last reading before a silence longer than max_gap_seconds is kept.
+
+    The series list belongs to the caller, which may trim or replace it: the
+    compressor only overwrites a tail it wrote itself. O(1) per reading.
+    """
+
+    def __init__(self, max_gap_seconds: float = 120.0) -> None:
+        """Initialize for a hold expiring after max_gap_seconds."""
+        self.max_gap_seconds = max_gap_seconds
+        self.readings = 0
+        self.stored = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the run in progress (the next reading is stored)."""
+        self._anchor: tuple[datetime, float] | None = None  # First reading of the run
+        self._tail: tuple[datetime, float] | None = None  # Last reading written to the series
+        self._repeat = False  # The tail repeats the anchor and may be overwritten
+
+    def add(self, series: list[tuple[datetime, float]], timestamp: datetime, value: float) -> None:
+        """Append a reading to series, or overwrite the repeat at its tail."""
+        self.readings += 1
+        if not series or series[-1] is not self._tail:
+            # Trimmed away, merged or replaced: start over from the series' tail
+            self._anchor = series[-1] if series else None
+            self._repeat = False
+        reading = (timestamp, value)
+        self._tail = reading
+        anchor = self._anchor
+        if anchor is None or (timestamp - series[-1][0]).total_seconds() > self.max_gap_seconds:
+            self._store(series, reading)  # First reading, or after a silence: the tail stays
+            return
+        if self._repeat and (timestamp - anchor[0]).total_seconds() > self.max_gap_seconds:
+            self._anchor = anchor = series[-1]  # Heartbeat: the repeat is kept and starts the run
+            self._repeat = False
+        if self._repeat:
+            series[-1] = reading
+            if value != anchor[1]:
+                self._anchor = reading
+                self._repeat = False
+            return
+        if value == anchor[1]:
+            series.append(reading)
+            self.stored += 1
+            self._repeat = True
+            return
+        self._store(series, reading)
+
+    def extend(self, series: list[tuple[datetime, float]], samples: list[tuple[datetime, float]]) -> None:
+        """Add readings to series in order."""
+        for timestamp, value in samples:
+            self.add(series, timestamp, value)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the readings seen and the points stored (overwritten repeats excluded)."""
+        return {"readings": self.readings, "stored": self.stored}
+
+    def _store(self, series: list[tuple[datetime, float]], reading: tuple[datetime, float]) -> None:
+        """Append a reading starting a new run."""
+        series.append(reading)
+        self.stored += 1
+        self._anchor = reading
+        self._repeat = False
@@ -0,0 +1,60 @@
+"""Structured decision tracing.
+
+A DecisionTrace is a bounded ring buffer of decision records: which strategy
+produced the remaining time and from which inputs, why a stage of the cascade
+fell back, how the carryover and withdrawal temperature were derived. Each
+coordinator owns one and shares it with its calculator.
+
+Recording sites check `trace.enabled` before building anything, so a disabled
+trace costs one attribute read per decision point: no string formatting, no
+record dict. Records are (sequence, wall time, kind, fields) tuples appended
+to a deque; they are only turned into dicts when read. Appends come from the
+event loop and from executor jobs: deque.append and the sequence counter are
+atomic in CPython, so no lock is needed.
+
+No Home Assistant imports.
+"""
+from __future__ import annotations
+
+import itertools
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+TRACE_KIND_ESTIMATE = "estimate"  # Calculator: strategy, stage, inputs, outcome
+TRACE_KIND_REMAINING = "remaining"  # Coordinator: conduction, live estimate or prior
+TRACE_KIND_CARRYOVER = "carryover"
+TRACE_KIND_WITHDRAWAL = "withdrawal"
+TRACE_KIND_FALLBACK = "fallback"  # Strategy or model switched off after overruns
+TRACE_KIND_OUTLIER = "outlier"  # Reading quarantined or released by the outlier filter
+
+
+class DecisionTrace:
+    """Bounded ring buffer of decision records."""
+
+    def __init__(self, size: int = 256, enabled: bool = False) -> None:
+        """Initialize an empty buffer keeping the last size records (recording only while enabled)."""
+        self.enabled = enabled
+        self._records: deque[tuple[int, float, str, dict[str, Any]]] = deque(maxlen=size)
+        self._sequence = itertools.count(1)
+
+    def __len__(self) -> int:
+        """Return the number of buffered records."""
+        return len(self._records)
+
+    def record(self, kind: str, **fields: Any) -> None:
+        """Append a record (callers check enabled first)."""
+        self._records.append((next(self._sequence), time.time(), kind, fields))
+
+    def clear(self) -> None:
+        """Drop the buffered records (sequence numbers keep increasing)."""
+        self._records.clear()
+
+    def records(self, since: int = 0) -> list[dict[str, Any]]:
+        """Return the records with a sequence number above since, oldest first."""
+        return [
+            {"seq": seq, "time": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(), "kind": kind, **fields}
+            for seq, timestamp, kind, fields in list(self._records)
+            if seq > since
+        ]
@@ -0,0 +1,38 @@
+"""
+Helper to import the integration modules from maintenance scripts.
+
+The package __init__.py imports Home Assistant, which is not needed (and often
+not installed) to run the calculation code. This registers the package without
+executing its __init__.py so submodules with relative imports can be loaded:
+
+    from _package import load_package
+    load_package()
+    from assistant_cooker.calculations import CookingCalculator
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+script_dir = Path(__file__).parent
+repo_root = script_dir.parent
+package_dir = repo_root / "custom_components" / "assistant_cooker"
+
+
+def load_package():
+    """Register the assistant_cooker package without running its __init__.py."""
+    if "assistant_cooker" in sys.modules:
+        return sys.modules["assistant_cooker"]
+
+    spec = importlib.util.spec_from_file_location(
+        "assistant_cooker",
+        package_dir / "__init__.py",
+        submodule_search_locations=[str(package_dir)],
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["assistant_cooker"] = package
+    return package
+
+
+def has_homeassistant() -> bool:
+    """Return True if Home Assistant is importable (needed for coordinator code)."""
+    return importlib.util.find_spec("homeassistant") is not None
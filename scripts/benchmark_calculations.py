@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cooking time calculator and coordinator hot paths.
+
+Runs the estimator code against synthetic Newton-law heating curves
+(100 to 50,000 samples, with/without noise, ambient sensor and BBQ stall),
+reports ops/s and peak memory per case and compares against a local baseline.
+
+Usage:
+    python scripts/benchmark_calculations.py                  # run + compare to baseline
+    python scripts/benchmark_calculations.py --save-baseline  # run + store new baseline
+    python scripts/benchmark_calculations.py --sizes 100,1000 --filter heating_rate
+    python scripts/benchmark_calculations.py --backend all     # python and numpy kernels
+    python scripts/benchmark_calculations.py --check-backends  # numpy/python parity check (+ tests/test_backends.py)
+
+The baseline is stored in scripts/temp/ (gitignored): it is machine specific.
+Coordinator cases need Home Assistant installed and are skipped otherwise.
+"""
+import argparse
+import importlib.util
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from _package import has_homeassistant, load_package, repo_root, script_dir
+
+load_package()
+
+from assistant_cooker.calculations import (  # noqa: E402
+    BACKEND_NUMPY,
+    BACKEND_PYTHON,
+    DEFAULT_BACKEND,
+    CookingCalculator,
+    np,
+)
+from assistant_cooker.conduction import ConductionModel  # noqa: E402
+from assistant_cooker.const import DEFAULT_ESTIMATION_STRATEGY, ESTIMATION_STRATEGIES  # noqa: E402
+from assistant_cooker.newton_fit import NewtonCurveFit  # noqa: E402
+from assistant_cooker.shadow import ShadowEvaluator  # noqa: E402
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+DEFAULT_BASELINE = script_dir / "temp" / "benchmark_baseline.json"
+VARIANTS = ["clean", "noise", "ambient", "stall"]
+
+PROBE_ENTITY = "sensor.bench_probe"
+AMBIENT_ENTITY = "sensor.bench_ambient"
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+def newton_curve(
+    samples: int,
+    variant: str,
+    interval_seconds: float = 1.0,
+    seed: int = 42,
+) -> tuple[list[tuple[datetime, float]], list[tuple[datetime, float]]]:
+    """
+    Generate a probe (and ambient) trace following Newton's law of heating.
+
+    T(t) = Ta - (Ta - T0) * e^(-k*t), with k chosen so the trace ends around
+    70°C (a typical roast core temperature). Variants add sensor noise, a
+    cycling oven ambient sensor, or a BBQ stall (flat plateau mid-cook).
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    t_ambient, t_start = 160.0, 5.0
+    duration_min = samples * interval_seconds / 60
+    k = 0.6 / max(duration_min, 1.0)
+
+    noise = 0.0 if variant == "clean" else 0.3
+    stall_start, stall_end = duration_min * 0.4, duration_min * 0.6
+
+    temp_history = []
+    ambient_history = []
+    for i in range(samples):
+        minutes = i * interval_seconds / 60
+        effective = minutes
+        if variant == "stall":
+            # Evaporative stall: temperature stays flat, then the curve resumes
+            if minutes >= stall_end:
+                effective = minutes - (stall_end - stall_start)
+            elif minutes >= stall_start:
+                effective = stall_start
+        temp = t_ambient - (t_ambient - t_start) * math.exp(-k * effective)
+        timestamp = start + timedelta(seconds=i * interval_seconds)
+        temp_history.append((timestamp, temp + rng.gauss(0, noise) if noise else temp))
+
+        if variant == "ambient":
+            oven = t_ambient + 5 * math.sin(2 * math.pi * minutes / 10) + rng.gauss(0, 1.0)
+            ambient_history.append((timestamp, oven))
+
+    return temp_history, ambient_history
+
+
+def recent_window(
+    temp_history: list[tuple[datetime, float]],
+    minutes: float = 3,
+) -> list[tuple[datetime, float]]:
+    """Return the estimator window used in production (last 3 minutes)."""
+    cutoff = temp_history[-1][0] - timedelta(minutes=minutes)
+    return [(t, v) for t, v in temp_history if t > cutoff]
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def measure(func, min_time: float = 0.2) -> tuple[float, int]:
+    """Return (ops per second, peak traced memory in bytes) for func()."""
+    func()  # warm-up
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed < min_time / 10 else 1 + int(min_time / max(elapsed, 1e-9))
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return number / elapsed, peak
+
+
+# ---------------------------------------------------------------------------
+# Calculator cases
+# ---------------------------------------------------------------------------
+
+def calculator_cases(samples: int, variant: str, backend: str):
+    """Yield (name, callable) benchmark cases for calculations.py."""
+    temp_history, ambient_history = newton_curve(samples, variant)
+    current_temp = temp_history[-1][1]
+    target_temp = current_temp + 5
+    ambient_temp = ambient_history[-1][1] if ambient_history else None
+    window = recent_window(temp_history)
+    suffix = "" if backend == DEFAULT_BACKEND else f"@{backend}"
+
+    calculator = CookingCalculator(backend=backend)
+    yield (
+        f"calculate_heating_rate[{variant}-{samples}]{suffix}",
+        lambda: calculator.calculate_heating_rate(temp_history),
+    )
+
+    estimating = CookingCalculator(backend=backend)
+    estimating.prime(temp_history)  # skip the 20s rising wait
+    yield (
+        f"calculate_remaining_time[{variant}-{samples}]{suffix}",
+        lambda: estimating.calculate_remaining_time(
+            current_temp=current_temp,
+            target_temp=target_temp,
+            temp_history=temp_history,
+            ambient_temp=ambient_temp,
+            ambient_history=ambient_history,
+        ),
+    )
+
+    yield (
+        f"_estimate_ambient_from_curve[{variant}-{samples}]{suffix}",
+        lambda: calculator._estimate_ambient_from_curve(window, current_temp),
+    )
+
+    if ambient_history:
+        # Conduction model (needs the ambient): catch-up over 10 minutes, then a prediction
+        use_numpy = backend == BACKEND_NUMPY
+        catch_up = recent_window(temp_history, 10)
+        yield (
+            f"ConductionModel.ingest[{variant}-{samples}]{suffix}",
+            lambda: ConductionModel("cylinder", 0.08, 1.35e-7, 45.0, use_numpy=use_numpy).ingest(
+                catch_up, ambient_history,
+            ),
+        )
+        conduction = ConductionModel("cylinder", 0.08, 1.35e-7, 45.0, use_numpy=use_numpy)
+        conduction.ingest(temp_history, ambient_history)
+        yield (
+            f"ConductionModel.time_to[{variant}-{samples}]{suffix}",
+            lambda: conduction.time_to(target_temp),
+        )
+
+    if backend == DEFAULT_BACKEND:
+        # Every other registered strategy on its own (the default one is above)
+        for strategy in ESTIMATION_STRATEGIES:
+            if strategy == DEFAULT_ESTIMATION_STRATEGY:
+                continue
+            alternative = CookingCalculator(strategy=strategy)
+            alternative.prime(temp_history)
+            yield (
+                f"calculate_remaining_time[{variant}-{samples}]@{strategy}",
+                lambda alternative=alternative: alternative.calculate_remaining_time(
+                    current_temp=current_temp,
+                    target_temp=target_temp,
+                    temp_history=temp_history,
+                    ambient_temp=ambient_temp,
+                    ambient_history=ambient_history,
+                ),
+            )
+
+        # Shadow evaluation of all non-default strategies: one coordinator tick
+        shadow = ShadowEvaluator(
+            [strategy for strategy in ESTIMATION_STRATEGIES if strategy != DEFAULT_ESTIMATION_STRATEGY],
+            DEFAULT_ESTIMATION_STRATEGY,
+        )
+        shadow.prime(temp_history)
+        now = temp_history[-1][0]
+        yield (
+            f"ShadowEvaluator.update[{variant}-{samples}]",
+            lambda: shadow.update(now, current_temp, target_temp, temp_history, ambient_temp, ambient_history),
+        )
+
+        # Warm-started joint fit: one tick = one update on the fit window
+        fit = NewtonCurveFit()
+        fit_window = recent_window(temp_history, 10)
+        fit.update(fit_window)
+        yield (
+            f"NewtonCurveFit.update[{variant}-{samples}]",
+            lambda: fit.update(fit_window),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Coordinator cases (stubbed hass.states)
+# ---------------------------------------------------------------------------
+
+class _StubStates:
+    """Minimal hass.states replacement returning fixed sensor values."""
+
+    def __init__(self) -> None:
+        self._states: dict[str, SimpleNamespace] = {}
+
+    def set(self, entity_id: str, value: float) -> None:
+        self._states[entity_id] = SimpleNamespace(state=str(value), last_updated=datetime.now(timezone.utc))
+
+    def get(self, entity_id: str):
+        return self._states.get(entity_id)
+
+
+def _stub_hass() -> SimpleNamespace:
+    """Build the subset of hass used by the coordinator hot path."""
+    return SimpleNamespace(
+        states=_StubStates(),
+        config=SimpleNamespace(components=set()),
+        data={},
+        async_create_task=lambda coro: coro.close(),
+    )
+
+
+def _build_coordinator(hass, with_ambient: bool):
+    """Create a coordinator without DataUpdateCoordinator/Store/listener setup."""
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+    from assistant_cooker import coordinator as coordinator_module
+
+    config = {"name": "Bench", "probe_sensor": PROBE_ENTITY}
+    if with_ambient:
+        config["ambient_sensor"] = AMBIENT_ENTITY
+    entry = SimpleNamespace(data=config, entry_id="bench", async_on_unload=lambda func: None)
+
+    with mock.patch.object(DataUpdateCoordinator, "__init__", lambda self, *args, **kwargs: None), \
+            mock.patch.object(coordinator_module, "Store"), \
+            mock.patch.object(coordinator_module.AssistantCookerCoordinator, "_setup_listeners"):
+        coordinator = coordinator_module.AssistantCookerCoordinator(hass, entry)
+    coordinator.hass = hass
+    return coordinator
+
+
+def coordinator_cases(samples: int, variant: str):
+    """Yield (name, callable) benchmark cases for coordinator.py."""
+    from homeassistant.util import dt as dt_util
+    from assistant_cooker.const import STATE_COOKING
+
+    temp_history, ambient_history = newton_curve(samples, variant)
+    # Shift the trace so it ends now: trimming in _update_temp_history is time based
+    offset = dt_util.utcnow() - temp_history[-1][0]
+    temp_history = [(t + offset, v) for t, v in temp_history]
+    ambient_history = [(t + offset, v) for t, v in ambient_history]
+
+    hass = _stub_hass()
+    hass.states.set(PROBE_ENTITY, temp_history[-1][1])
+    if ambient_history:
+        hass.states.set(AMBIENT_ENTITY, ambient_history[-1][1])
+
+    coordinator = _build_coordinator(hass, with_ambient=bool(ambient_history))
+    coordinator._state = STATE_COOKING
+    coordinator._start_time = temp_history[0][0]
+    coordinator._start_probe_temp = temp_history[0][1]
+    coordinator._desired_temp = temp_history[-1][1] + 5
+    coordinator._withdrawal_temp = coordinator._desired_temp
+    coordinator._temp_history = list(temp_history)
+    coordinator._ambient_history = list(ambient_history)
+    coordinator._rebuild_grids()
+    temp_grid_size, ambient_grid_size = len(coordinator._temp_grid), len(coordinator._ambient_grid)
+    coordinator._calculator.prime(coordinator._temp_grid)
+
+    def restore_size() -> None:
+        # Each tick appends one live point (and may complete grid points): drop them so every run sees the same history
+        del coordinator._temp_history[samples:]
+        del coordinator._ambient_history[len(ambient_history):]
+        del coordinator._temp_grid[temp_grid_size:]
+        del coordinator._ambient_grid[ambient_grid_size:]
+
+    def filter_readings() -> None:
+        hass.states.set(PROBE_ENTITY, temp_history[-1][1])  # A new reading each run
+        coordinator._filter_readings()
+
+    def update_history() -> None:
+        coordinator._filter_readings()
+        coordinator._update_temp_history()
+        restore_size()
+
+    def build_data() -> None:
+        coordinator._build_data()
+        restore_size()
+
+    def build_data_metrics() -> None:
+        coordinator.metrics.enabled = True
+        coordinator._build_data()
+        coordinator.metrics.enabled = False
+        restore_size()
+
+    yield f"_filter_readings[{variant}-{samples}]", filter_readings
+    yield f"_update_temp_history[{variant}-{samples}]", update_history
+    yield f"_build_data[{variant}-{samples}]", build_data
+    yield f"_build_data+metrics[{variant}-{samples}]", build_data_metrics
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def check_backends(sizes: list[int]) -> int:
+    """
+    Compare the NumPy and pure-Python kernels on every synthetic curve.
+
+    Outputs must be bit-for-bit identical. Returns the number of mismatches.
+    """
+    if np is None:
+        print("⚠️  NumPy not installed: nothing to compare")
+        return 0
+
+    mismatches = 0
+    checked = 0
+    for samples in sizes:
+        for variant in VARIANTS:
+            temp_history, ambient_history = newton_curve(samples, variant)
+            # Replay the cook tick by tick (every 10th sample) like the coordinator does
+            python_calc = CookingCalculator(backend=BACKEND_PYTHON)
+            numpy_calc = CookingCalculator(backend=BACKEND_NUMPY)
+            step = max(1, samples // 500)
+            for end in range(3, samples + 1, step):
+                history = temp_history[:end]
+                ambient = ambient_history[:end]
+                current = history[-1][1]
+                kwargs = {
+                    "current_temp": current,
+                    "target_temp": temp_history[-1][1] + 5,
+                    "temp_history": history,
+                    "ambient_temp": ambient[-1][1] if ambient else None,
+                    "ambient_history": ambient,
+                }
+                for calc in (python_calc, numpy_calc):
+                    calc.prime(history)
+                results = [
+                    (calc.calculate_heating_rate(history), calc.calculate_remaining_time(**kwargs))
+                    for calc in (python_calc, numpy_calc)
+                ]
+                checked += 1
+                if results[0] != results[1]:
+                    mismatches += 1
+                    print(f"  ❌ {variant}-{samples} @ {end}: python={results[0]} numpy={results[1]}")
+
+    status = "✅" if not mismatches else "❌"
+    print(f"{status} Backend parity: {checked} ticks compared, {mismatches} mismatches")
+    return mismatches
+
+
+def run(
+    sizes: list[int],
+    name_filter: str | None,
+    min_time: float,
+    backends: list[str],
+) -> dict[str, dict]:
+    """Run all benchmark cases and return {case: {"ops": ..., "peak": ...}}."""
+    with_coordinator = has_homeassistant()
+    if not with_coordinator:
+        print("⚠️  Home Assistant not installed: coordinator cases skipped")
+
+    results: dict[str, dict] = {}
+    for samples in sizes:
+        for variant in VARIANTS:
+            cases = []
+            for backend in backends:
+                cases.extend(calculator_cases(samples, variant, backend))
+            if with_coordinator:
+                cases.extend(coordinator_cases(samples, variant))
+            for name, func in cases:
+                if name_filter and name_filter not in name:
+                    continue
+                ops, peak = measure(func, min_time)
+                results[name] = {"ops": ops, "peak": peak}
+                print_result(name, ops, peak)
+    return results
+
+
+def print_result(name: str, ops: float, peak: int) -> None:
+    """Print a result line as soon as it is available."""
+    print(f"  {name:<52} {ops:>12,.1f} ops/s {1e6 / ops:>12,.1f} µs {peak / 1024:>10,.1f} KiB")
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> int:
+    """Print the comparison against the baseline, return the number of regressions."""
+    regressions = 0
+    print()
+    print(f"Comparison with baseline (regression if ops/s drops more than {threshold:.0%}):")
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        ratio = result["ops"] / previous["ops"]
+        flag = ""
+        if ratio < 1 - threshold:
+            flag = "  ❌ REGRESSION"
+            regressions += 1
+        elif ratio > 1 + threshold:
+            flag = "  ✅ faster"
+        memory = result["peak"] - previous["peak"]
+        print(f"  {name:<52} x{ratio:>6.2f}  peak {memory / 1024:>+9.1f} KiB{flag}")
+    return regressions
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated sample counts (default: %(default)s)")
+    parser.add_argument("--filter", default=None, help="Only run cases whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum timing per case in seconds")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown reported as regression")
+    parser.add_argument("--backend", choices=[BACKEND_PYTHON, BACKEND_NUMPY, "all"], default=DEFAULT_BACKEND,
+                        help="Calculator kernels to benchmark (default: %(default)s)")
+    parser.add_argument("--check-backends", action="store_true",
+                        help="Only check that NumPy and pure-Python kernels give identical results "
+                             "(also runs tests/test_backends.py)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    if args.check_backends:
+        print(f"Checking calculator backend parity (sizes: {sizes})...")
+        failed = check_backends(sizes) > 0
+        # The pytest module is the regular guard: run it too
+        if importlib.util.find_spec("pytest") is None:
+            print("⚠️  pytest not installed: tests/test_backends.py skipped")
+        else:
+            import pytest
+
+            failed |= pytest.main(["-q", str(repo_root / "tests" / "test_backends.py")]) != 0
+        if failed:
+            sys.exit(1)
+        return
+
+    backends = [args.backend] if args.backend != "all" else [BACKEND_PYTHON, BACKEND_NUMPY]
+    if BACKEND_NUMPY in backends and np is None:
+        print("⚠️  NumPy not installed: numpy backend skipped")
+        backends.remove(BACKEND_NUMPY)
+
+    print(f"Benchmarking calculator hot paths (sizes: {sizes}, backends: {backends})...")
+    results = run(sizes, args.filter, args.min_time, backends)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n✅ Baseline saved: {args.baseline}")
+        return
+
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+    else:
+        print(f"\nNo baseline at {args.baseline} (use --save-baseline to create one)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the time-series codec used for stored and transferred traces.
+
+Encodes synthetic Newton-law probe traces (and the ambient trace of the
+"ambient" variant) with codec.py and reports bytes per point against the JSON
+[isoformat, float] pairs of the frontend history, plus encode and decode
+throughput in points per second. Every trace is also round-tripped and
+checked (timestamps within half a tick, values equal to the quantized input).
+
+Usage:
+    python scripts/benchmark_codec.py
+    python scripts/benchmark_codec.py --sizes 1000 --interval 5 --resolution 1000
+"""
+import argparse
+import json
+import sys
+
+from _package import load_package
+from benchmark_calculations import VARIANTS, measure, newton_curve
+
+load_package()
+
+from assistant_cooker.codec import (  # noqa: E402
+    DEFAULT_TIME_RESOLUTION_MS,
+    decode_series,
+    encode_series,
+    quantize,
+)
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+
+def check_round_trip(points, data: bytes, resolution_ms: int) -> bool:
+    """Return True if data decodes to points (within the codec precision)."""
+    decoded = decode_series(data)
+    if len(decoded) != len(points):
+        return False
+    tolerance = resolution_ms / 2000 + 1e-6
+    return all(
+        abs((timestamp - original_time).total_seconds()) <= tolerance and value == quantize(original)
+        for (original_time, original), (timestamp, value) in zip(points, decoded)
+    )
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated point counts (default: %(default)s)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Sample interval in seconds")
+    parser.add_argument("--resolution", type=int, default=DEFAULT_TIME_RESOLUTION_MS,
+                        help="Codec time resolution in ms (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum timing per case in seconds")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'trace':<24} {'points':>7} {'codec B/pt':>11} {'JSON B/pt':>10} {'ratio':>7}"
+          f" {'encode pt/s':>13} {'decode pt/s':>13}")
+    for samples in (int(size) for size in args.sizes.split(",") if size):
+        for variant in VARIANTS:
+            temp_history, ambient_history = newton_curve(samples, variant, args.interval)
+            traces = [(f"{variant}", temp_history)]
+            if ambient_history:
+                traces.append((f"{variant}/ambient", ambient_history))
+            for name, points in traces:
+                data = encode_series(points, args.resolution)
+                if not check_round_trip(points, data, args.resolution):
+                    print(f"❌ {name}-{samples}: round trip mismatch")
+                    failures += 1
+                    continue
+                json_size = len(json.dumps([[timestamp.isoformat(), value] for timestamp, value in points]))
+                encode_ops, _ = measure(lambda: encode_series(points, args.resolution), args.min_time)
+                decode_ops, _ = measure(lambda: decode_series(data), args.min_time)
+                print(
+                    f"{name:<24} {samples:>7} {len(data) / samples:>11.2f} {json_size / samples:>10.1f}"
+                    f" {json_size / len(data):>6.1f}x {encode_ops * samples:>13,.0f} {decode_ops * samples:>13,.0f}"
+                )
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
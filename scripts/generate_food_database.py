@@ -9,7 +9,6 @@ Usage:
 IMPORTANT: Run this script every time you modify food_data.py
 """
 import sys
-import os
 from pathlib import Path
 
 # Add parent directory to path to import from custom_components
@@ -21,7 +20,7 @@ try:
     from food_data import FOOD_DATABASE
 except ImportError as e:
     print(f"Error: Could not import food_data.py: {e}")
-    print(f"Make sure you're running from the repository root.")
+    print("Make sure you're running from the repository root.")
     sys.exit(1)
 
 
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Replay the cook of a config entry diagnostics download offline.
+
+The diagnostics of an Assistant Cooker entry (Settings → Devices & services →
+Assistant Cooker → ⋮ → Download diagnostics) carry a replay bundle: the
+full-resolution probe and ambient histories (lossless codec series), the
+calculator parameters and internal state, and the carryover inputs.
+
+The histories are resampled on the production grid (bundle resample_step) and
+fed to a fresh calculator with the production strategy and parameters, one
+tick per probe reading from the cook start like the coordinator with an
+inline strategy (skipped when the reading completes no grid point). The
+readings repeating the held value, dropped by the history compression, are
+put back once per grid step, for the probe and the ambient, as the ticks that
+saw them: withdrawal temperature from the previous
+tick's heating rate and the bundle's carryover coefficient, then remaining
+time, then heating rate, until the probe reaches the previous tick's
+withdrawal temperature (DONE). The ETA timeline is printed, then the final state is
+compared with the production calculator (last estimate, stable flag, heating
+constants). --strategy and --param replay the same cook with another
+configuration, to check a fix against the reported behaviour.
+
+Differences to expect: strategies run in the executor lag one or more ticks
+in production, the production calculator carries change-detection state (the
+running rate and CUSUM statistics) over from before the cook, timestamps are
+stored to the millisecond, and the ticks put back during a run of repeated
+readings are one grid step apart instead of at the production tick times.
+
+Usage:
+    python scripts/replay_diagnostics.py config_entry-assistant_cooker-01J....json
+    python scripts/replay_diagnostics.py diagnostics.json --every 1 --csv ticks.csv
+    python scripts/replay_diagnostics.py diagnostics.json --strategy kalman --param adaptive_windows=0
+"""
+import argparse
+import base64
+import csv
+import json
+import sys
+from datetime import datetime, timedelta
+
+from _package import load_package
+
+load_package()
+
+from assistant_cooker.calculations import TUNABLE_PARAMETERS, CookingCalculator  # noqa: E402
+from assistant_cooker.carryover import ambient_factor, rate_factor  # noqa: E402
+from assistant_cooker.codec import decode_series  # noqa: E402
+from assistant_cooker.const import (  # noqa: E402
+    CARRYOVER_MAX_C,
+    ESTIMATION_STRATEGIES,
+    REPLAY_BUNDLE_VERSION,
+    RESAMPLE_MAX_GAP_SECONDS,
+    UPDATE_INTERVAL,
+)
+from assistant_cooker.streaming import GridResampler  # noqa: E402
+
+
+def load_bundle(path: str) -> dict:
+    """Return the replay bundle of a diagnostics download (or of a bare bundle file)."""
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    document = document.get("data", document)
+    bundle = document.get("bundle", document)
+    if "temp_trace" not in bundle:
+        raise SystemExit(f"{path}: no replay bundle (not an Assistant Cooker diagnostics file?)")
+    if bundle.get("version") != REPLAY_BUNDLE_VERSION:
+        raise SystemExit(f"{path}: unsupported bundle version {bundle.get('version')}")
+    bundle["temp_trace"] = decode_series(base64.b64decode(bundle["temp_trace"]))
+    bundle["ambient_trace"] = decode_series(base64.b64decode(bundle["ambient_trace"]))
+    return bundle
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    """Return a datetime from an isoformat string (None stays None)."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _ticks(temp_trace: list, step: float):
+    """Yield the probe readings of the ticks: the stored ones and the repeats compressed away between them."""
+    max_gap = timedelta(seconds=RESAMPLE_MAX_GAP_SECONDS)
+    interval = timedelta(seconds=UPDATE_INTERVAL)
+    for (timestamp, temp), following in zip(temp_trace, temp_trace[1:] + [None]):
+        yield timestamp, temp
+        if step <= 0 or following is None or following[0] - timestamp > max_gap:
+            continue  # No grid (nothing compressed), end of the trace or a silence
+        # Interval ticks, counted back from the reading that ended the run
+        repeats = (following[0] - timestamp - interval / 2) // interval
+        for count in range(repeats, 0, -1):
+            yield following[0] - count * interval, temp
+
+
+class _Grid:
+    """Readings resampled like the coordinator does (a step of 0 keeps them as they are)."""
+
+    def __init__(self, step: float) -> None:
+        self.points: list = []
+        self._resampler = GridResampler(step, RESAMPLE_MAX_GAP_SECONDS) if step > 0 else None
+        self.last: tuple | None = None  # Last reading added
+
+    def add(self, timestamp: datetime, value: float) -> int:
+        """Ingest a reading; return the number of grid points it completed."""
+        self.last = (timestamp, value)
+        if self._resampler is None:
+            self.points.append((timestamp, value))
+            return 1
+        return self._resampler.extend([(timestamp, value)], self.points)
+
+    def repeat(self, timestamp: datetime) -> None:
+        """Hold the last reading up to a tick (a compressed repeat; lossless while the hold lasts)."""
+        if self._resampler is None or self.last is None:
+            return
+        elapsed = (timestamp - self.last[0]).total_seconds()
+        if 0 < elapsed <= RESAMPLE_MAX_GAP_SECONDS:
+            self.add(timestamp, self.last[1])
+
+
+def replay(bundle: dict, calculator: CookingCalculator):
+    """Yield a dict per tick of the cook: time, probe, withdrawal target, remaining, heating rate."""
+    cook = bundle["cook"]
+    carryover = bundle["carryover"]
+    temp_trace = bundle["temp_trace"]
+    ambient_trace = bundle["ambient_trace"]
+    start_time = _parse_time(cook["start_time"])
+    end_time = _parse_time(cook["cooking_end_time"])
+    desired = cook["desired_temp"]
+    step = bundle["resample_step"]
+    temp_grid = _Grid(step)
+    ambient_grid = _Grid(step)
+
+    heating_rate = target = ambient = None
+    ambient_index = 0
+    for timestamp, temp in _ticks(temp_trace, step):
+        if end_time is not None and timestamp > end_time:
+            return
+        # Ambient readings of the same tick (same timestamp) come first
+        while ambient_index < len(ambient_trace) and ambient_trace[ambient_index][0] <= timestamp:
+            ambient = ambient_trace[ambient_index][1]
+            ambient_grid.add(*ambient_trace[ambient_index])
+            ambient_index += 1
+        ambient_grid.repeat(timestamp)
+        completed = temp_grid.add(timestamp, temp)
+        if start_time is not None and timestamp < start_time:
+            continue  # Before the cook: only builds the grid
+        if target is not None and temp >= target:
+            return  # Done: the state machine checks the previous tick's withdrawal temperature first
+
+        target = desired
+        if carryover["enabled"]:
+            compensation = 0.0
+            if heating_rate is not None and heating_rate >= 0.01:
+                compensation = min(
+                    CARRYOVER_MAX_C,
+                    max(0.0, carryover["coefficient"] * rate_factor(heating_rate) * ambient_factor(ambient)),
+                )
+            target = max(30.0, desired - compensation)
+        if not completed:
+            continue  # The estimate is only updated with new grid points
+
+        remaining = calculator.calculate_remaining_time(
+            current_temp=temp,
+            target_temp=target,
+            temp_history=temp_grid.points,
+            ambient_temp=ambient,
+            ambient_history=ambient_grid.points,
+            now=timestamp,
+        )
+        heating_rate = calculator.calculate_heating_rate(temp_grid.points)
+        yield {
+            "time": timestamp,
+            "probe": temp,
+            "ambient": ambient,
+            "target": round(target, 2),
+            "remaining": remaining,
+            "heating_rate": heating_rate,
+        }
+
+
+def _parse_parameters(values: list[str]) -> dict[str, float]:
+    """Return {parameter: value} from name=value arguments."""
+    parameters = {}
+    for value in values:
+        name, _, number = value.partition("=")
+        if name not in TUNABLE_PARAMETERS:
+            raise SystemExit(f"Unknown parameter {name!r} (tunable: {', '.join(TUNABLE_PARAMETERS)})")
+        parameters[name] = float(number)
+    return parameters
+
+
+def _cell(value, spec: str = "g") -> str:
+    """Return a table cell ('-' for None)."""
+    if value is None:
+        return "-"
+    return str(value) if isinstance(value, bool) else format(value, spec)
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("diagnostics", help="Diagnostics JSON downloaded from Home Assistant")
+    parser.add_argument("--strategy", help="Replay with this strategy instead of the production one")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=VALUE",
+                        help="Calculator parameter override (repeatable)")
+    parser.add_argument("--every", type=float, default=5.0,
+                        help="Minutes between printed timeline rows (default: %(default)s)")
+    parser.add_argument("--csv", metavar="FILE", help="Write every tick to a CSV file")
+    args = parser.parse_args()
+
+    bundle = load_bundle(args.diagnostics)
+    production = bundle["calculator"]
+    strategy = args.strategy or production["strategy"]
+    if strategy not in ESTIMATION_STRATEGIES:
+        raise SystemExit(f"Unknown strategy {strategy!r} (available: {', '.join(ESTIMATION_STRATEGIES)})")
+    overrides = _parse_parameters(args.param)
+    calculator = CookingCalculator(strategy=strategy)
+    calculator.tune(**{**production["tuning"], **overrides})
+
+    cook = bundle["cook"]
+    print(f"Bundle created {bundle['created']} (state {bundle['state']}), "
+          f"{len(bundle['temp_trace'])} probe / {len(bundle['ambient_trace'])} ambient points")
+    print(f"Cook: {cook['food_category']}/{cook['food_type']} {cook['food_doneness']}, "
+          f"desired {cook['desired_temp']} °C, started {cook['start_time']}")
+    changed = " (changed)" if args.strategy or overrides else ""
+    print(f"Replaying with {strategy}{changed}, backend {calculator.backend}\n")
+
+    print(f"{'time (UTC)':<10} {'minute':>7} {'probe':>7} {'target':>7} {'rate':>6} {'remaining':>9}  end")
+    ticks = []
+    next_row = None
+    for tick in replay(bundle, calculator):
+        ticks.append(tick)
+        if next_row is None:
+            start = tick["time"]
+            next_row = start
+        if tick["time"] >= next_row:
+            next_row += timedelta(minutes=args.every)
+            minute = (tick["time"] - start).total_seconds() / 60
+            end = tick["time"] + timedelta(minutes=tick["remaining"]) if tick["remaining"] is not None else None
+            print(f"{tick['time']:%H:%M:%S} {minute:>7.1f} {tick['probe']:>7.2f} {tick['target']:>7.2f} "
+                  f"{_cell(tick['heating_rate']):>6} {_cell(tick['remaining']):>9}  "
+                  f"{end.strftime('%H:%M:%S') if end else '-'}")
+    if not ticks:
+        print("No tick to replay (no probe sample since the cook start)")
+        sys.exit(1)
+
+    replayed = calculator.diagnostics()
+    if "last_estimate" not in production:
+        print("\nNo production estimate in the bundle (taken before the first one): nothing to compare")
+        production = {**replayed, "last_estimate": None, "is_stable": None,
+                      "heating_constants": {"count": None, "median": None}}
+    print(f"\n{'':<22} {'production':>12} {'replay':>12}")
+    for label, key in (("last estimate (min)", "last_estimate"), ("stable", "is_stable")):
+        print(f"{label:<22} {_cell(production[key]):>12} {_cell(replayed[key]):>12}")
+    for label, key in (("heating constants", "count"), ("median k (1/min)", "median")):
+        print(f"{label:<22} {_cell(production['heating_constants'][key]):>12} "
+              f"{_cell(replayed['heating_constants'][key]):>12}")
+    if bundle["estimate"] is not None:
+        print(f"{'last tick remaining':<22} {_cell(bundle['estimate']['remaining']):>12} "
+              f"{_cell(ticks[-1]['remaining']):>12}")
+    if not changed and production["last_estimate"] is not None and replayed["last_estimate"] is not None:
+        difference = abs(production["last_estimate"] - replayed["last_estimate"])
+        status = "✅" if difference < 0.05 else "⚠️ "
+        print(f"\n{status} Last estimate difference: {difference:.3f} min")
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(ticks[0]))
+            writer.writeheader()
+            for tick in ticks:
+                writer.writerow({**tick, "time": tick["time"].isoformat()})
+        print(f"\n✅ {len(ticks)} ticks written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
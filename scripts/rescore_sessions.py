@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Re-score estimator configurations against the cooks of the session archive.
+
+Every configuration (a strategy plus calculator parameter overrides, the
+cartesian product of --strategies and --param values) is replayed over the
+archived done sessions (or of a synthetic corpus written by
+synthetic_traces.py): the stored probe and ambient traces are resampled on the
+grid the coordinator uses (--resample-step) and the calculator is fed each
+completed grid point, with the sample time as its clock, until the done time.
+Predictions are scored against the actual done time.
+
+Work is split into (configuration, session chunk) tasks run by a
+ProcessPoolExecutor (one process per core by default); each worker reads the
+archive once. A row is printed as soon as all chunks of a configuration are
+done, then the full table sorted by MAE:
+
+- mae / late_mae: mean absolute error of the predicted done time (minutes),
+  over the whole cook / the last 30 minutes
+- first: mean time from the first sample to the first estimate (minutes)
+- cpu: mean calculator time per sample (ms)
+
+--export writes the best configuration as a preset: the integration options
+(estimation strategy) and the calculator parameters.
+
+Usage:
+    python scripts/rescore_sessions.py /config/assistant_cooker.db
+    python scripts/rescore_sessions.py archive.db --strategies cascade,kalman \\
+        --param max_window_minutes=5,10 --param smoothing_base_weight=0.2,0.3
+    python scripts/rescore_sessions.py archive.db --food-category beef --export preset.json
+"""
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+
+from _package import load_package
+from synthetic_traces import is_corpus, load_corpus
+
+load_package()
+
+from assistant_cooker.archive import SessionArchive  # noqa: E402
+from assistant_cooker.calculations import TUNABLE_PARAMETERS, CookingCalculator  # noqa: E402
+from assistant_cooker.const import (  # noqa: E402
+    CONF_ESTIMATION_STRATEGY,
+    DEFAULT_RESAMPLE_STEP,
+    ESTIMATION_STRATEGIES,
+    RESAMPLE_MAX_GAP_SECONDS,
+)
+from assistant_cooker.streaming import GridResampler  # noqa: E402
+
+_LATE_WINDOW = timedelta(minutes=30)
+_SUM_KEYS = ("sessions", "predictions", "abs_error", "late_predictions", "late_abs_error",
+             "estimated_sessions", "first_minutes", "cpu_ms", "updates")
+_timestamp = itemgetter(0)
+
+_sessions: list[dict] = []  # Per worker process, loaded by _init_worker
+
+
+def resample(trace: list[tuple[datetime, float]], step: float) -> list[tuple[datetime, float]]:
+    """Return a trace on the coordinator's grid (the trace itself for a step of 0)."""
+    if step <= 0:
+        return trace
+    grid: list[tuple[datetime, float]] = []
+    GridResampler(step, RESAMPLE_MAX_GAP_SECONDS).extend(trace, grid)
+    return grid
+
+
+def replay_session(calculator: CookingCalculator, session: dict, step: float = DEFAULT_RESAMPLE_STEP):
+    """Yield (grid point time, remaining minutes or None, calculator ms) up to the done time."""
+    target = session["withdrawal_temp"] or session["desired_temp"]
+    temp_grid = resample(session["temp_trace"], step)
+    ambient_grid = resample(session["ambient_trace"], step)
+    done_time = session["done_time"]
+    for index, (timestamp, temp) in enumerate(temp_grid):
+        if done_time is not None and timestamp > done_time:
+            return
+        ambient_end = bisect.bisect_right(ambient_grid, timestamp, key=_timestamp)
+        ambient_history = ambient_grid[:ambient_end]
+        start = time.perf_counter()
+        remaining = calculator.calculate_remaining_time(
+            current_temp=temp,
+            target_temp=target,
+            temp_history=temp_grid[:index + 1],
+            ambient_temp=ambient_history[-1][1] if ambient_history else None,
+            ambient_history=ambient_history,
+            now=timestamp,
+        )
+        yield timestamp, remaining, (time.perf_counter() - start) * 1000
+
+
+def score_configuration(strategy: str, parameters: dict, sessions: list[dict], step: float) -> dict:
+    """Return the error and CPU sums of one configuration over sessions (resampled with step seconds)."""
+    sums = dict.fromkeys(_SUM_KEYS, 0.0)
+    for session in sessions:
+        calculator = CookingCalculator(strategy=strategy)
+        calculator.tune(**parameters)
+        done_time = session["done_time"]
+        start_time = session["temp_trace"][0][0]
+        first = None
+        for timestamp, remaining, duration_ms in replay_session(calculator, session, step):
+            sums["cpu_ms"] += duration_ms
+            sums["updates"] += 1
+            if remaining is None:
+                continue
+            if first is None:
+                first = (timestamp - start_time).total_seconds() / 60
+            error = abs((timestamp + timedelta(minutes=remaining) - done_time).total_seconds()) / 60
+            sums["predictions"] += 1
+            sums["abs_error"] += error
+            if done_time - timestamp <= _LATE_WINDOW:
+                sums["late_predictions"] += 1
+                sums["late_abs_error"] += error
+        sums["sessions"] += 1
+        if first is not None:
+            sums["estimated_sessions"] += 1
+            sums["first_minutes"] += first
+    return sums
+
+
+def _init_worker(path: str, food_category: str | None, food_type: str | None, limit: int) -> None:
+    """Load the sessions once per worker process."""
+    global _sessions
+    _sessions = load_sessions(path, food_category, food_type, limit)
+
+
+def _run_task(index: int, strategy: str, parameters: dict, chunk: slice, step: float) -> tuple[int, dict]:
+    """Score a configuration on a chunk of the worker's sessions."""
+    return index, score_configuration(strategy, parameters, _sessions[chunk], step)
+
+
+def load_sessions(path: str, food_category: str | None, food_type: str | None, limit: int) -> list[dict]:
+    """Return the latest done sessions with a usable trace, oldest first (archive or synthetic corpus)."""
+    if is_corpus(path):
+        source = [session for session in load_corpus(path) if session["outcome"] == "done"][:limit]
+        source.reverse()  # Same order as the archive: newest first
+    else:
+        source = SessionArchive(path).iter_sessions(outcome="done", limit=limit)
+    sessions = [
+        session
+        for session in source
+        if (food_category is None or session["food_category"] == food_category)
+        and (food_type is None or session["food_type"] == food_type)
+        and session["done_time"] is not None
+        and len(session["temp_trace"]) >= 2
+        and (session["withdrawal_temp"] or session["desired_temp"])
+    ]
+    sessions.reverse()
+    return sessions
+
+
+def parse_grid(values: list[str]) -> dict[str, list[float]]:
+    """Return {parameter: [values]} from name=v1,v2 arguments."""
+    grid = {}
+    for value in values:
+        name, _, options = value.partition("=")
+        if name not in TUNABLE_PARAMETERS:
+            raise SystemExit(f"Unknown parameter {name!r} (tunable: {', '.join(TUNABLE_PARAMETERS)})")
+        grid[name] = [float(option) for option in options.split(",") if option]
+    return grid
+
+
+def summarize(sums: dict) -> dict:
+    """Return the averages of score sums."""
+
+    def mean(total: float, count: float, digits: int) -> float | None:
+        return round(total / count, digits) if count else None
+
+    return {
+        "sessions": int(sums["sessions"]),
+        "predictions": int(sums["predictions"]),
+        "mae": mean(sums["abs_error"], sums["predictions"], 2),
+        "late_mae": mean(sums["late_abs_error"], sums["late_predictions"], 2),
+        "first_minutes": mean(sums["first_minutes"], sums["estimated_sessions"], 2),
+        "cpu_ms": mean(sums["cpu_ms"], sums["updates"], 3),
+    }
+
+
+def format_row(strategy: str, parameters: dict, summary: dict) -> str:
+    """Return a table row."""
+
+    def cell(value) -> str:
+        return "-" if value is None else f"{value:g}"
+
+    overrides = " ".join(f"{name}={value:g}" for name, value in parameters.items()) or "(defaults)"
+    return (
+        f"{strategy:<14} {summary['sessions']:>8} {summary['predictions']:>8} {cell(summary['mae']):>8}"
+        f" {cell(summary['late_mae']):>9} {cell(summary['first_minutes']):>7} {cell(summary['cpu_ms']):>8}  {overrides}"
+    )
+
+
+def _sort_key(row: tuple) -> float:
+    """Return the MAE of a result row (configurations without estimates last)."""
+    mae = row[2]["mae"]
+    return mae if mae is not None else math.inf
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("database", help="Session archive (assistant_cooker.db in the HA config directory) "
+                                         "or synthetic corpus (synthetic_traces.py)")
+    parser.add_argument("--strategies", default=",".join(ESTIMATION_STRATEGIES),
+                        help="Comma-separated strategies (default: all)")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2",
+                        help="Calculator parameter values to sweep (repeatable)")
+    parser.add_argument("--food-category", help="Only sessions of this category")
+    parser.add_argument("--food-type", help="Only sessions of this food")
+    parser.add_argument("--limit", type=int, default=500, help="Latest sessions to read (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: one per core, %(default)s)")
+    parser.add_argument("--resample-step", type=float, default=DEFAULT_RESAMPLE_STEP,
+                        help="Grid step in seconds, as the integration option (default: %(default)s, 0 = off)")
+    parser.add_argument("--export", metavar="FILE", help="Write the best configuration as a preset (JSON)")
+    args = parser.parse_args()
+
+    strategies = [name for name in args.strategies.split(",") if name]
+    for name in strategies:
+        if name not in ESTIMATION_STRATEGIES:
+            raise SystemExit(f"Unknown strategy {name!r} (available: {', '.join(ESTIMATION_STRATEGIES)})")
+    grid = parse_grid(args.param)
+    configurations = [
+        (strategy, dict(zip(grid, values)))
+        for strategy in strategies
+        for values in itertools.product(*grid.values())
+    ]
+
+    sessions = load_sessions(args.database, args.food_category, args.food_type, args.limit)
+    if not sessions:
+        raise SystemExit("No done sessions with traces in the archive")
+    workers = max(1, args.workers)
+    # Split sessions only as much as needed to keep every worker busy
+    chunks_per_configuration = min(len(sessions), math.ceil(workers * 2 / len(configurations)))
+    chunk_size = math.ceil(len(sessions) / chunks_per_configuration)
+    chunks = [slice(start, start + chunk_size) for start in range(0, len(sessions), chunk_size)]
+    print(f"Re-scoring {len(configurations)} configurations on {len(sessions)} sessions "
+          f"({len(configurations) * len(chunks)} tasks, {workers} workers)...\n")
+
+    header = (f"{'strategy':<14} {'sessions':>8} {'preds':>8} {'mae':>8} {'late_mae':>9} {'first':>7} {'cpu_ms':>8}"
+              "  parameters")
+    print(header)
+    totals = [dict.fromkeys(_SUM_KEYS, 0.0) for _ in configurations]
+    pending = [len(chunks)] * len(configurations)
+    results = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(args.database, args.food_category, args.food_type, args.limit),
+    ) as executor:
+        futures = [
+            executor.submit(_run_task, index, strategy, parameters, chunk, args.resample_step)
+            for index, (strategy, parameters) in enumerate(configurations)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            index, sums = future.result()
+            for key in _SUM_KEYS:
+                totals[index][key] += sums[key]
+            pending[index] -= 1
+            if pending[index] == 0:
+                strategy, parameters = configurations[index]
+                summary = summarize(totals[index])
+                results.append((strategy, parameters, summary))
+                print(format_row(strategy, parameters, summary), flush=True)
+
+    results.sort(key=_sort_key)
+    print(f"\nRanked by MAE ({time.perf_counter() - started:.1f} s):")
+    print(header)
+    for strategy, parameters, summary in results:
+        print(format_row(strategy, parameters, summary))
+
+    if args.export:
+        strategy, parameters, summary = results[0]
+        if summary["mae"] is None:
+            print("\n❌ No configuration produced an estimate: nothing exported")
+            sys.exit(1)
+        defaults = CookingCalculator(strategy=strategy).tuning()
+        preset = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "archive": os.path.abspath(args.database),
+            "filters": {"food_category": args.food_category, "food_type": args.food_type},
+            "options": {CONF_ESTIMATION_STRATEGY: strategy},
+            "calculator": {**defaults, **parameters},
+            "score": summary,
+        }
+        with open(args.export, "w", encoding="utf-8") as file:
+            json.dump(preset, file, indent=2)
+        print(f"\n✅ Preset written to {args.export}")
+
+
+if __name__ == "__main__":
+    main()
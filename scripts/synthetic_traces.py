@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Generate a reproducible corpus of synthetic cooks for the estimators.
+
+Probe and ambient traces are simulated for every carryover type of the food
+database (geometry, diffusivity and surface ratio from CONDUCTION_PARAMETERS):
+
+- Heating: radial conduction (explicit finite differences on a slab, cylinder
+  or sphere, convective surface) or a lumped two-node surface/core model; the
+  wet surface is capped near 100 °C by evaporation
+- Cooking modes: oven (preheat ramp from room temperature or already hot,
+  thermostat cycling), BBQ (low temperature, evaporative stall of roasts) and
+  pan (high effective temperature, no ambient sensor)
+- Probe insertion: the probe reads the room before it is pushed into the cold
+  meat (sudden drop, then a few seconds of probe lag)
+- Withdrawal when the core reaches the withdrawal temperature, then a rest at
+  room temperature (carryover rise of the core)
+- Sensor noise, 0.5 °C quantization, timestamp jitter and BLE dropouts whose
+  samples are lost or delivered in a burst at reconnection
+
+Traces of a carryover type are simulated together (NumPy arrays over traces
+and nodes, one loop over time steps), so thousands of traces take seconds.
+The same seed gives the same corpus.
+
+Corpus file (--output): magic "ACSC", format version, zlib-compressed JSON
+header (metadata of each trace, with the offsets of its series), then the
+probe and ambient traces as codec.py series. load_corpus() returns sessions
+with the keys of SessionArchive.iter_sessions() plus the generation metadata,
+so the scripts that replay archived sessions can replay a corpus too.
+
+Usage:
+    python scripts/synthetic_traces.py --count 1000 --output scripts/temp/corpus.acsc
+    python scripts/synthetic_traces.py --count 200 --types beef_roast,poultry --seed 7 --interval 2
+"""
+import argparse
+import json
+import math
+import struct
+import sys
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from _package import load_package
+
+load_package()
+
+from assistant_cooker.codec import decode_series, encode_series  # noqa: E402
+from assistant_cooker.const import (  # noqa: E402
+    CARRYOVER_BASELINE_C,
+    CARRYOVER_TYPE_WEIGHTS,
+    CONDUCTION_PARAMETERS,
+)
+from assistant_cooker.food_data import FOOD_DATABASE  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CORPUS_MAGIC = b"ACSC"
+CORPUS_VERSION = 1
+_PREFIX = struct.Struct(">4sBI")  # magic, version, header length
+
+MODEL_CONDUCTION = "conduction"
+MODEL_LUMPED = "lumped"
+MODELS = [MODEL_CONDUCTION, MODEL_LUMPED]
+
+_SHAPE_FACTORS = {"slab": 0, "cylinder": 1, "sphere": 2}
+_NODES = 10
+_CORPUS_START = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+# Per carryover type: thickness range (cm), cooking modes {mode: probability}, longest cook (h)
+TYPE_PROFILES = {
+    "beef_roast": ((7.0, 14.0), {"oven": 0.6, "bbq": 0.4}, 14),
+    "beef_steak": ((2.0, 5.0), {"pan": 0.5, "oven": 0.5}, 2),
+    "pork_roast": ((7.0, 14.0), {"oven": 0.5, "bbq": 0.5}, 14),
+    "pork_other": ((2.0, 4.0), {"pan": 0.6, "oven": 0.4}, 2),
+    "poultry": ((8.0, 14.0), {"oven": 0.8, "bbq": 0.2}, 8),
+    "fish": ((1.5, 4.0), {"pan": 0.5, "oven": 0.5}, 2),
+    "lamb_roast": ((6.0, 12.0), {"oven": 0.7, "bbq": 0.3}, 12),
+    "lamb_other": ((2.0, 4.0), {"pan": 0.6, "oven": 0.4}, 2),
+    "veal": ((4.0, 9.0), {"oven": 1.0}, 8),
+    "other": ((2.0, 6.0), {"pan": 0.5, "oven": 0.5}, 3),
+}
+
+# Per cooking mode: set temperature range (°C), surface ratio multiplier,
+# probability of an ambient sensor, thermostat swing (°C), stall probability (roasts)
+MODE_PROFILES = {
+    "oven": {"ambient": (150.0, 220.0), "surface": 1.0, "sensor": 0.7, "swing": 4.0, "stall": 0.0},
+    "bbq": {"ambient": (110.0, 140.0), "surface": 0.8, "sensor": 0.8, "swing": 6.0, "stall": 0.8},
+    "pan": {"ambient": (170.0, 230.0), "surface": 2.0, "sensor": 0.0, "swing": 0.0, "stall": 0.0},
+}
+
+
+def _foods_by_type() -> dict[str, list[tuple[str, str, str, float]]]:
+    """Return {carryover type: [(category, food, doneness, °C), ...]} from the food database."""
+    foods: dict[str, list] = {}
+    for category, category_data in FOOD_DATABASE.items():
+        for food, food_data in category_data["foods"].items():
+            carryover_type = food_data.get("carryover_type", "other")
+            for doneness, temperature in food_data["doneness"].items():
+                foods.setdefault(carryover_type, []).append((category, food, doneness, float(temperature)))
+    return foods
+
+
+def _simulate(rng, count: int, carryover_type: str, model: str, interval: float) -> dict:
+    """Simulate `count` cooks of one type and model; return per-trace parameters and arrays."""
+    (thickness_low, thickness_high), modes, max_hours = TYPE_PROFILES[carryover_type]
+    conduction = CONDUCTION_PARAMETERS.get(carryover_type, CONDUCTION_PARAMETERS["other"])
+    shape = _SHAPE_FACTORS[conduction["geometry"]]
+    foods = _foods_by_type().get(carryover_type) or _foods_by_type()["other"]
+
+    # Per-trace parameters
+    mode_names = list(modes)
+    mode_index = rng.choice(len(mode_names), size=count, p=list(modes.values()))
+    mode = np.array(mode_names)[mode_index]
+    low = np.array([MODE_PROFILES[m]["ambient"][0] for m in mode])
+    high = np.array([MODE_PROFILES[m]["ambient"][1] for m in mode])
+    set_temp = rng.uniform(low, high)
+    swing = np.array([MODE_PROFILES[m]["swing"] for m in mode]) * rng.uniform(0.5, 1.0, count)
+    cycle_minutes = rng.uniform(6.0, 14.0, count)
+    preheated = (mode == "pan") | (rng.random(count) < 0.5)
+    preheat_minutes = rng.uniform(5.0, 12.0, count)
+    room = rng.uniform(18.0, 25.0, count)
+    start_temp = np.where(rng.random(count) < 0.7, rng.uniform(2.0, 8.0, count), rng.uniform(12.0, 20.0, count))
+    thickness_cm = rng.uniform(thickness_low, thickness_high, count)
+    radius = thickness_cm / 200.0
+    diffusivity = conduction["diffusivity"] * rng.uniform(0.8, 1.25, count)
+    surface = conduction["surface_ratio"] * np.array([MODE_PROFILES[m]["surface"] for m in mode])
+    surface = surface * rng.uniform(0.7, 1.4, count)
+    stall_probability = np.array([MODE_PROFILES[m]["stall"] for m in mode]) * (shape > 0)
+    stall = rng.random(count) < stall_probability
+    rest_minutes = rng.uniform(20.0, 40.0, count)
+
+    food_index = rng.integers(len(foods), size=count)
+    # Low and slow: stalled cooks go to the pulled/braised doneness when the type has one
+    well_done = [i for i, food in enumerate(foods) if food[3] >= 85.0]
+    if well_done:
+        food_index = np.where(stall, rng.choice(well_done, size=count), food_index)
+    desired = np.array([foods[i][3] for i in food_index])
+    weight = CARRYOVER_TYPE_WEIGHTS.get(carryover_type, 1.0)
+    withdrawal = desired - CARRYOVER_BASELINE_C * weight
+    # Wet surface: evaporation caps its temperature (above the target: the crust dries)
+    boiling = np.maximum(rng.uniform(85.0, 100.0, count), desired + 8.0)
+
+    # Substeps keep the explicit scheme stable for the thinnest piece
+    spacing = radius / (_NODES - 1)
+    if model == MODEL_CONDUCTION:
+        stable = 0.4 * spacing**2 / (diffusivity * (1 + shape) * (2.0 + 2.0 * spacing * surface))
+        substeps = max(1, math.ceil(interval / float(stable.min())))
+    else:
+        substeps = 1
+    dt = interval / substeps
+
+    # State
+    if model == MODEL_CONDUCTION:
+        temps = np.repeat(start_temp[:, None], _NODES, axis=1)
+        nodes = np.arange(1, _NODES - 1)
+        curvature = shape / (2.0 * nodes)
+        factor = (diffusivity / spacing**2)[:, None]
+    else:
+        temps = np.stack([start_temp, start_temp], axis=1)  # Surface, core
+        core_rate = (1 + shape) * 3.0 * diffusivity / radius**2
+        surface_rate = (1 + shape) * diffusivity * surface / radius
+    # Stall: while surface moisture lasts, evaporation holds the surface at the
+    # wet-bulb temperature (moisture: seconds of evaporation at the capped surface)
+    wet_bulb = rng.uniform(65.0, 72.0, count)
+    moisture = np.where(stall, rng.uniform(1.0, 3.0, count) * 3600, 0.0)
+
+    steps = int(max_hours * 3600 / interval)
+    core = np.empty((count, steps))
+    ambient = np.empty((count, steps))
+    done_step = np.full(count, -1)
+    removed = np.zeros(count, dtype=bool)
+    offset = np.where(preheated, 600.0, 0.0)  # Minutes of preheat already done
+    last = steps
+    for step in range(steps):
+        minutes = step * interval / 60
+        oven = room + (set_temp - room) * (1 - np.exp(-(minutes + offset) / preheat_minutes))
+        oven = oven + swing * np.sin(2 * math.pi * minutes / cycle_minutes)
+        ambient_now = np.where(removed, room, oven)
+        surface_now = np.where(removed, surface * 0.25, surface)
+        for _ in range(substeps):
+            cap = np.where(moisture > 0, wet_bulb, boiling)
+            if model == MODEL_CONDUCTION:
+                laplacian = np.empty_like(temps)
+                laplacian[:, 0] = 2 * (1 + shape) * (temps[:, 1] - temps[:, 0])
+                laplacian[:, 1:-1] = (
+                    (1 + curvature) * temps[:, 2:] - 2 * temps[:, 1:-1] + (1 - curvature) * temps[:, :-2]
+                )
+                # Surface: ghost node T_N = T_{N-2} − 2h·H·(T_{N-1} − Ta)
+                ghost = temps[:, -2] - 2 * spacing * surface_now * (temps[:, -1] - ambient_now)
+                edge = shape / (2.0 * (_NODES - 1))
+                laplacian[:, -1] = (1 + edge) * ghost - 2 * temps[:, -1] + (1 - edge) * temps[:, -2]
+                temps = temps + dt * factor * laplacian
+                excess = np.maximum(0.0, temps[:, -1] - cap)
+                temps[:, -1] -= excess
+            else:
+                rate = np.where(removed, surface_rate * 0.25, surface_rate)
+                shell, center = temps[:, 0], temps[:, 1]
+                shell_next = shell + dt * (rate * (ambient_now - shell) - core_rate * (shell - center))
+                center_next = center + dt * core_rate * (shell - center)
+                excess = np.maximum(0.0, shell_next - cap)
+                temps = np.stack([shell_next - excess, center_next], axis=1)
+            moisture = np.maximum(0.0, moisture - dt * (excess > 0))
+        core_now = temps[:, 0] if model == MODEL_CONDUCTION else temps[:, 1]
+        core[:, step] = core_now
+        ambient[:, step] = ambient_now
+
+        newly = ~removed & (core_now >= withdrawal)
+        done_step[newly] = step
+        removed |= newly
+        finished = removed & ((step - done_step) * interval >= rest_minutes * 60)
+        if finished.all():
+            last = step + 1
+            break
+
+    return {
+        "count": count,
+        "steps": last,
+        "core": core[:, :last],
+        "ambient": ambient[:, :last],
+        "done_step": done_step,
+        "rest_minutes": rest_minutes,
+        "mode": mode,
+        "set_temp": set_temp,
+        "room": room,
+        "start_temp": start_temp,
+        "thickness_cm": thickness_cm,
+        "diffusivity": diffusivity,
+        "surface": surface,
+        "stall": stall,
+        "food": [foods[i] for i in food_index],
+        "withdrawal": withdrawal,
+        "geometry": conduction["geometry"],
+    }
+
+
+def _observe(rng, batch: dict, index: int, interval: float, quantum: float, start: datetime) -> dict:
+    """Return one trace as received by Home Assistant (probe insertion, noise, dropouts)."""
+    done_step = int(batch["done_step"][index])
+    end = batch["steps"] if done_step < 0 else min(
+        batch["steps"], done_step + int(batch["rest_minutes"][index] * 60 / interval) + 1
+    )
+    core = batch["core"][index, :end]
+    oven = batch["ambient"][index, :end]
+    room = batch["room"][index]
+
+    # Probe insertion: room reading first, then a drop to the meat with probe lag
+    lead = int(rng.integers(6, 36))  # Samples before insertion
+    lag = rng.uniform(5.0, 20.0)
+    elapsed = np.arange(end) * interval
+    probe = core + (room - core) * np.exp(-elapsed / lag)
+    probe = np.concatenate([np.full(lead, room), probe])
+    ambient_values = np.concatenate([np.full(lead, room), oven])
+    times = np.arange(lead + end) * interval
+
+    probe = probe + rng.normal(0.0, rng.uniform(0.05, 0.3), probe.size)
+    ambient_values = ambient_values + rng.normal(0.0, rng.uniform(0.5, 2.0), ambient_values.size)
+    if quantum > 0:
+        probe = np.round(probe / quantum) * quantum
+        ambient_values = np.round(ambient_values / quantum) * quantum
+
+    # Received times: jitter, then BLE dropouts (samples lost or delivered in a burst)
+    received = times + rng.uniform(0.0, min(1.0, interval / 2), times.size)
+    keep = np.ones(times.size, dtype=bool)
+    hours = times[-1] / 3600
+    dropouts = int(rng.poisson(max(hours, 0.1)))
+    for _ in range(dropouts):
+        begin = rng.uniform(0.0, times[-1])
+        length = rng.uniform(30.0, 300.0)
+        inside = (times >= begin) & (times < begin + length)
+        if rng.random() < 0.7:
+            burst = np.flatnonzero(inside)
+            received[burst] = begin + length + 0.05 * np.arange(burst.size)
+        else:
+            keep &= ~inside
+    order = np.argsort(received[keep], kind="stable")
+    received = received[keep][order]
+    probe = probe[keep][order]
+    ambient_values = ambient_values[keep][order]
+
+    def points(values) -> list[tuple[datetime, float]]:
+        return [(start + timedelta(seconds=float(t)), float(v)) for t, v in zip(received, values)]
+
+    insert_time = start + timedelta(seconds=lead * interval)
+    done_time = insert_time + timedelta(seconds=done_step * interval) if done_step >= 0 else None
+    resting = core[done_step:] if done_step >= 0 else core[:0]
+    category, food, doneness, desired = batch["food"][index]
+    has_ambient = rng.random() < MODE_PROFILES[batch["mode"][index]]["sensor"]
+    return {
+        "food_category": category,
+        "food_type": food,
+        "doneness": doneness,
+        "outcome": "done" if done_time is not None else "stopped",
+        "start_time": start,
+        "insert_time": insert_time,
+        "done_time": done_time,
+        "end_time": start + timedelta(seconds=float(received[-1])),
+        "desired_temp": desired,
+        "withdrawal_temp": round(float(batch["withdrawal"][index]), 2),
+        "start_probe_temp": float(probe[0]),
+        "peak_temp": float(core[:done_step + 1].max()) if done_step >= 0 else float(core.max()),
+        "carryover_peak": float(resting.max()) if resting.size else None,
+        "thickness_cm": round(float(batch["thickness_cm"][index]), 2),
+        "mode": str(batch["mode"][index]),
+        "geometry": batch["geometry"],
+        "set_temp": round(float(batch["set_temp"][index]), 1),
+        "start_core_temp": round(float(batch["start_temp"][index]), 2),
+        "diffusivity": float(batch["diffusivity"][index]),
+        "surface_ratio": round(float(batch["surface"][index]), 2),
+        "stall": bool(batch["stall"][index]),
+        "dropouts": dropouts,
+        "temp_trace": points(probe),
+        "ambient_trace": points(ambient_values) if has_ambient else [],
+    }
+
+
+def generate(
+    count: int,
+    seed: int = 0,
+    interval: float = 5.0,
+    quantum: float = 0.5,
+    types: list[str] | None = None,
+    models: list[str] | None = None,
+) -> list[dict]:
+    """Return `count` synthetic sessions spread over the carryover types (deterministic per seed)."""
+    if np is None:
+        raise RuntimeError("NumPy is required to generate synthetic traces")
+    types = types or list(TYPE_PROFILES)
+    models = models or MODELS
+    combinations = [(carryover_type, model) for carryover_type in types for model in models]
+    streams = np.random.SeedSequence(seed).spawn(len(combinations))
+    sessions = []
+    for position, ((carryover_type, model), stream) in enumerate(zip(combinations, streams)):
+        share = count // len(combinations) + (1 if position < count % len(combinations) else 0)
+        if share == 0:
+            continue
+        rng = np.random.default_rng(stream)
+        batch = _simulate(rng, share, carryover_type, model, interval)
+        for index in range(share):
+            start = _CORPUS_START + timedelta(days=len(sessions))
+            session = _observe(rng, batch, index, interval, quantum, start)
+            session.update(id=len(sessions) + 1, carryover_type=carryover_type, model=model, seed=seed)
+            sessions.append(session)
+    return sessions
+
+
+def write_corpus(path: str, sessions: list[dict], time_resolution_ms: int = 100) -> int:
+    """Write sessions to a corpus file; return its size in bytes."""
+    header = []
+    blobs = []
+    offset = 0
+    for session in sessions:
+        entry = {}
+        for key, value in session.items():
+            if key in ("temp_trace", "ambient_trace"):
+                blob = encode_series(value, time_resolution_ms)
+                blobs.append(blob)
+                entry[key] = [offset, len(blob)]
+                offset += len(blob)
+            elif isinstance(value, datetime):
+                entry[key] = value.isoformat()
+            else:
+                entry[key] = value
+        header.append(entry)
+    compressed = zlib.compress(json.dumps(header, separators=(",", ":")).encode("utf-8"), 9)
+    with open(path, "wb") as file:
+        file.write(_PREFIX.pack(CORPUS_MAGIC, CORPUS_VERSION, len(compressed)))
+        file.write(compressed)
+        for blob in blobs:
+            file.write(blob)
+    return _PREFIX.size + len(compressed) + offset
+
+
+def is_corpus(path: str) -> bool:
+    """Return True if path is a synthetic corpus file."""
+    try:
+        with open(path, "rb") as file:
+            return file.read(len(CORPUS_MAGIC)) == CORPUS_MAGIC
+    except OSError:
+        return False
+
+
+def load_corpus(path: str) -> list[dict]:
+    """Return the sessions of a corpus file (times as datetimes, traces decoded)."""
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, version, header_length = _PREFIX.unpack_from(data)
+    if magic != CORPUS_MAGIC:
+        raise ValueError(f"{path} is not a synthetic trace corpus")
+    if version != CORPUS_VERSION:
+        raise ValueError(f"Unsupported corpus version: {version}")
+    body = _PREFIX.size + header_length
+    header = json.loads(zlib.decompress(data[_PREFIX.size:body]))
+    sessions = []
+    for entry in header:
+        session = dict(entry)
+        for key in ("start_time", "insert_time", "done_time", "end_time"):
+            if session.get(key) is not None:
+                session[key] = datetime.fromisoformat(session[key])
+        for key in ("temp_trace", "ambient_trace"):
+            offset, length = entry[key]
+            session[key] = decode_series(data[body + offset:body + offset + length])
+        sessions.append(session)
+    return sessions
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000, help="Number of traces (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: %(default)s)")
+    parser.add_argument("--interval", type=float, default=5.0, help="Probe sample interval in seconds")
+    parser.add_argument("--quantum", type=float, default=0.5, help="Sensor resolution in °C (0: none)")
+    parser.add_argument("--types", help=f"Comma-separated carryover types (default: all: {','.join(TYPE_PROFILES)})")
+    parser.add_argument("--models", default=",".join(MODELS), help="Heating models (default: %(default)s)")
+    parser.add_argument("--output", default="scripts/temp/corpus.acsc", help="Corpus file (default: %(default)s)")
+    args = parser.parse_args()
+
+    if np is None:
+        sys.exit("❌ NumPy is required: pip install numpy")
+    types = args.types.split(",") if args.types else None
+    for name in types or []:
+        if name not in TYPE_PROFILES:
+            sys.exit(f"❌ Unknown carryover type {name!r} (available: {', '.join(TYPE_PROFILES)})")
+    models = [name for name in args.models.split(",") if name]
+    for name in models:
+        if name not in MODELS:
+            sys.exit(f"❌ Unknown heating model {name!r} (available: {', '.join(MODELS)})")
+
+    started = time.perf_counter()
+    sessions = generate(args.count, args.seed, args.interval, args.quantum, types, models)
+    generated = time.perf_counter() - started
+    size = write_corpus(args.output, sessions)
+    points = sum(len(session["temp_trace"]) + len(session["ambient_trace"]) for session in sessions)
+
+    print(f"✅ {len(sessions)} traces, {points:,} points in {generated:.1f} s → {args.output} "
+          f"({size / 1024:.0f} KiB, {size / max(points, 1):.2f} B/point)")
+    outcomes = Counter(session["outcome"] for session in sessions)
+    print(f"   Outcomes: {dict(outcomes)}; stalls: {sum(session['stall'] for session in sessions)}; "
+          f"with ambient: {sum(bool(session['ambient_trace']) for session in sessions)}")
+    print(f"\n{'type':<12} {'traces':>6} {'cook min':>9} {'carryover':>10}")
+    for carryover_type in types or TYPE_PROFILES:
+        done = [s for s in sessions if s["carryover_type"] == carryover_type and s["done_time"] is not None]
+        if not done:
+            continue
+        cook = sorted((s["done_time"] - s["insert_time"]).total_seconds() / 60 for s in done)
+        rise = [s["carryover_peak"] - s["peak_temp"] for s in done if s["carryover_peak"] is not None]
+        print(f"{carryover_type:<12} {len(done):>6} {cook[len(cook) // 2]:>9.0f}"
+              f" {sum(rise) / max(len(rise), 1):>9.1f}°")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Test setup: register the integration package without Home Assistant.
+
+The HA-free modules (calculations, streaming, ...) are imported the same way
+the maintenance scripts do (scripts/_package.py). Benchmarks (tests using
+the pytest-benchmark fixture) only run with --run-benchmarks.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from _package import load_package  # noqa: E402
+
+load_package()
+
+
+def pytest_addoption(parser):
+    """Add the option enabling the benchmarks."""
+    parser.addoption(
+        "--run-benchmarks", action="store_true", default=False,
+        help="Run the hot-path benchmarks (tests/test_benchmarks.py, needs pytest-benchmark)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless --run-benchmarks is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark: run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
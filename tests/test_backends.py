@@ -0,0 +1,154 @@
+"""
+Parity of the NumPy and pure-Python calculator backends.
+
+The NumPy kernels must return bit-for-bit the values of the pure-Python
+reference: both are run on the same windows and their outputs compared with
+float.hex(), first kernel by kernel, then through a whole cook replayed tick
+by tick by one calculator per backend.
+"""
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from assistant_cooker.calculations import (  # noqa: E402
+    BACKEND_NUMPY,
+    BACKEND_PYTHON,
+    CookingCalculator,
+    _NumpyBackend,
+    _PythonBackend,
+    recent_window,
+)
+from assistant_cooker.const import (  # noqa: E402
+    ESTIMATION_STRATEGIES,
+    STRATEGY_AMBIENT_MODEL,
+    STRATEGY_TWO_POINT,
+)
+
+START = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+VARIANTS = ["clean", "noisy", "quantized", "stall", "ambient"]
+# Strategies that only estimate with an ambient sensor
+MEASURED_AMBIENT_STRATEGIES = [STRATEGY_AMBIENT_MODEL, STRATEGY_TWO_POINT]
+
+
+def _bits(value):
+    """Return value with every float replaced by its exact hex representation."""
+    if isinstance(value, float):
+        return value.hex()
+    if isinstance(value, (tuple, list)):
+        return [_bits(item) for item in value]
+    return value
+
+
+def _cook(variant: str, samples: int = 600, interval_seconds: float = 5.0, seed: int = 7):
+    """
+    Return (probe history, ambient history) of a Newton heating curve ending near 70 °C.
+
+    Only the stall (steady BBQ) and ambient (cycling oven) cooks have an
+    ambient sensor.
+    """
+    rng = random.Random(seed)
+    t_ambient, t_start = 160.0, 5.0
+    k = 0.6 / (samples * interval_seconds / 60)
+    stall_start, stall_end = samples * interval_seconds / 60 * 0.4, samples * interval_seconds / 60 * 0.6
+    temp_history, ambient_history = [], []
+    for i in range(samples):
+        minutes = i * interval_seconds / 60
+        effective = minutes
+        if variant == "stall":
+            effective = minutes - (stall_end - stall_start) if minutes >= stall_end else min(minutes, stall_start)
+        temp = t_ambient - (t_ambient - t_start) * math.exp(-k * effective)
+        if variant != "clean":
+            temp += rng.gauss(0, 0.3)
+        if variant == "quantized":
+            temp = round(temp * 2) / 2
+        timestamp = START + timedelta(seconds=i * interval_seconds)
+        temp_history.append((timestamp, temp))
+        if variant == "ambient":
+            oven = t_ambient + 5 * math.sin(2 * math.pi * minutes / 10) + rng.gauss(0, 1.0)
+            ambient_history.append((timestamp, oven))
+        elif variant == "stall":
+            ambient_history.append((timestamp, t_ambient))
+    return temp_history, ambient_history
+
+
+def _windows(variant: str):
+    """Yield the 3-minute estimation windows of the cook, every 10th tick."""
+    temp_history, _ = _cook(variant)
+    for end in range(3, len(temp_history) + 1, 10):
+        yield recent_window(temp_history[:end], 3)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_slope(variant):
+    """Return the same regression slope from both backends."""
+    for window in _windows(variant):
+        t_last = window[-1][0]
+        x_vals = [(t - t_last).total_seconds() / 60 for t, _ in window]
+        y_vals = [v for _, v in window]
+        assert _bits(_NumpyBackend.slope(x_vals, y_vals)) == _bits(_PythonBackend.slope(x_vals, y_vals))
+
+
+def test_slope_constant_x():
+    """Return None from both backends when every sample has the same time."""
+    assert _PythonBackend.slope([1.0] * 5, [1.0, 2.0, 3.0, 4.0, 5.0]) is None
+    assert _NumpyBackend.slope([1.0] * 5, [1.0, 2.0, 3.0, 4.0, 5.0]) is None
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("ambient", [160.0, 80.0, 40.0])
+@pytest.mark.parametrize("min_delta", [0.0, 0.25, 1.0])
+def test_median_heating_constant(variant, ambient, min_delta):
+    """Return the same median heating constant, including near and below the probe temperature."""
+    for window in _windows(variant):
+        t_last, temp_last = window[-1]
+        kwargs = {
+            "deltas": [(t_last - t).total_seconds() / 60 for t, _ in window],
+            "temps": [v for _, v in window],
+            "ambient": ambient,
+            "last_temp": temp_last,
+            "min_delta": min_delta,
+        }
+        assert _bits(_NumpyBackend.median_heating_constant(**kwargs)) == _bits(
+            _PythonBackend.median_heating_constant(**kwargs)
+        )
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("strategy", ESTIMATION_STRATEGIES)
+def test_calculator_replay(variant, strategy):
+    """Replay a cook through one calculator per backend and compare every tick."""
+    temp_history, ambient_history = _cook(variant)
+    calculators = [
+        CookingCalculator(backend=backend, strategy=strategy) for backend in (BACKEND_PYTHON, BACKEND_NUMPY)
+    ]
+    assert [calculator.backend for calculator in calculators] == [BACKEND_PYTHON, BACKEND_NUMPY]
+    target_temp = temp_history[-1][1] + 5
+    estimates = 0
+    for end in range(3, len(temp_history) + 1):
+        history = temp_history[:end]
+        ambient = ambient_history[:end]
+        results = [
+            _bits((
+                calculator.calculate_heating_rate(history),
+                calculator.calculate_remaining_time(
+                    current_temp=history[-1][1],
+                    target_temp=target_temp,
+                    temp_history=history,
+                    ambient_temp=ambient[-1][1] if ambient else None,
+                    ambient_history=ambient,
+                    now=history[-1][0],
+                ),
+                calculator.remaining_time_spread,
+                calculator.heating_constant,
+                calculator.heating_constant_iqr,
+            ))
+            for calculator in calculators
+        ]
+        assert results[0] == results[1], f"tick {end}"
+        estimates += results[0][1] is not None
+    if ambient_history or strategy not in MEASURED_AMBIENT_STRATEGIES:
+        assert estimates > 0
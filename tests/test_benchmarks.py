@@ -0,0 +1,124 @@
+"""
+Hot-path benchmarks of the calculator and the coordinator (pytest-benchmark).
+
+The cases of scripts/benchmark_calculations.py (synthetic Newton-law curves of
+100 to 50,000 samples: clean, noise, ambient sensor, BBQ stall) run through
+the benchmark fixture, one test per case, with the tracemalloc peak in the
+extra info. Skipped unless --run-benchmarks is given:
+
+    python -m pytest tests/test_benchmarks.py --run-benchmarks --benchmark-autosave
+    python -m pytest tests/test_benchmarks.py --run-benchmarks --benchmark-compare --benchmark-compare-fail=mean:20%
+
+Saved runs go to .benchmarks/ (gitignored, machine specific).
+"""
+import functools
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmark_calculations import (  # noqa: E402
+    DEFAULT_SIZES,
+    VARIANTS,
+    calculator_cases,
+    coordinator_cases,
+)
+from _package import has_homeassistant  # noqa: E402
+
+from assistant_cooker.calculations import BACKEND_NUMPY, BACKEND_PYTHON, DEFAULT_BACKEND, np  # noqa: E402
+from assistant_cooker.const import DEFAULT_ESTIMATION_STRATEGY, ESTIMATION_STRATEGIES  # noqa: E402
+
+pytestmark = pytest.mark.benchmark
+
+BACKENDS = [BACKEND_PYTHON, BACKEND_NUMPY]
+# Kernel cases, run with each backend (name suffix "@<backend>" off the default one)
+KERNEL_CASES = [
+    "calculate_heating_rate",
+    "calculate_remaining_time",
+    "_estimate_ambient_from_curve",
+    "ConductionModel.ingest",
+    "ConductionModel.time_to",
+]
+# Cases of the default backend only
+DEFAULT_BACKEND_CASES = [
+    *(
+        f"calculate_remaining_time@{strategy}"
+        for strategy in ESTIMATION_STRATEGIES
+        if strategy != DEFAULT_ESTIMATION_STRATEGY
+    ),
+    "ShadowEvaluator.update",
+    "NewtonCurveFit.update",
+]
+COORDINATOR_CASES = ["_filter_readings", "_update_temp_history", "_build_data", "_build_data+metrics"]
+
+
+def _case_name(case: str, samples: int, variant: str) -> str:
+    """Return the script's name of a case ("stem[variant-samples]@suffix")."""
+    stem, _, suffix = case.partition("@")
+    return f"{stem}[{variant}-{samples}]" + (f"@{suffix}" if suffix else "")
+
+
+@functools.lru_cache(maxsize=4)
+def _calculator_cases(samples: int, variant: str, backend: str) -> dict:
+    """Return {name: callable} of the calculator cases (curves built once per size and variant)."""
+    return dict(calculator_cases(samples, variant, backend))
+
+
+@functools.lru_cache(maxsize=2)
+def _coordinator_cases(samples: int, variant: str) -> dict:
+    """Return {name: callable} of the coordinator cases."""
+    return dict(coordinator_cases(samples, variant))
+
+
+def _run(benchmark, func) -> None:
+    """Benchmark func and record its peak traced memory."""
+    benchmark(func)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_kib"] = round(peak / 1024, 1)
+
+
+def _pick(cases: dict, case: str, samples: int, variant: str):
+    """Return the callable of a case, skipping cases the variant does not have."""
+    func = cases.get(_case_name(case, samples, variant))
+    if func is None:
+        pytest.skip(f"{case} not run on the {variant} curve")  # Conduction needs the ambient
+    return func
+
+
+# The last parameters vary slowest: the cases of one curve run together and share the cache
+@pytest.mark.parametrize("case", KERNEL_CASES)
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("samples", DEFAULT_SIZES)
+def test_calculator_kernels(benchmark, case, backend, variant, samples):
+    """Benchmark a calculator case with one backend."""
+    if backend == BACKEND_NUMPY and np is None:
+        pytest.skip("NumPy not installed")
+    suffix = "" if backend == DEFAULT_BACKEND else f"@{backend}"
+    benchmark.group = _case_name(case, samples, variant)
+    func = _pick(_calculator_cases(samples, variant, backend), case + suffix, samples, variant)
+    _run(benchmark, func)
+
+
+@pytest.mark.parametrize("case", DEFAULT_BACKEND_CASES)
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("samples", DEFAULT_SIZES)
+def test_calculator_strategies(benchmark, case, variant, samples):
+    """Benchmark the other strategies, the shadow evaluation and the curve fit."""
+    benchmark.group = _case_name(case, samples, variant)
+    func = _pick(_calculator_cases(samples, variant, DEFAULT_BACKEND), case, samples, variant)
+    _run(benchmark, func)
+
+
+@pytest.mark.skipif(not has_homeassistant(), reason="Home Assistant not installed")
+@pytest.mark.parametrize("case", COORDINATOR_CASES)
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("samples", DEFAULT_SIZES)
+def test_coordinator(benchmark, case, variant, samples):
+    """Benchmark a coordinator tick stage against a stubbed hass.states."""
+    benchmark.group = _case_name(case, samples, variant)
+    _run(benchmark, _pick(_coordinator_cases(samples, variant), case, samples, variant))
@@ -0,0 +1,132 @@
+"""
+Round trips of the series codec (codec.py).
+
+The archive and the replay bundles store their traces with encode_series():
+every case decodes bit for bit, timestamps to the time resolution and values
+as IEEE doubles (lossless) or as their quantized value (default encoding).
+"""
+import math
+import random
+import struct
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from assistant_cooker.codec import (
+    SeriesEncoder,
+    decode_series,
+    encode_series,
+    iter_series,
+    quantize,
+    series_length,
+)
+
+START = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+_DOUBLE = struct.Struct(">d")
+_UINT64 = struct.Struct(">Q")
+
+
+def _from_bits(bits: int) -> float:
+    """Return the double with the given IEEE 754 bit pattern."""
+    return _DOUBLE.unpack(_UINT64.pack(bits))[0]
+
+
+def _bits(points):
+    """Return the points with every value as its IEEE 754 bit pattern."""
+    return [(timestamp, _UINT64.unpack(_DOUBLE.pack(value))[0]) for timestamp, value in points]
+
+
+def _round_trip(points, time_resolution_ms: int = 1, lossless: bool = True):
+    """Encode and decode points, checking the header count."""
+    data = encode_series(points, time_resolution_ms, lossless=lossless)
+    assert series_length(data) == len(points)
+    decoded = decode_series(data)
+    assert _bits(iter_series(data)) == _bits(decoded)
+    return decoded
+
+
+def _irregular(count: int, seed: int = 3):
+    """Return timestamps at millisecond resolution with irregular gaps (equal, jittered, long)."""
+    rng = random.Random(seed)
+    timestamps, current = [], START
+    for _ in range(count):
+        timestamps.append(current)
+        current += timedelta(milliseconds=rng.choice([0, 1, 999, 1000, 1001, 5000, 63_999, 3_600_000]))
+        current += timedelta(milliseconds=rng.randrange(0, 250))
+    return timestamps
+
+
+VALUE_CASES = {
+    "repeated": [21.5] * 50,
+    "negative": [-18.0, -17.984375, -0.5, -0.0, 0.0, -40.123456789, -1e-300, -273.15],
+    "nan": [
+        20.0, math.nan, 20.0, _from_bits(0x7FF8000000000001), _from_bits(0xFFF8000000000000),
+        math.inf, -math.inf, 20.0,
+    ],
+    "probe": [5.0 + 0.1 * i + 0.03 * math.sin(i) for i in range(200)],
+}
+
+
+def test_empty():
+    """Decode an empty series as no point."""
+    assert _round_trip([]) == []
+    assert _round_trip([], lossless=False) == []
+
+
+@pytest.mark.parametrize("timestamp", [START, datetime(1969, 12, 31, 23, 59, 59, 1000, tzinfo=timezone.utc)])
+def test_one_sample(timestamp):
+    """Decode a single point bit for bit (before the epoch too)."""
+    points = [(timestamp, 63.999)]
+    assert _bits(_round_trip(points)) == _bits(points)
+
+
+@pytest.mark.parametrize("case", VALUE_CASES)
+def test_lossless_values(case):
+    """Decode every value bit for bit (sign of zero and NaN payloads included) at irregular times."""
+    values = VALUE_CASES[case]
+    points = list(zip(_irregular(len(values)), values))
+    assert _bits(_round_trip(points)) == _bits(points)
+
+
+@pytest.mark.parametrize("case", VALUE_CASES)
+def test_quantized_values(case):
+    """Decode the default encoding as the quantized values, bit for bit."""
+    values = VALUE_CASES[case]
+    timestamps = _irregular(len(values))
+    decoded = _round_trip(list(zip(timestamps, values)), lossless=False)
+    assert _bits(decoded) == _bits([(timestamp, quantize(value)) for timestamp, value in zip(timestamps, values)])
+
+
+@pytest.mark.parametrize("time_resolution_ms", [1, 100, 1000])
+def test_irregular_timestamps(time_resolution_ms):
+    """Decode timestamps on the resolution exactly, with every delta-of-delta bucket."""
+    rng = random.Random(time_resolution_ms)
+    ticks, timestamps = 0, []
+    for gap in [0, 1, 2, 60, 61, 300, 5, 4000, 1, 1, 1_000_000, 7, 0, 0, 130]:
+        ticks += gap
+        timestamps.append(START + timedelta(milliseconds=ticks * time_resolution_ms))
+    points = [(timestamp, rng.uniform(-20, 250)) for timestamp in timestamps]
+    assert _bits(_round_trip(points, time_resolution_ms)) == _bits(points)
+
+
+def test_streaming_encoder():
+    """Encode the same bytes point by point as in one call."""
+    points = list(zip(_irregular(100), VALUE_CASES["probe"]))
+    encoder = SeriesEncoder(1, lossless=True)
+    for timestamp, value in points:
+        encoder.append(timestamp, value)
+    assert len(encoder) == len(points)
+    assert encoder.getvalue() == encode_series(points, 1, lossless=True)
+
+
+def test_rejects_backwards_time():
+    """Refuse timestamps going backwards."""
+    with pytest.raises(ValueError):
+        encode_series([(START, 1.0), (START - timedelta(milliseconds=1), 1.0)], 1)
+
+
+def test_rejects_truncated_data():
+    """Refuse a truncated bit stream."""
+    data = encode_series(list(zip(_irregular(20), VALUE_CASES["probe"])), 1, lossless=True)
+    with pytest.raises(ValueError):
+        decode_series(data[:-4])
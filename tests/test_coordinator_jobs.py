@@ -0,0 +1,110 @@
+"""
+Executor jobs of the coordinator and the replay bundle built from their results.
+
+_run_estimate and _run_conduction are static methods run in the executor:
+they are called here as plain functions, without a running Home Assistant.
+The calculator snapshot must be taken by the estimator job itself and only
+read back by replay_bundle(), which an executor job may be racing.
+"""
+import json
+import math
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from benchmark_calculations import _build_coordinator, _stub_hass  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from assistant_cooker.calculations import CookingCalculator  # noqa: E402
+from assistant_cooker.conduction import ConductionModel  # noqa: E402
+from assistant_cooker.const import CONDUCTION_PARAMETERS, ESTIMATION_STRATEGIES  # noqa: E402
+from assistant_cooker.coordinator import AssistantCookerCoordinator  # noqa: E402
+
+ESTIMATE_KEYS = {
+    "time", "remaining", "heating_rate", "heating_rate_stddev", "filtered_temperature", "strategy", "spread",
+    "heating_constant", "heating_constant_iqr", "fitted_ambient", "fit_rms", "ambient_trend",
+    "ambient_plateau", "segment_start", "duration_ms", "calculator",
+}
+CONDUCTION_KEYS = {"time", "ready", "remaining", "core_temp", "diffusivity", "duration_ms"}
+
+
+def _cook(minutes: float = 40.0, interval_seconds: float = 5.0):
+    """Return (probe history, ambient history) of an oven cook ending now."""
+    samples = int(minutes * 60 / interval_seconds)
+    start = dt_util.utcnow() - timedelta(seconds=(samples - 1) * interval_seconds)
+    temp_history, ambient_history = [], []
+    for i in range(samples):
+        timestamp = start + timedelta(seconds=i * interval_seconds)
+        temp = 160.0 - 155.0 * math.exp(-0.015 * i * interval_seconds / 60)
+        temp_history.append((timestamp, round(temp, 1)))
+        ambient_history.append((timestamp, 160.0 + 3 * math.sin(i / 20)))
+    return temp_history, ambient_history
+
+
+def _run_estimate(calculator, temp_history, ambient_history, prime: bool = False):
+    """Run the estimator job on the histories as the executor would."""
+    return AssistantCookerCoordinator._run_estimate(
+        calculator, list(temp_history) if prime else None, None, temp_history[-1][1], 70.0,
+        temp_history, ambient_history[-1][1], ambient_history,
+    )
+
+
+@pytest.mark.parametrize("strategy", ESTIMATION_STRATEGIES)
+def test_run_estimate_snapshot(strategy):
+    """Return the estimator outputs with a JSON-serializable snapshot of the calculator."""
+    temp_history, ambient_history = _cook()
+    calculator = CookingCalculator(strategy=strategy)
+    result = _run_estimate(calculator, temp_history, ambient_history, prime=True)
+
+    assert set(result) == ESTIMATE_KEYS
+    snapshot = result["calculator"]
+    assert snapshot["strategy"] == strategy
+    assert snapshot["last_estimate"] == calculator.diagnostics()["last_estimate"]
+    serialized = json.dumps(snapshot)
+
+    # The snapshot is a copy: the next job must not change what was stored
+    later_temps, later_ambient = _cook(minutes=41.0)
+    _run_estimate(calculator, later_temps, later_ambient)
+    assert json.dumps(snapshot) == serialized
+
+
+def test_run_conduction():
+    """Return the conduction outputs, without any calculator state."""
+    temp_history, ambient_history = _cook()
+    params = CONDUCTION_PARAMETERS["beef_roast"]
+    model = ConductionModel(params["geometry"], 0.06, params["diffusivity"], params["surface_ratio"])
+    result = AssistantCookerCoordinator._run_conduction(model, temp_history, ambient_history, 70.0)
+
+    assert set(result) == CONDUCTION_KEYS
+    assert result["time"] == temp_history[-1][0]
+
+
+def test_replay_bundle_before_first_estimate():
+    """Give only the calculator strategy and tuning until an estimate exists."""
+    coordinator = _build_coordinator(_stub_hass(), with_ambient=True)
+    bundle = coordinator.replay_bundle()
+
+    assert bundle["estimate"] is None
+    assert bundle["calculator"] == {
+        "strategy": coordinator._calculator.strategy, "tuning": coordinator._calculator.tuning(),
+    }
+    json.dumps(bundle)
+
+
+def test_replay_bundle_reads_stored_snapshot():
+    """Serialize the snapshot of the last estimate, not the live calculator."""
+    coordinator = _build_coordinator(_stub_hass(), with_ambient=True)
+    temp_history, ambient_history = _cook()
+    coordinator._estimate = _run_estimate(coordinator._calculator, temp_history, ambient_history, prime=True)
+    stored = coordinator._estimate["calculator"]
+
+    later_temps, later_ambient = _cook(minutes=41.0)
+    _run_estimate(coordinator._calculator, later_temps, later_ambient)  # A job running meanwhile
+    bundle = coordinator.replay_bundle()
+
+    assert bundle["calculator"] is stored
+    assert "calculator" not in bundle["estimate"]
+    assert set(bundle["estimate"]) == ESTIMATE_KEYS - {"calculator"}
+    json.dumps(bundle)
@@ -0,0 +1,36 @@
+"""
+Static check of the integration, the scripts and the tests with pyflakes.
+
+Undefined names, unused imports and the like fail the suite: a name error
+in code that only runs in an executor job is otherwise only seen as a
+logged warning.
+"""
+import io
+from pathlib import Path
+
+import pytest
+
+pyflakes_api = pytest.importorskip("pyflakes.api")
+pyflakes_reporter = pytest.importorskip("pyflakes.reporter")
+
+REPO_ROOT = Path(__file__).parent.parent
+CHECKED_DIRS = ["custom_components", "scripts", "tests"]
+SKIPPED_DIRS = {"temp", "__pycache__"}  # scripts/temp/ is gitignored scratch space
+
+
+def _sources() -> list[Path]:
+    """Return the Python files to check."""
+    return sorted(
+        path
+        for directory in CHECKED_DIRS
+        for path in (REPO_ROOT / directory).rglob("*.py")
+        if not SKIPPED_DIRS.intersection(path.relative_to(REPO_ROOT).parts)
+    )
+
+
+@pytest.mark.parametrize("path", _sources(), ids=lambda path: str(path.relative_to(REPO_ROOT)))
+def test_pyflakes(path):
+    """Report no pyflakes warning for the file."""
+    warnings, errors = io.StringIO(), io.StringIO()
+    count = pyflakes_api.checkPath(str(path), pyflakes_reporter.Reporter(warnings, errors))
+    assert count == 0, warnings.getvalue() + errors.getvalue()